@@ -0,0 +1,79 @@
+"""
+Shared measurement helpers of the benchmarks: the bundled fixture page, and the time and memory measurements.
+"""
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Tuple
+
+FIXTURE_PATH = Path(__file__).parent.parent / "tests" / "data" / "cars_category.html"
+MIN_SAMPLE_TIME = 0.02  # seconds
+
+
+def measure_batch_time(setup: Callable[[], Any], run: Callable[[Any], Any], run_count: int) -> float:
+    """Return the time (in seconds) of a batch of runs (excluding their setups, and with the garbage collector off)."""
+    values = [setup() for _ in range(run_count)]
+    gc.collect()
+    gc.disable()
+
+    try:
+        start = time.perf_counter()
+        for value in values:
+            run(value)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def measure_time(
+        setup: Callable[[], Any],
+        run: Callable[[Any], Any],
+        repeat: int,
+        min_sample_time: float = MIN_SAMPLE_TIME
+) -> float:
+    """
+    Return the best time (in seconds) of a run, out of `repeat` samples.
+
+    Each sample times a batch of runs (like `timeit`), sized so the sample lasts at least `min_sample_time`, which keeps
+    the timing of fast runs stable. Slow runs are sampled one at a time.
+
+    Args:
+        setup (Callable[[], Any]): Creates the input of each run (not measured).
+        run (Callable[[Any], Any]): The measured run, called with the result of a setup.
+        repeat (int): The number of timed samples.
+        min_sample_time (float): The minimal time (in seconds) of a sample.
+
+    Returns:
+        float: The best time (in seconds) of a single run.
+    """
+    run_count = 1
+    sample_time = measure_batch_time(setup, run, run_count)
+
+    while sample_time < min_sample_time:
+        run_count *= 2
+        sample_time = measure_batch_time(setup, run, run_count)
+
+    sample_times = [sample_time] + [measure_batch_time(setup, run, run_count) for _ in range(repeat - 1)]
+    return min(sample_times) / run_count
+
+
+def trace_memory(function: Callable[[], Any]) -> Tuple[Any, int, int]:
+    """Call a function, returning its result and its traced memory (in bytes): the retained memory and the peak."""
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        result = function()
+        memory, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, memory, peak
+
+
+def measure_peak_memory(setup: Callable[[], Any], run: Callable[[Any], Any]) -> int:
+    """Return the peak memory (in bytes) allocated by a run (beyond its setup)."""
+    value = setup()
+    _, _, peak = trace_memory(lambda: run(value))
+    return peak
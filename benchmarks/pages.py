@@ -0,0 +1,156 @@
+"""
+Generator of synthetic vehicles category pages of any size, for benchmarking the parsing and extraction at scale.
+
+The pages are created from the bundled cars fixture: its layout is kept, and its listings are repeated (with unique
+tokens and varied prices) in both the Next.js data and the vehicle cards, so the pages parse like real Yad2 pages.
+Each page of a generated search has its own tokens, and a pagination matching the search.
+
+Usage:
+    python -m benchmarks.pages OUTPUT_DIR [--listings N] [--pages N] [--seed N]
+"""
+import argparse
+import json
+import random
+from bs4 import BeautifulSoup, Comment
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from benchmarks.measure import FIXTURE_PATH
+from yad2_scraper.next_data import NextData
+from yad2_scraper.utils import find_all_html_tags_by_class_substring
+from yad2_scraper.vehicles.category import FEED_ITEM_CLASS_SUBSTRING
+from yad2_scraper.constants import NEXT_DATA_SCRIPT_ID
+
+TOKEN_ALPHABET = "0123456789abcdefghijklmnopqrstuvwxyz"
+TOKEN_LENGTH = 8
+MAX_LISTINGS_PER_PAGE = 1_000_000  # the tokens of each page are unique up to this count
+PRICE_VARIATION = 0.2  # the maximal ratio a listing price varies from its template listing
+
+_FEED_DATA_PLACEHOLDER = "__FEED_DATA__"
+_CARDS_PLACEHOLDER = "__CARDS__"
+
+
+def create_token(page_number: int, index: int) -> str:
+    """Create the unique token of a listing in a page (shaped like a Yad2 token, e.g. '0000lfls')."""
+    number = page_number * MAX_LISTINGS_PER_PAGE + index
+    token = ""
+
+    while number:
+        number, digit = divmod(number, len(TOKEN_ALPHABET))
+        token = TOKEN_ALPHABET[digit] + token
+
+    return token.rjust(TOKEN_LENGTH, "0")
+
+
+class PageTemplate:
+    """The layout and the listings of a real vehicles category page, from which synthetic pages are created."""
+
+    def __init__(self, html: bytes):
+        """Initialize the template, parsing the page and separating its listings from its layout."""
+        soup = BeautifulSoup(html, "html.parser")
+        script = soup.find("script", id=NEXT_DATA_SCRIPT_ID)
+        next_data = NextData(json.loads(script.string))
+
+        # the feed query lists the vehicles (by their listing type) and the pagination of the search
+        feed_query = next(query for query in next_data.queries if "pagination" in (query["state"].get("data") or {}))
+        self.feed_data: dict = feed_query["state"]["data"]
+        feed_query["state"]["data"] = _FEED_DATA_PLACEHOLDER
+
+        vehicles_by_token = {
+            vehicle.get("token"): (listing_type, vehicle)
+            for listing_type, vehicles in self.feed_data.items() if isinstance(vehicles, list) for vehicle in vehicles
+        }
+        cards = find_all_html_tags_by_class_substring(soup, "div", FEED_ITEM_CLASS_SUBSTRING)
+        self.cards = {card["data-testid"]: str(card) for card in cards}
+        # the listing type and the vehicle data of each card, in the order of the cards
+        self.listings: List[Tuple[str, dict]] = [
+            vehicles_by_token[token] for token in self.cards if token in vehicles_by_token
+        ]
+
+        if not self.listings:
+            raise ValueError("The template page has no vehicle listings with cards")
+
+        feed_list = cards[0].parent
+        for card in cards:
+            card.decompose()
+        feed_list.append(Comment(_CARDS_PLACEHOLDER))
+
+        script.string = _dump_script_json(next_data.json)
+        self.layout = str(soup)
+
+    @classmethod
+    def from_fixture(cls) -> "PageTemplate":
+        """Create a template from the bundled cars fixture."""
+        return cls(FIXTURE_PATH.read_bytes())
+
+    def create_page(self, listing_count: int, page_number: int = 1, total_pages: int = 1, seed: int = 0) -> bytes:
+        """
+        Create a synthetic page, repeating the listings of the template page.
+
+        Args:
+            listing_count (int): The number of listings in the page.
+            page_number (int): The number of the page in its search (the listing tokens are unique per page).
+            total_pages (int): The total number of pages in the search.
+            seed (int): The seed of the price variations (the same arguments always create the same page).
+
+        Returns:
+            bytes: The HTML of the page.
+        """
+        if not 0 <= listing_count < MAX_LISTINGS_PER_PAGE:
+            raise ValueError(f"listing_count must be below {MAX_LISTINGS_PER_PAGE}, but got {listing_count}")
+
+        rng = random.Random(f"{seed}-{page_number}")
+        feed_data = {key: [] if isinstance(value, list) else value for key, value in self.feed_data.items()}
+        cards = []
+
+        for index in range(listing_count):
+            listing_type, template_vehicle = self.listings[index % len(self.listings)]
+            template_token, template_price = template_vehicle["token"], template_vehicle.get("price")
+            token = create_token(page_number, index)
+            card = self.cards[template_token].replace(template_token, token)
+            vehicle = {**template_vehicle, "token": token}
+
+            if template_price:
+                price = int(round(template_price * rng.uniform(1 - PRICE_VARIATION, 1 + PRICE_VARIATION), -2))
+                vehicle["price"] = price
+                card = card.replace(f"{template_price:,}", f"{price:,}")
+
+            feed_data[listing_type].append(vehicle)
+            cards.append(card)
+
+        feed_data["pagination"] = {"pages": total_pages, "perPage": listing_count, "total": total_pages * listing_count}
+
+        html = self.layout.replace(f"<!--{_CARDS_PLACEHOLDER}-->", "".join(cards))
+        html = html.replace(f'"{_FEED_DATA_PLACEHOLDER}"', _dump_script_json(feed_data))
+        return html.encode()
+
+    def create_pages(self, page_count: int, listings_per_page: int, seed: int = 0) -> Iterator[bytes]:
+        """Create the synthetic pages of a search, in the order of their page numbers."""
+        for page_number in range(1, page_count + 1):
+            yield self.create_page(listings_per_page, page_number, page_count, seed)
+
+
+def _dump_script_json(obj) -> str:
+    """Serialize an object to JSON which is safe to embed in a script element."""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("output_dir", type=Path, help="the directory to write the pages to")
+    arg_parser.add_argument("--listings", type=int, default=400, help="number of listings per page (default: 400)")
+    arg_parser.add_argument("--pages", type=int, default=1, help="number of pages (default: 1)")
+    arg_parser.add_argument("--seed", type=int, default=0, help="seed of the price variations (default: 0)")
+    args = arg_parser.parse_args()
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    template = PageTemplate.from_fixture()
+
+    for page_number, html in enumerate(template.create_pages(args.pages, args.listings, args.seed), start=1):
+        path = args.output_dir / f"cars_page_{page_number}.html"
+        path.write_bytes(html)
+        print(f"Created: '{path}' ({len(html) / 1024:.0f} KB)")
+
+
+if __name__ == "__main__":
+    main()
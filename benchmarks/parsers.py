@@ -0,0 +1,63 @@
+"""
+Benchmark of the HTML parser options of `Yad2VehiclesCategory` against the bundled cars fixture.
+
+Measures the time and peak memory of parsing a page and extracting its vehicle tags, for each parser backend
+(html.parser / lxml / html5lib), with and without the restricted (feed items only) parse.
+
+Usage:
+    python -m benchmarks.parsers [--repeat N]
+"""
+import argparse
+import functools
+import importlib.util
+
+from benchmarks.measure import FIXTURE_PATH, measure_time, measure_peak_memory
+from yad2_scraper.vehicles import Yad2VehiclesCategory
+from yad2_scraper.vehicles.category import UNRESTRICTED_PARSERS
+
+PARSERS = ("html.parser", "lxml", "html5lib")
+
+
+def is_parser_installed(parser: str) -> bool:
+    """Check whether the module of a parser backend is installed."""
+    return parser == "html.parser" or importlib.util.find_spec(parser) is not None
+
+
+def parse_page(html: bytes, parser: str, restrict_parse: bool) -> int:
+    """Parse a page and extract its vehicle tags, returning the number of tags."""
+    category = Yad2VehiclesCategory(html=html, parser=parser, restrict_parse=restrict_parse)
+    return len(category.get_tags())
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--repeat", type=int, default=5, help="number of timed runs per option (default: 5)")
+    args = arg_parser.parse_args()
+
+    html = FIXTURE_PATH.read_bytes()
+    print(f"Page: {FIXTURE_PATH.name} ({len(html) / 1024:.0f} KB)")
+    print(f"{'parser':<12} {'restricted':<10} {'time (ms)':>10} {'peak memory (KB)':>17} {'tags':>5}")
+
+    for parser in PARSERS:
+        if not is_parser_installed(parser):
+            print(f"{parser:<12} (not installed)")
+            continue
+
+        for restrict_parse in (False, True):
+            if restrict_parse and parser in UNRESTRICTED_PARSERS:
+                print(f"{parser:<12} {str(restrict_parse):<10} (restriction unsupported)")
+                continue
+
+            run_parse = functools.partial(parse_page, parser=parser, restrict_parse=restrict_parse)
+            tags_count = parse_page(html, parser, restrict_parse)
+            parse_time = measure_time(lambda: html, run_parse, args.repeat)
+            peak_memory = measure_peak_memory(lambda: html, run_parse)
+
+            print(
+                f"{parser:<12} {str(restrict_parse):<10} {parse_time * 1000:>10.1f} "
+                f"{peak_memory / 1024:>17.0f} {tags_count:>5}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark of the memory of a Bloom filter seen-set against a plain `set` of listing tokens.
+
+Measures the memory of holding N synthetic tokens (shaped like Yad2 tokens), the time of adding them,
+and the measured false positive rate of the Bloom filter, for each error rate.
+
+Usage:
+    python -m benchmarks.seen_sets [--count N] [--error-rates RATE [RATE ...]]
+"""
+import argparse
+import functools
+import random
+import string
+from typing import List, Callable, Container, Tuple
+
+from benchmarks.measure import measure_time, trace_memory
+from yad2_scraper.bloom import BloomFilter
+
+TOKEN_ALPHABET = string.ascii_lowercase + string.digits
+TOKEN_LENGTH = 8
+FALSE_POSITIVE_SAMPLE_SIZE = 100_000
+
+
+def create_tokens(count: int, seed: int) -> List[str]:
+    """Create random tokens, shaped like Yad2 listing tokens (e.g. '8gdn3p98')."""
+    rng = random.Random(seed)
+    return ["".join(rng.choices(TOKEN_ALPHABET, k=TOKEN_LENGTH)) for _ in range(count)]
+
+
+def fill_seen_set(create_seen_set: Callable[[], Container[str]], tokens: List[str]) -> Container[str]:
+    """Create a seen-set holding the tokens."""
+    seen_set = create_seen_set()
+
+    for token in tokens:
+        seen_set.add(token)
+
+    return seen_set
+
+
+def measure_fill_time(create_seen_set: Callable[[], Container[str]], tokens: List[str]) -> float:
+    """Return the time (in seconds) of filling a seen-set with the tokens."""
+    return measure_time(lambda: tokens, functools.partial(fill_seen_set, create_seen_set), repeat=1)
+
+
+def measure_memory(create_seen_set: Callable[[], Container[str]], tokens: List[str]) -> Tuple[Container[str], int]:
+    """Return a seen-set holding the tokens, and its traced memory (in bytes)."""
+    seen_set, memory, _ = trace_memory(lambda: fill_seen_set(create_seen_set, tokens))
+    return seen_set, memory
+
+
+def measure_false_positive_rate(seen_set: Container[str], unseen_tokens: List[str]) -> float:
+    """Return the ratio of unseen tokens which the seen-set reports as seen."""
+    return sum(token in seen_set for token in unseen_tokens) / len(unseen_tokens)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--count", type=int, default=1_000_000, help="number of tokens (default: 1,000,000)")
+    arg_parser.add_argument(
+        "--error-rates", type=float, nargs="+", default=[0.01, 0.001, 0.0001],
+        help="Bloom filter error rates (default: 0.01 0.001 0.0001)"
+    )
+    args = arg_parser.parse_args()
+
+    tokens = create_tokens(args.count, seed=0)
+    unseen_tokens = list(set(create_tokens(FALSE_POSITIVE_SAMPLE_SIZE, seed=1)) - set(tokens))
+    # the token strings are allocated outside the measurement, a set only references them (but a real history has to
+    # keep them alive, so their memory is reported separately)
+    tokens_memory = sum(len(token) + 49 for token in tokens)
+
+    print(f"Tokens: {args.count:,} ({tokens_memory / 1024 ** 2:.1f} MB of token strings)")
+    print(f"{'seen-set':<24} {'memory (MB)':>12} {'fill time (s)':>14} {'false positives':>16}")
+
+    seen_set_factories = [("set", set)] + [
+        (f"BloomFilter({error_rate:g})", functools.partial(BloomFilter, args.count, error_rate))
+        for error_rate in args.error_rates
+    ]
+
+    for name, create_seen_set in seen_set_factories:
+        seen_set, memory = measure_memory(create_seen_set, tokens)
+        false_positive_rate = measure_false_positive_rate(seen_set, unseen_tokens)
+        del seen_set
+        fill_time = measure_fill_time(create_seen_set, tokens)
+        print(f"{name:<24} {memory / 1024 ** 2:>12.1f} {fill_time:>14.2f} {false_positive_rate:>16.4%}")
+
+
+if __name__ == "__main__":
+    main()
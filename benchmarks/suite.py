@@ -0,0 +1,230 @@
+"""
+Benchmark suite of the parsing and extraction steps of a vehicles page, against the bundled cars fixture (and
+synthetic pages scaled from it, see `benchmarks.pages`).
+
+Measures the best time (out of `--repeat` runs) and the peak memory of each benchmark, and compares them to the
+stored baselines, flagging the benchmarks which regressed beyond the tolerances (with a non-zero exit code).
+The baselines are machine-dependent: save them again (with `--save`) before comparing on a different machine.
+
+Usage:
+    python -m benchmarks.suite [--repeat N] [--scales SCALE [SCALE ...]] [--filter SUBSTRING] [--save]
+                               [--baselines PATH] [--time-tolerance RATIO] [--memory-tolerance RATIO]
+"""
+import argparse
+import inspect
+import io
+import json
+import platform
+import sys
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from benchmarks.pages import PageTemplate
+from benchmarks.measure import FIXTURE_PATH, measure_time, measure_peak_memory
+from yad2_scraper.vehicles import (
+    Yad2VehiclesCategory,
+    VehiclesQueryFilters,
+    OrderVehiclesBy,
+    VehicleData,
+    VehicleTag
+)
+
+DEFAULT_BASELINES_PATH = Path(__file__).parent / "baselines.json"
+DEFAULT_TIME_TOLERANCE = 0.5  # ratio above the baseline time (timings are noisy on shared machines)
+DEFAULT_MEMORY_TOLERANCE = 0.10  # ratio above the baseline peak memory
+MIN_MEMORY_REGRESSION = 1024  # bytes, so the tiny allocations of fast benchmarks are not flagged
+QUERY_PARAMS_PAGE_COUNT = 1000
+
+
+class Benchmark(NamedTuple):
+    """A benchmark: a setup (not measured) creating the input of each run, and the measured run."""
+    name: str
+    setup: Callable[[], Any]
+    run: Callable[[Any], Any]
+
+
+class Measurement(NamedTuple):
+    """The best time (in seconds) and the peak memory (in bytes) of a benchmark."""
+    time: float
+    peak_memory: int
+
+
+def get_property_names(cls: type) -> List[str]:
+    """Return the names of the (cached) properties of a class."""
+    return [name for name, value in inspect.getmembers(cls) if isinstance(value, (property, cached_property))]
+
+
+def access_properties(objects: list, property_names: List[str]):
+    """Access every property of every object."""
+    for obj in objects:
+        for property_name in property_names:
+            getattr(obj, property_name)
+
+
+def load_category(html_io: io.BytesIO) -> Yad2VehiclesCategory:
+    """Load a category from an HTML file-like object, and parse its HTML (which is otherwise parsed lazily)."""
+    category = Yad2VehiclesCategory.from_html_io(html_io)
+    category.soup  # noqa
+    return category
+
+
+def build_query_params(filters: VehiclesQueryFilters) -> List[dict]:
+    """Build the query parameters of each page of a crawl, as the crawler does."""
+    return [dict(filters.copy(update={"page": page})) for page in range(1, QUERY_PARAMS_PAGE_COUNT + 1)]
+
+
+def create_page_benchmarks(html: bytes) -> List[Benchmark]:
+    """Create the benchmarks of parsing a vehicles page and extracting its listings."""
+    def parsed_category() -> Yad2VehiclesCategory:
+        category = Yad2VehiclesCategory(html=html)
+        category.soup  # noqa
+        return category
+
+    vehicle_data_properties = get_property_names(VehicleData)
+    vehicle_tag_properties = get_property_names(VehicleTag)
+
+    return [
+        Benchmark("from_html_io", lambda: io.BytesIO(html), load_category),
+        Benchmark(
+            "load_next_data", lambda: Yad2VehiclesCategory(html=html), lambda category: category.load_next_data()
+        ),
+        Benchmark(
+            "get_data", lambda: Yad2VehiclesCategory(html=html).load_next_data(), lambda next_data: next_data.get_data()
+        ),
+        Benchmark("get_tags", parsed_category, lambda category: category.get_tags()),
+        Benchmark(
+            "vehicle_data_properties",
+            lambda: Yad2VehiclesCategory(html=html).load_next_data().get_data(),
+            lambda vehicles: access_properties(vehicles, vehicle_data_properties)
+        ),
+        Benchmark(
+            "vehicle_tag_properties",
+            lambda: parsed_category().get_tags(),
+            lambda tags: access_properties(tags, vehicle_tag_properties)
+        )
+    ]
+
+
+def create_benchmarks(html: bytes, scales: List[int]) -> List[Benchmark]:
+    """Create the benchmarks of the fixture page, of the synthetic pages of each scale, and of the query params."""
+    benchmarks = create_page_benchmarks(html)
+    template = PageTemplate(html)
+
+    for scale in scales:
+        if scale != 1:
+            scaled_html = template.create_page(len(template.listings) * scale)
+            scaled_benchmarks = create_page_benchmarks(scaled_html)
+            benchmarks.extend(benchmark._replace(name=f"{benchmark.name}[x{scale}]") for benchmark in scaled_benchmarks)
+
+    benchmarks.append(Benchmark(
+        "query_params",
+        lambda: VehiclesQueryFilters(order_by=OrderVehiclesBy.DATE, price_range=(50000, 150000)),
+        build_query_params
+    ))
+    return benchmarks
+
+
+def measure(benchmark: Benchmark, repeat: int) -> Measurement:
+    """Measure a benchmark (after a warm-up run, so lazy imports and caches are not measured)."""
+    benchmark.run(benchmark.setup())
+    return Measurement(
+        measure_time(benchmark.setup, benchmark.run, repeat), measure_peak_memory(benchmark.setup, benchmark.run)
+    )
+
+
+def load_baselines(path: Path) -> Dict[str, Measurement]:
+    """Load the stored baseline of each benchmark (none, if the baselines file does not exist)."""
+    if not path.exists():
+        return {}
+
+    baselines = json.loads(path.read_text())
+    return {name: Measurement(**measurement) for name, measurement in baselines["benchmarks"].items()}
+
+
+def save_baselines(path: Path, measurements: Dict[str, Measurement]):
+    """Store the measurements as the baselines, merged into the existing ones."""
+    baselines = load_baselines(path)
+    baselines.update(measurements)
+    path.write_text(json.dumps(
+        {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "benchmarks": {name: measurement._asdict() for name, measurement in sorted(baselines.items())}
+        },
+        indent=2
+    ) + "\n")
+
+
+def compare(
+        measurement: Measurement,
+        baseline: Optional[Measurement],
+        time_tolerance: float,
+        memory_tolerance: float
+) -> str:
+    """Compare a measurement to its baseline, returning the comparison status."""
+    if baseline is None:
+        return "no baseline"
+
+    regressions = []
+    if measurement.time > baseline.time * (1 + time_tolerance):
+        regressions.append(f"time +{measurement.time / baseline.time - 1:.0%}")
+    if measurement.peak_memory > max(baseline.peak_memory * (1 + memory_tolerance),
+                                     baseline.peak_memory + MIN_MEMORY_REGRESSION):
+        regressions.append(f"memory +{measurement.peak_memory / baseline.peak_memory - 1:.0%}")
+
+    if regressions:
+        return f"REGRESSED ({', '.join(regressions)})"
+
+    return f"ok ({measurement.time / baseline.time - 1:+.0%} time)"
+
+
+def main() -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--repeat", type=int, default=5, help="number of timed samples per benchmark (default: 5)")
+    arg_parser.add_argument(
+        "--scales", type=int, nargs="+", default=[1],
+        help="also benchmark synthetic pages with this many times the fixture listings (default: 1, the fixture only)"
+    )
+    arg_parser.add_argument("--filter", default="", help="run only the benchmarks containing the substring")
+    arg_parser.add_argument("--save", action="store_true", help="store the measurements as the new baselines")
+    arg_parser.add_argument("--baselines", type=Path, default=DEFAULT_BASELINES_PATH, help="the baselines file")
+    arg_parser.add_argument(
+        "--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE,
+        help=f"allowed time ratio above the baseline (default: {DEFAULT_TIME_TOLERANCE})"
+    )
+    arg_parser.add_argument(
+        "--memory-tolerance", type=float, default=DEFAULT_MEMORY_TOLERANCE,
+        help=f"allowed peak memory ratio above the baseline (default: {DEFAULT_MEMORY_TOLERANCE})"
+    )
+    args = arg_parser.parse_args()
+
+    html = FIXTURE_PATH.read_bytes()
+    baselines = load_baselines(args.baselines)
+    benchmarks = [benchmark for benchmark in create_benchmarks(html, args.scales) if args.filter in benchmark.name]
+    measurements = {}
+    regression_count = 0
+
+    print(f"Page: {FIXTURE_PATH.name} ({len(html) / 1024:.0f} KB), Python {platform.python_version()}")
+    print(f"{'benchmark':<28} {'time (ms)':>10} {'peak memory (KB)':>17}  status")
+
+    for benchmark in benchmarks:
+        measurement = measurements[benchmark.name] = measure(benchmark, args.repeat)
+        status = compare(measurement, baselines.get(benchmark.name), args.time_tolerance, args.memory_tolerance)
+        regression_count += status.startswith("REGRESSED")
+        print(
+            f"{benchmark.name:<28} {measurement.time * 1000:>10.3f} {measurement.peak_memory / 1024:>17.0f}  {status}"
+        )
+
+    if args.save:
+        save_baselines(args.baselines, measurements)
+        print(f"Saved the baselines to: '{args.baselines}'")
+    elif regression_count:
+        print(f"{regression_count} benchmarks regressed")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
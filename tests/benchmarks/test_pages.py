@@ -0,0 +1,70 @@
+import pytest
+
+from benchmarks.measure import FIXTURE_PATH
+from benchmarks.pages import PageTemplate, create_token, TOKEN_LENGTH
+from yad2_scraper.vehicles import Yad2VehiclesCategory
+
+LISTING_COUNT = 57  # not a multiple of the 40 fixture listings
+
+
+@pytest.fixture(scope="module")
+def template() -> PageTemplate:
+    return PageTemplate.from_fixture()
+
+
+def test_create_token():
+    assert create_token(0, 0) == "0" * TOKEN_LENGTH
+    assert len(create_token(999, 999_999)) == TOKEN_LENGTH
+    assert create_token(1, 0) != create_token(0, 1)
+
+
+def test_create_page(template):
+    category = Yad2VehiclesCategory(html=template.create_page(LISTING_COUNT, page_number=2, total_pages=3))
+    next_data = category.load_next_data()
+    vehicles = next_data.get_data()
+    tags = category.get_tags()
+
+    # like in real pages, the Next.js data is grouped by listing type, so it is not in the order of the cards
+    vehicle_prices = {vehicle.token: vehicle.price for vehicle in vehicles}
+    tag_prices = {tag.tag["data-testid"]: tag.price for tag in tags}
+
+    assert len(vehicles) == len(tags) == LISTING_COUNT
+    assert len(vehicle_prices) == LISTING_COUNT
+    assert vehicle_prices.keys() == tag_prices.keys()
+
+    # some fixture cards show another price (e.g. a monthly payment), so only their listing prices are compared
+    template_category = Yad2VehiclesCategory(html=FIXTURE_PATH.read_bytes())
+    template_tag_prices = {tag.tag["data-testid"]: tag.price for tag in template_category.get_tags()}
+    varied_count = 0
+
+    for index in range(LISTING_COUNT):
+        _, template_vehicle = template.listings[index % len(template.listings)]
+        token, template_price = create_token(2, index), template_vehicle["price"]
+
+        if template_price and template_price == template_tag_prices[template_vehicle["token"]]:
+            assert vehicle_prices[token] == tag_prices[token]
+            varied_count += vehicle_prices[token] != template_price
+
+    assert varied_count > LISTING_COUNT // 2
+    assert next_data.pagination == {"pages": 3, "perPage": LISTING_COUNT, "total": 3 * LISTING_COUNT}
+    assert next_data.total_pages == 3
+
+
+def test_create_page_is_deterministic(template):
+    assert template.create_page(LISTING_COUNT, seed=1) == template.create_page(LISTING_COUNT, seed=1)
+    assert template.create_page(LISTING_COUNT, seed=1) != template.create_page(LISTING_COUNT, seed=2)
+
+
+def test_create_pages_tokens_are_unique(template):
+    pages = list(template.create_pages(page_count=3, listings_per_page=LISTING_COUNT))
+    tokens = [
+        vehicle.token for page in pages for vehicle in Yad2VehiclesCategory(html=page).load_next_data().get_data()
+    ]
+
+    assert len(pages) == 3
+    assert len(tokens) == len(set(tokens)) == 3 * LISTING_COUNT
+
+
+def test_create_page_invalid_listing_count(template):
+    with pytest.raises(ValueError):
+        template.create_page(-1)
@@ -0,0 +1,11 @@
+import pytest
+
+from yad2_scraper.tracing import InMemoryTracer, set_tracer
+
+
+@pytest.fixture
+def tracer() -> InMemoryTracer:
+    tracer = InMemoryTracer()
+    set_tracer(tracer)
+    yield tracer
+    set_tracer(None)
@@ -4,6 +4,7 @@ from yad2_scraper import (
     get_default_scraper,
     fetch_category,
     fetch_vehicle_category,
+    crawl_vehicle_category,
     Yad2Scraper,
     Yad2Category, QueryFilters, OrderBy,
     Yad2VehiclesCategory, VehiclesQueryFilters, OrderVehiclesBy
@@ -125,3 +126,17 @@ def test_fetch_vehicle_category_without_params(
             Yad2VehiclesCategory,
             params=None
         )
+
+
+# Tests for crawl_vehicle_category
+def test_crawl_vehicle_category(mock_scraper):
+    with patch("yad2_scraper.get_default_scraper", return_value=mock_scraper), \
+            patch("yad2_scraper.Yad2VehiclesCrawler") as mock_crawler_type:
+        crawl_vehicle_category("cars", order_by=OrderVehiclesBy.DATE, max_pages=2)
+
+        mock_crawler_type.assert_called_once_with(mock_scraper)
+        mock_crawler_type.return_value.crawl.assert_called_once_with(
+            "cars",
+            params=VehiclesQueryFilters(order_by=OrderVehiclesBy.DATE),
+            max_pages=2
+        )
@@ -0,0 +1,255 @@
+import asyncio
+import pytest
+import respx
+import httpx
+import random
+from unittest.mock import patch
+
+from yad2_scraper.async_scraper import AsyncYad2Scraper
+from yad2_scraper.category import Yad2Category
+from yad2_scraper.rate_limit import RateLimiter
+from yad2_scraper.metrics import MetricsCollector
+from yad2_scraper.exceptions import AntiBotDetectedError, MaxRequestAttemptsExceededError, UnexpectedContentError
+from yad2_scraper.constants import ANTIBOT_CONTENT_IDENTIFIER, PAGE_CONTENT_IDENTIFIER
+
+
+@pytest.fixture
+def scraper():
+    return AsyncYad2Scraper(client=httpx.AsyncClient())
+
+
+@pytest.fixture
+def mock_http():
+    with respx.mock as mock:
+        yield mock
+
+
+def _create_success_response() -> httpx.Response:
+    return httpx.Response(status_code=200, content=PAGE_CONTENT_IDENTIFIER)
+
+
+def _assert_success_response(response: httpx.Response):
+    assert response.status_code == 200
+    assert response.content == PAGE_CONTENT_IDENTIFIER
+
+
+def test_get_request(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).return_value = _create_success_response()
+
+    response = asyncio.run(scraper.get(url))
+
+    _assert_success_response(response)
+
+
+def test_get_request_with_params(scraper, mock_http):
+    url = "https://example.com"
+    params = {"key": "value"}
+    mock_http.get(url, params=params).return_value = _create_success_response()
+
+    response = asyncio.run(scraper.get(url, params=params))
+
+    _assert_success_response(response)
+    assert b"key=value" in response.request.url.query
+
+
+def test_get_request_with_random_user_agent(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).return_value = _create_success_response()
+    scraper.set_user_agent("RandomUserAgent/1.0")
+
+    response = asyncio.run(scraper.get(url))
+
+    _assert_success_response(response)
+    assert response.request.headers["User-Agent"] != "RandomUserAgent/1.0"
+
+
+def test_get_request_with_wait_strategy(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).return_value = _create_success_response()
+
+    with patch("asyncio.sleep") as mock_sleep:
+        scraper.wait_strategy = lambda attempt: 1.5 * attempt
+        response = asyncio.run(scraper.get(url))
+        mock_sleep.assert_called_once_with(1.5)
+
+    _assert_success_response(response)
+
+
+def test_get_request_with_rate_limiter(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).return_value = _create_success_response()
+    scraper.rate_limiter = RateLimiter(rate=1, burst=1)
+
+    with patch.object(scraper.rate_limiter, "acquire_async") as mock_acquire_async:
+        asyncio.run(scraper.get(url))
+
+    mock_acquire_async.assert_awaited_once()
+
+
+def test_get_request_with_multiple_attempts(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).side_effect = [
+        httpx.RequestError("Request failed"),
+        httpx.RequestError("Request failed"),
+        _create_success_response()
+    ]
+    scraper.max_request_attempts = 3
+
+    response = asyncio.run(scraper.get(url))
+
+    _assert_success_response(response)
+
+
+def test_get_request_increments_counter(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).return_value = _create_success_response()
+    request_count = random.randint(1, 3)
+
+    async def send_requests():
+        return await asyncio.gather(*(scraper.get(url) for _ in range(request_count)))
+
+    for response in asyncio.run(send_requests()):
+        _assert_success_response(response)
+
+    assert scraper.request_count == request_count
+
+
+def test_get_request_respects_max_concurrent_requests(mock_http):
+    url = "https://example.com"
+    scraper = AsyncYad2Scraper(client=httpx.AsyncClient(), max_concurrent_requests=2)
+    in_flight = max_in_flight = 0
+
+    async def respond(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _create_success_response()
+
+    mock_http.get(url).side_effect = respond
+
+    async def send_requests():
+        return await asyncio.gather(*(scraper.get(url) for _ in range(6)))
+
+    responses = asyncio.run(send_requests())
+
+    assert len(responses) == 6
+    assert max_in_flight == 2
+
+
+@pytest.mark.parametrize("max_concurrent_requests", [0, -1, "invalid_type"])
+def test_invalid_max_concurrent_requests(max_concurrent_requests):
+    with pytest.raises(ValueError):
+        AsyncYad2Scraper(client=httpx.AsyncClient(), max_concurrent_requests=max_concurrent_requests)
+
+
+def test_get_request_http_status_error(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).return_value = httpx.Response(status_code=404, content=b"Not Found")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(scraper.get(url))
+
+
+def test_get_request_anti_bot_detected_error(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).return_value = httpx.Response(status_code=200, content=ANTIBOT_CONTENT_IDENTIFIER)
+
+    with pytest.raises(AntiBotDetectedError):
+        asyncio.run(scraper.get(url))
+
+
+def test_get_request_unexpected_content_error(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).return_value = httpx.Response(status_code=200, content=b"Invalid Content")
+
+    with pytest.raises(UnexpectedContentError):
+        asyncio.run(scraper.get(url))
+
+
+def test_get_request_max_attempts_exceeded_error(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).side_effect = httpx.RequestError("Request failed")
+    scraper.max_request_attempts = 3
+
+    with pytest.raises(MaxRequestAttemptsExceededError):
+        asyncio.run(scraper.get(url))
+
+
+def test_get_request_collects_metrics(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).side_effect = [
+        httpx.Response(status_code=200, content=ANTIBOT_CONTENT_IDENTIFIER),
+        _create_success_response()
+    ]
+    metrics = MetricsCollector()
+    scraper.hooks.append(metrics)
+    scraper.max_request_attempts = 2
+
+    response = asyncio.run(scraper.get(url))
+
+    _assert_success_response(response)
+    assert metrics.request_count == 1
+    assert metrics.get_attempts_per_request() == {2: 1}
+    assert metrics.status_codes == {200: 2}
+    assert metrics.retry_count == 1
+    assert metrics.antibot_count == 1
+    assert metrics.latency.count == 2
+
+
+def test_get_request_records_spans(scraper, mock_http, tracer):
+    url = "https://example.com"
+    mock_http.get(url).side_effect = [httpx.Response(status_code=503), _create_success_response()]
+    scraper.max_request_attempts = 2
+
+    asyncio.run(scraper.get(url))
+
+    first_send, second_send = tracer.get_spans("send_request")
+    assert second_send.attributes == {"method": "GET", "url": url, "attempt": 2}
+    assert first_send.error is second_send.error is None
+
+    first_validate, second_validate = tracer.get_spans("validate_response")
+    assert first_validate.error == "HTTPStatusError"
+    assert second_validate.error is None
+
+
+def test_get_request_spans_exclude_waiting(scraper, mock_http, tracer):
+    url = "https://example.com"
+    mock_http.get(url).return_value = _create_success_response()
+    scraper.rate_limiter = RateLimiter(rate=20, burst=1)
+    scraper.wait_strategy = lambda attempt: 0.05
+
+    async def get_pages():
+        for _ in range(3):
+            await scraper.get(url)
+
+    asyncio.run(get_pages())
+
+    summary = tracer.summarize()
+    assert summary["wait"].count == 3
+    assert summary["wait"].total >= 0.15
+    assert summary["send_request"].total < summary["wait"].total / 2
+
+
+def test_fetch_category(scraper, mock_http):
+    url = "http://example.com"
+    mock_http.get(url).mock(return_value=_create_success_response())
+
+    class MockYad2Category(Yad2Category):
+        @classmethod
+        def from_html_io(cls, response):
+            return "parsed_category"
+
+    result = asyncio.run(scraper.fetch_category(url, category_type=MockYad2Category))
+    assert result == "parsed_category"
+
+
+def test_context_manager(scraper):
+    async def use_scraper():
+        async with scraper:
+            pass
+
+    asyncio.run(use_scraper())
+    assert scraper.client.is_closed
@@ -0,0 +1,103 @@
+import pytest
+
+from yad2_scraper.bloom import BloomFilter
+
+
+def _create_tokens(count: int, prefix: str = "token") -> list:
+    return [f"{prefix}{i}" for i in range(count)]
+
+
+def test_add_and_contains():
+    bloom_filter = BloomFilter(capacity=1000)
+    tokens = _create_tokens(1000)
+
+    bloom_filter.update(tokens)
+
+    assert all(token in bloom_filter for token in tokens)
+    assert len(bloom_filter) == 1000
+
+
+def test_false_positive_rate():
+    bloom_filter = BloomFilter(capacity=5000, error_rate=0.01)
+    bloom_filter.update(_create_tokens(5000))
+
+    false_positives = sum(token in bloom_filter for token in _create_tokens(20000, prefix="other"))
+
+    assert false_positives / 20000 < 0.02
+
+
+def test_size_is_much_smaller_than_tokens():
+    bloom_filter = BloomFilter(capacity=100000, error_rate=0.001)
+    assert bloom_filter.size < 100000 * 2  # about 1.8 bytes per item
+    assert bloom_filter.hash_count == 10
+
+
+def test_persisted_filter(tmp_path):
+    path = tmp_path / "seen.bloom"
+    tokens = _create_tokens(500)
+
+    with BloomFilter(capacity=1000, path=path) as bloom_filter:
+        bloom_filter.update(tokens)
+
+    with BloomFilter.open(path) as bloom_filter:
+        assert len(bloom_filter) == 500
+        assert bloom_filter.capacity == 1000
+        assert all(token in bloom_filter for token in tokens)
+        assert "other" not in bloom_filter
+        bloom_filter.add("other")
+
+    with BloomFilter.open(path) as bloom_filter:
+        assert "other" in bloom_filter
+        assert len(bloom_filter) == 501
+
+
+def test_persisted_filter_matches_in_memory_filter(tmp_path):
+    in_memory_filter = BloomFilter(capacity=100)
+    in_memory_filter.add("token")
+
+    with BloomFilter(capacity=100, path=tmp_path / "seen.bloom") as persisted_filter:
+        persisted_filter.add("token")
+        assert persisted_filter.size == in_memory_filter.size
+        assert persisted_filter._bits[-persisted_filter.size:] == in_memory_filter._bits
+
+
+def test_create_does_not_overwrite_existing_file(tmp_path):
+    path = tmp_path / "seen.bloom"
+
+    with BloomFilter(capacity=100, path=path) as bloom_filter:
+        bloom_filter.add("token")
+
+    with pytest.raises(FileExistsError):
+        BloomFilter(capacity=100, path=path)
+
+    with BloomFilter.open(path) as bloom_filter:
+        assert "token" in bloom_filter
+
+    with BloomFilter(capacity=100, path=path, overwrite=True) as bloom_filter:
+        assert len(bloom_filter) == 0
+        assert "token" not in bloom_filter
+
+
+def test_open_or_create(tmp_path):
+    path = tmp_path / "seen.bloom"
+
+    with BloomFilter.open_or_create(path, capacity=100) as bloom_filter:
+        bloom_filter.add("token")
+
+    with BloomFilter.open_or_create(path, capacity=5000) as bloom_filter:
+        assert bloom_filter.capacity == 100
+        assert "token" in bloom_filter
+
+
+def test_open_invalid_file(tmp_path):
+    path = tmp_path / "invalid.bloom"
+    path.write_bytes(b"not a bloom filter, but long enough to contain a header")
+
+    with pytest.raises(ValueError):
+        BloomFilter.open(path)
+
+
+@pytest.mark.parametrize("capacity, error_rate", [(0, 0.01), (-1, 0.01), (100, 0), (100, 1)])
+def test_invalid_arguments(capacity, error_rate):
+    with pytest.raises(ValueError):
+        BloomFilter(capacity, error_rate)
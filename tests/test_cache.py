@@ -0,0 +1,116 @@
+import time
+import httpx
+import pytest
+
+from yad2_scraper.cache import ResponseCache, CachedResponse, normalize_query_params
+from yad2_scraper.query import QueryFilters, OrderBy
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with ResponseCache(tmp_path / "cache.sqlite", ttl=60) as cache:
+        yield cache
+
+
+def _create_cached_response(content: bytes = b"content", headers: list = None) -> CachedResponse:
+    return CachedResponse(200, headers or [], content, time.time())
+
+
+def test_normalize_query_params():
+    params = dict(QueryFilters(page=2, order_by=OrderBy.DATE))
+    assert normalize_query_params(params) == [("Order", "1"), ("page", "2")]
+    assert normalize_query_params({"b": 1, "a": None}) == [("b", "1")]
+    assert normalize_query_params(None) == []
+
+
+def test_make_key_is_normalized():
+    url = "https://example.com"
+    key = ResponseCache.make_key("GET", url, {"page": 1, "Order": OrderBy.DATE})
+    assert key == ResponseCache.make_key("get", url, {"Order": 1, "page": "1", "price": None})
+    assert key != ResponseCache.make_key("GET", url, {"page": 2, "Order": OrderBy.DATE})
+    assert key != ResponseCache.make_key("GET", url + "/other", {"page": 1, "Order": OrderBy.DATE})
+
+
+def test_set_and_get(cache):
+    cached_response = _create_cached_response(headers=[("etag", '"v1"')])
+    cache.set("key", cached_response)
+
+    assert cache.get("key") == cached_response
+    assert cache.get("missing_key") is None
+    assert len(cache) == 1
+
+
+def test_delete_and_clear(cache):
+    cache.set("key1", _create_cached_response())
+    cache.set("key2", _create_cached_response())
+
+    cache.delete("key1")
+    assert cache.get("key1") is None
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_persistence(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    cached_response = _create_cached_response()
+
+    with ResponseCache(path) as cache:
+        cache.set("key", cached_response)
+
+    with ResponseCache(path) as cache:
+        assert cache.get("key") == cached_response
+
+
+def test_lru_eviction(tmp_path):
+    with ResponseCache(tmp_path / "cache.sqlite", max_size=25) as cache:
+        cache.set("key1", _create_cached_response(b"x" * 10))
+        cache.set("key2", _create_cached_response(b"x" * 10))
+        cache.get("key1")  # key2 becomes the least recently used
+        cache.set("key3", _create_cached_response(b"x" * 10))
+
+        assert cache.get("key2") is None
+        assert cache.get("key1") is not None
+        assert cache.get("key3") is not None
+        assert cache.size == 20
+
+
+def test_cached_response_freshness():
+    cached_response = CachedResponse(200, [], b"", time.time() - 30)
+    assert cached_response.is_fresh(60)
+    assert not cached_response.is_fresh(10)
+
+
+def test_cached_response_validation_headers():
+    headers = [("etag", '"v1"'), ("last-modified", "Wed, 21 Oct 2015 07:28:00 GMT")]
+    cached_response = _create_cached_response(headers=headers)
+    assert cached_response.get_validation_headers() == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"
+    }
+    assert _create_cached_response().get_validation_headers() == {}
+
+
+def test_cached_response_revalidate():
+    cached_response = CachedResponse(200, [("etag", '"v1"'), ("x-old", "1")], b"content", 0)
+    revalidated = cached_response.revalidate(httpx.Headers({"ETag": '"v2"', "Content-Length": "0"}))
+
+    headers = httpx.Headers(revalidated.headers)
+    assert headers["etag"] == '"v2"'
+    assert headers["x-old"] == "1"
+    assert "content-length" not in headers
+    assert revalidated.content == b"content"
+    assert revalidated.is_fresh(60)
+
+
+def test_cached_response_from_response_drops_transfer_headers():
+    response = httpx.Response(200, headers={"Content-Encoding": "gzip", "ETag": '"v1"'}, content=b"")
+    cached_response = CachedResponse.from_response(response)
+    assert dict(cached_response.headers) == {"etag": '"v1"'}
+
+
+@pytest.mark.parametrize("ttl, max_size", [(-1, 100), (60, 0)])
+def test_invalid_arguments(tmp_path, ttl, max_size):
+    with pytest.raises(ValueError):
+        ResponseCache(tmp_path / "cache.sqlite", ttl=ttl, max_size=max_size)
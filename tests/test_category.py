@@ -1,4 +1,5 @@
 import io
+import pytest
 from bs4 import BeautifulSoup
 
 from yad2_scraper.category import Yad2Category, NextData
@@ -20,6 +21,28 @@ def test_from_html_io_with_bytesio():
     assert category.soup.find("div", id="test") is not None
 
 
+def test_soup_is_parsed_lazily():
+    category = Yad2Category.from_html_io(io.StringIO("<html><body><div class='item-tag'>Item</div></body></html>"))
+    assert not category.is_parsed
+
+    tags = category.find_all_tags_by_class_substring("div", "item-tag")
+
+    assert len(tags) == 1
+    assert category.is_parsed
+    assert category.soup is category.soup
+
+
+def test_parser_option():
+    category = Yad2Category.from_html_io(io.StringIO("<html></html>"), parser="html.parser")
+    assert category.parser == "html.parser"
+    assert Yad2Category(html="<html></html>").parser == Yad2Category.parser
+
+
+def test_init_without_soup_and_html():
+    with pytest.raises(ValueError):
+        Yad2Category()
+
+
 def test_load_next_data_with_valid_json():
     html_content = """
     <html><head><script id="__NEXT_DATA__">{"key": "value"}</script></head><body></body></html>
@@ -31,6 +54,32 @@ def test_load_next_data_with_valid_json():
     assert next_data.json == {"key": "value"}
 
 
+def test_load_next_data_from_raw_html():
+    html_content = b"""
+    <html><head><script id="__NEXT_DATA__" type="application/json">{"key": "value"}</script></head></html>
+    """
+    category = Yad2Category.from_html_io(io.BytesIO(html_content))
+    assert category.html == html_content
+
+    next_data = category.load_next_data()
+
+    assert next_data.json == {"key": "value"}
+    assert not category.is_parsed
+
+
+def test_load_next_data_from_raw_html_with_missing_tag():
+    category = Yad2Category.from_html_io(io.StringIO("<html><body></body></html>"))
+    assert category.load_next_data() is None
+
+
+def test_load_next_data_with_custom_json_loads():
+    class CustomJsonCategory(Yad2Category):
+        json_loads = staticmethod(lambda data: {"decoded": data})
+
+    category = CustomJsonCategory.from_html_io(io.BytesIO(b'<script id="__NEXT_DATA__">{}</script>'))
+    assert category.load_next_data().json == {"decoded": b"{}"}
+
+
 def test_load_next_data_with_missing_tag():
     html_content = "<html><body></body></html>"
     soup = BeautifulSoup(html_content, "html.parser")
@@ -66,4 +115,11 @@ def test_load_next_data_with_malformed_json():
     soup = BeautifulSoup(html_content, "html.parser")
     category = Yad2Category(soup)
     next_data = category.load_next_data()
-    assert next_data is None
\ No newline at end of file
+    assert next_data is None
+
+
+def test_class_index_is_built_once():
+    category = Yad2Category.from_html_io(io.StringIO('<div class="item-tag">Item</div>'))
+
+    assert category.class_index is category.class_index
+    assert category.find_all_tags_by_class_substring("div", "item") == category.class_index.find_all("div", "item")
@@ -0,0 +1,80 @@
+import pytest
+from bs4 import BeautifulSoup
+from pathlib import Path
+
+from yad2_scraper.class_index import ClassSubstringIndex
+from yad2_scraper.utils import find_html_tag_by_class_substring, find_all_html_tags_by_class_substring
+
+HTML = """
+<html>
+    <body class="page">
+        <div class="item-tag first">
+            <p class="item-title title">Title 1</p>
+            <div class="nested item-tag-inner"><p class="title">Nested</p></div>
+        </div>
+        <div class="other item-tag">
+            <p class="item-title">Title 2</p>
+        </div>
+        <div><p class="title special-title">Title 3</p></div>
+        <p>No class</p>
+    </body>
+</html>
+"""
+
+
+@pytest.fixture
+def soup():
+    return BeautifulSoup(HTML, "html.parser")
+
+
+@pytest.fixture
+def index(soup):
+    return ClassSubstringIndex(soup)
+
+
+@pytest.fixture(scope="module")
+def cars_category_soup():
+    html = (Path(__file__).parent / "data" / "cars_category.html").read_bytes()
+    return BeautifulSoup(html, "html.parser")
+
+
+@pytest.mark.parametrize("tag_name, substring", [
+    ("div", "item-tag"),
+    ("div", "tag"),
+    ("p", "title"),
+    ("p", "item"),
+    ("p", "special"),
+    ("body", "page"),
+    ("div", "missing"),
+    ("span", "title"),
+    ("p", ""),
+    ("div", "item-tag first"),
+    ("p", "title special")
+])
+def test_find_all_matches_document_search(soup, index, tag_name, substring):
+    expected_tags = find_all_html_tags_by_class_substring(soup, tag_name, substring)
+    assert index.find_all(tag_name, substring) == expected_tags
+    assert [id(tag) for tag in index.find_all(tag_name, substring)] == [id(tag) for tag in expected_tags]
+
+
+@pytest.mark.parametrize("tag_name, substring", [("p", "title"), ("div", "item-tag"), ("p", "missing")])
+def test_find_within_matches_subtree_search(soup, index, tag_name, substring):
+    for element in soup.find_all(True):
+        assert index.find(tag_name, substring, within=element) is \
+               find_html_tag_by_class_substring(element, tag_name, substring)
+        assert index.find_all(tag_name, substring, within=element) == \
+               find_all_html_tags_by_class_substring(element, tag_name, substring)
+
+
+def test_find_first(soup, index):
+    assert index.find("p", "title").text == "Title 1"
+    assert index.find("p", "missing") is None
+
+
+@pytest.mark.parametrize("substring", ["feedItemBox", "itemLink", "image", "heading", "price", "yearAndHand", "a"])
+def test_find_all_on_page(cars_category_soup, substring):
+    index = ClassSubstringIndex(cars_category_soup)
+
+    for tag_name in ("div", "a", "img", "span"):
+        expected_tags = find_all_html_tags_by_class_substring(cars_category_soup, tag_name, substring)
+        assert [id(tag) for tag in index.find_all(tag_name, substring)] == [id(tag) for tag in expected_tags]
@@ -0,0 +1,100 @@
+import io
+import json
+import pytest
+from unittest.mock import MagicMock
+
+from yad2_scraper.crawler import Yad2Crawler
+from yad2_scraper.scraper import Yad2Scraper
+from yad2_scraper.category import Yad2Category
+from yad2_scraper.query import QueryFilters, OrderBy
+
+
+def _create_category(total_pages: int) -> Yad2Category:
+    next_data = {
+        "props": {
+            "pageProps": {
+                "dehydratedState": {
+                    "queries": [{"state": {"data": {"pagination": {"pages": total_pages}}}}]
+                }
+            }
+        }
+    }
+    html = f'<html><script id="__NEXT_DATA__">{json.dumps(next_data)}</script></html>'
+    return Yad2Category.from_html_io(io.StringIO(html))
+
+
+@pytest.fixture
+def mock_scraper():
+    return MagicMock(spec=Yad2Scraper)
+
+
+def _fetched_page_numbers(mock_scraper) -> list:
+    return sorted(call.kwargs["params"].page for call in mock_scraper.fetch_category.call_args_list)
+
+
+def test_crawl_pages_fetches_all_pages(mock_scraper):
+    mock_scraper.fetch_category.return_value = _create_category(total_pages=5)
+    crawler = Yad2Crawler(mock_scraper, max_workers=3)
+
+    pages = list(crawler.crawl_pages("http://example.com", Yad2Category))
+
+    assert sorted(page_number for page_number, _ in pages) == [1, 2, 3, 4, 5]
+    assert _fetched_page_numbers(mock_scraper) == [1, 2, 3, 4, 5]
+
+
+def test_crawl_pages_keeps_query_filters(mock_scraper):
+    mock_scraper.fetch_category.return_value = _create_category(total_pages=2)
+    crawler = Yad2Crawler(mock_scraper)
+    params = QueryFilters(order_by=OrderBy.DATE, price_range=(1000, 5000))
+
+    list(crawler.crawl_pages("http://example.com", Yad2Category, params=params))
+
+    for call in mock_scraper.fetch_category.call_args_list:
+        assert call.kwargs["params"].order_by == OrderBy.DATE
+        assert call.kwargs["params"].price_range == (1000, 5000)
+    assert params.page is None
+
+
+def test_crawl_pages_starts_from_params_page(mock_scraper):
+    mock_scraper.fetch_category.return_value = _create_category(total_pages=5)
+    crawler = Yad2Crawler(mock_scraper)
+
+    list(crawler.crawl_pages("http://example.com", Yad2Category, params=QueryFilters(page=4)))
+
+    assert _fetched_page_numbers(mock_scraper) == [4, 5]
+
+
+def test_crawl_pages_with_max_pages(mock_scraper):
+    mock_scraper.fetch_category.return_value = _create_category(total_pages=50)
+    crawler = Yad2Crawler(mock_scraper)
+
+    list(crawler.crawl_pages("http://example.com", Yad2Category, max_pages=3))
+
+    assert _fetched_page_numbers(mock_scraper) == [1, 2, 3]
+
+
+def test_crawl_pages_without_next_data(mock_scraper):
+    mock_scraper.fetch_category.return_value = Yad2Category.from_html_io(io.StringIO("<html></html>"))
+    crawler = Yad2Crawler(mock_scraper)
+
+    pages = list(crawler.crawl_pages("http://example.com", Yad2Category))
+
+    assert [page_number for page_number, _ in pages] == [1]
+
+
+@pytest.mark.parametrize("max_workers", [0, -1, "invalid_type"])
+def test_invalid_max_workers(mock_scraper, max_workers):
+    with pytest.raises(ValueError):
+        Yad2Crawler(mock_scraper, max_workers=max_workers)
+
+
+def test_fetch_page_content(mock_scraper):
+    mock_scraper.get.return_value.content = b"<html></html>"
+    crawler = Yad2Crawler(mock_scraper)
+
+    content = crawler.fetch_page_content("http://example.com", QueryFilters(order_by=OrderBy.PRICE_LOWEST_TO_HIGHEST), 3)
+
+    assert content == b"<html></html>"
+    params = mock_scraper.get.call_args.kwargs["params"]
+    assert params.page == 3
+    assert params.order_by == OrderBy.PRICE_LOWEST_TO_HIGHEST
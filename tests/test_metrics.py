@@ -0,0 +1,90 @@
+import json
+import pytest
+import httpx
+
+from yad2_scraper.metrics import LatencyHistogram, MetricsCollector
+
+
+def test_latency_histogram_observe():
+    histogram = LatencyHistogram(buckets=(0.1, 1))
+
+    for latency in (0.05, 0.1, 0.5, 2):
+        histogram.observe(latency)
+
+    assert histogram.bucket_counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(2.65)
+    assert histogram.mean == pytest.approx(2.65 / 4)
+    assert histogram.max == 2
+
+
+def test_latency_histogram_quantile():
+    histogram = LatencyHistogram(buckets=(0.1, 1))
+    assert histogram.quantile(0.5) is None
+
+    for latency in (0.05, 0.05, 0.5, 3):
+        histogram.observe(latency)
+
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1
+    assert histogram.quantile(1) == 3
+
+
+def test_latency_histogram_to_dict():
+    histogram = LatencyHistogram(buckets=(0.1, 1))
+    histogram.observe(0.05)
+    histogram.observe(5)
+
+    assert histogram.to_dict() == {"count": 2, "sum": 5.05, "max": 5, "buckets": {"0.1": 1, "1": 1, "+Inf": 2}}
+
+
+@pytest.mark.parametrize("buckets", [(), (1, 0.5), (0, 1), (1, 1)])
+def test_latency_histogram_invalid_buckets(buckets):
+    with pytest.raises(ValueError):
+        LatencyHistogram(buckets)
+
+
+@pytest.mark.parametrize("q", [-0.1, 1.5])
+def test_latency_histogram_invalid_quantile(q):
+    with pytest.raises(ValueError):
+        LatencyHistogram().quantile(q)
+
+
+def test_metrics_collector_snapshot():
+    metrics = MetricsCollector(latency_buckets=(1,))
+    response = httpx.Response(status_code=200, content=b"content")
+
+    metrics.before_request("GET", "https://example.com", 1)
+    metrics.on_retry("GET", "https://example.com", 1, httpx.RequestError("Request failed"))
+    metrics.before_request("GET", "https://example.com", 2)
+    metrics.after_response(response, 2, 0.5)
+    metrics.on_antibot(response, 2)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot == {
+        "requests": 1,
+        "attempts": 2,
+        "attempts_per_request": {"2": 1},
+        "responses": 1,
+        "bytes_received": 7,
+        "status_codes": {"200": 1},
+        "retries": 1,
+        "antibot_detections": 1,
+        "latency": {"count": 1, "sum": 0.5, "max": 0.5, "buckets": {"1": 1, "+Inf": 1}}
+    }
+    assert json.loads(json.dumps(snapshot)) == snapshot
+    assert metrics.mean_attempts_per_request == 2
+
+
+def test_metrics_collector_reset():
+    metrics = MetricsCollector()
+    metrics.before_request("GET", "https://example.com", 1)
+    metrics.after_response(httpx.Response(status_code=200), 1, 0.1)
+
+    metrics.reset()
+
+    assert metrics.request_count == 0
+    assert metrics.status_codes == {}
+    assert metrics.latency.count == 0
+    assert metrics.mean_attempts_per_request is None
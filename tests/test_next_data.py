@@ -120,3 +120,26 @@ def test_getitem_invalid_key():
     next_data = NextData(data)
     with pytest.raises(KeyError):
         _ = next_data["nonexistent_key"]
+
+
+def test_pagination_property():
+    pagination = {"pages": 3, "perPage": 40, "total": 100}
+    data = {
+        "props": {
+            "pageProps": {
+                "dehydratedState": {
+                    "queries": [{"state": {"data": []}}, {"state": {"data": {"pagination": pagination}}}]
+                }
+            }
+        }
+    }
+    next_data = NextData(data)
+    assert next_data.pagination == pagination
+    assert next_data.total_pages == 3
+
+
+def test_pagination_property_missing():
+    data = {"props": {"pageProps": {"dehydratedState": {"queries": [{"state": {"data": {}}}]}}}}
+    next_data = NextData(data)
+    assert next_data.pagination is None
+    assert next_data.total_pages is None
@@ -0,0 +1,170 @@
+import asyncio
+import pytest
+import threading
+from unittest.mock import patch
+
+from yad2_scraper.rate_limit import RateLimiter, AdaptiveRateLimiter
+
+
+@pytest.fixture
+def mock_clock():
+    with patch("time.monotonic", return_value=100.0) as mock:
+        yield mock
+
+
+def test_burst_is_not_limited(mock_clock):
+    rate_limiter = RateLimiter(rate=2, burst=3)
+
+    with patch("time.sleep") as mock_sleep:
+        wait_times = [rate_limiter.acquire() for _ in range(3)]
+
+    assert wait_times == [0, 0, 0]
+    mock_sleep.assert_not_called()
+
+
+def test_waits_are_spaced_by_rate(mock_clock):
+    rate_limiter = RateLimiter(rate=2, burst=1)
+
+    with patch("time.sleep") as mock_sleep:
+        wait_times = [rate_limiter.acquire() for _ in range(4)]
+
+    assert wait_times == [0, 0.5, 1.0, 1.5]
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0, 1.5]
+
+
+def test_tokens_refill_over_time(mock_clock):
+    rate_limiter = RateLimiter(rate=2, burst=2)
+    rate_limiter.acquire()
+    rate_limiter.acquire()
+
+    mock_clock.return_value = 101.0  # refills 2 tokens
+
+    with patch("time.sleep") as mock_sleep:
+        assert rate_limiter.acquire() == 0
+        assert rate_limiter.acquire() == 0
+        assert rate_limiter.acquire() == 0.5
+        mock_sleep.assert_called_once_with(0.5)
+
+
+def test_tokens_refill_up_to_burst(mock_clock):
+    rate_limiter = RateLimiter(rate=10, burst=2)
+    mock_clock.return_value = 1000.0
+
+    with patch("time.sleep"):
+        wait_times = [rate_limiter.acquire() for _ in range(3)]
+
+    assert wait_times[:2] == [0, 0]
+    assert wait_times[2] == pytest.approx(0.1)
+
+
+def test_rate_change(mock_clock):
+    rate_limiter = RateLimiter(rate=1, burst=1)
+    rate_limiter.acquire()
+    rate_limiter.rate = 4
+
+    with patch("time.sleep"):
+        assert rate_limiter.acquire() == 0.25
+
+
+def test_acquire_async(mock_clock):
+    rate_limiter = RateLimiter(rate=4, burst=1)
+
+    async def acquire_all():
+        return await asyncio.gather(*(rate_limiter.acquire_async() for _ in range(3)))
+
+    with patch("asyncio.sleep") as mock_sleep:
+        wait_times = asyncio.run(acquire_all())
+
+    assert sorted(wait_times) == [0, 0.25, 0.5]
+    assert sorted(call.args[0] for call in mock_sleep.call_args_list) == [0.25, 0.5]
+
+
+def test_shared_between_threads(mock_clock):
+    rate_limiter = RateLimiter(rate=10, burst=1)
+    wait_times = []
+
+    def acquire():
+        wait_times.append(rate_limiter.acquire())
+
+    with patch("time.sleep"):
+        threads = [threading.Thread(target=acquire) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted(wait_times) == pytest.approx([0, 0.1, 0.2, 0.3, 0.4])
+
+
+@pytest.mark.parametrize("rate, burst", [(0, 1), (-1, 1), (1, 0)])
+def test_invalid_arguments(rate, burst):
+    with pytest.raises(ValueError):
+        RateLimiter(rate=rate, burst=burst)
+
+
+@pytest.fixture
+def adaptive_rate_limiter(mock_clock):
+    return AdaptiveRateLimiter(
+        rate=2,
+        min_rate=0.5,
+        max_rate=4,
+        increase_step=1,
+        decrease_factor=0.5,
+        decrease_cooldown=10
+    )
+
+
+def test_fixed_rate_limiter_ignores_feedback(mock_clock):
+    rate_limiter = RateLimiter(rate=2)
+    rate_limiter.record_success()
+    rate_limiter.record_throttle()
+    assert rate_limiter.rate == 2
+
+
+def test_adaptive_rate_limiter_additive_increase(adaptive_rate_limiter):
+    adaptive_rate_limiter.record_success()
+    assert adaptive_rate_limiter.rate == 2.5
+
+    for _ in range(100):
+        adaptive_rate_limiter.record_success()
+
+    assert adaptive_rate_limiter.rate == 4
+    assert adaptive_rate_limiter.success_count == 101
+
+
+def test_adaptive_rate_limiter_multiplicative_decrease(adaptive_rate_limiter, mock_clock):
+    adaptive_rate_limiter.record_throttle()
+    assert adaptive_rate_limiter.rate == 1
+
+    mock_clock.return_value += 10
+    adaptive_rate_limiter.record_throttle()
+    assert adaptive_rate_limiter.rate == 0.5
+
+    mock_clock.return_value += 10
+    adaptive_rate_limiter.record_throttle()
+    assert adaptive_rate_limiter.rate == 0.5
+    assert adaptive_rate_limiter.throttle_count == 3
+
+
+def test_adaptive_rate_limiter_decrease_cooldown(adaptive_rate_limiter, mock_clock):
+    adaptive_rate_limiter.record_throttle()
+    mock_clock.return_value += 5
+    adaptive_rate_limiter.record_throttle()
+
+    assert adaptive_rate_limiter.rate == 1
+    assert adaptive_rate_limiter.throttle_count == 2
+
+
+@pytest.mark.parametrize(
+    "rate, min_rate, max_rate, decrease_factor",
+    [
+        (1, 2, 3, 0.5),
+        (4, 2, 3, 0.5),
+        (1, 0, 3, 0.5),
+        (2, 1, 3, 1),
+        (2, 1, 3, 0),
+    ],
+)
+def test_adaptive_rate_limiter_invalid_arguments(rate, min_rate, max_rate, decrease_factor):
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(rate=rate, min_rate=min_rate, max_rate=max_rate, decrease_factor=decrease_factor)
@@ -4,7 +4,11 @@ import httpx
 import random
 from unittest.mock import patch
 
-from yad2_scraper.scraper import Yad2Scraper, Yad2Category
+from yad2_scraper.scraper import Yad2Scraper, Yad2Category, is_throttle_error
+from yad2_scraper.cache import ResponseCache
+from yad2_scraper.rate_limit import RateLimiter
+from yad2_scraper.hooks import RequestHooks
+from yad2_scraper.metrics import MetricsCollector
 from yad2_scraper.exceptions import AntiBotDetectedError, MaxRequestAttemptsExceededError, UnexpectedContentError
 from yad2_scraper.constants import ANTIBOT_CONTENT_IDENTIFIER, PAGE_CONTENT_IDENTIFIER
 
@@ -86,6 +90,63 @@ def test_get_request_with_wait_strategy(scraper, mock_http):
     _assert_success_response(response)
 
 
+def test_get_request_with_rate_limiter(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).return_value = _create_success_response()
+    scraper.rate_limiter = RateLimiter(rate=1, burst=1)
+
+    with patch.object(scraper.rate_limiter, "acquire") as mock_acquire:
+        scraper.get(url)
+        scraper.get(url)
+
+    assert mock_acquire.call_count == 2
+
+
+def test_get_request_reports_rate_feedback(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).side_effect = [
+        httpx.Response(status_code=200, content=ANTIBOT_CONTENT_IDENTIFIER),
+        httpx.Response(status_code=429),
+        httpx.RequestError("Request failed"),
+        _create_success_response()
+    ]
+    scraper.rate_limiter = RateLimiter(rate=1)
+    scraper.max_request_attempts = 4
+
+    with patch.object(scraper.rate_limiter, "acquire"), \
+            patch.object(scraper.rate_limiter, "record_throttle") as mock_record_throttle, \
+            patch.object(scraper.rate_limiter, "record_success") as mock_record_success:
+        scraper.get(url)
+
+    assert mock_record_throttle.call_count == 2
+    mock_record_success.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "status_code, expected",
+    [
+        (429, True),
+        (500, True),
+        (503, True),
+        (404, False),
+        (403, False),
+    ],
+)
+def test_is_throttle_error_status_codes(status_code, expected):
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(status_code=status_code, request=request)
+    error = httpx.HTTPStatusError("error", request=request, response=response)
+    assert is_throttle_error(error) == expected
+
+
+def test_is_throttle_error_other_errors():
+    request = httpx.Request("GET", "https://example.com")
+    response = httpx.Response(status_code=200, request=request)
+    assert is_throttle_error(AntiBotDetectedError("error", request=request, response=response))
+    assert not is_throttle_error(UnexpectedContentError("error", request=request, response=response))
+    assert not is_throttle_error(httpx.RequestError("error"))
+
+
 def test_get_request_with_multiple_attempts(scraper, mock_http):
     url = "https://example.com"
     mock_http.get(url).side_effect = [
@@ -100,6 +161,140 @@ def test_get_request_with_multiple_attempts(scraper, mock_http):
     _assert_success_response(response)
 
 
+class RecordingHooks(RequestHooks):
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, method, url, attempt):
+        self.calls.append(("before_request", attempt))
+
+    def after_response(self, response, attempt, elapsed):
+        assert elapsed >= 0
+        self.calls.append(("after_response", attempt, response.status_code))
+
+    def on_retry(self, method, url, attempt, error):
+        self.calls.append(("on_retry", attempt, type(error)))
+
+    def on_antibot(self, response, attempt):
+        self.calls.append(("on_antibot", attempt))
+
+
+def test_get_request_calls_hooks(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).side_effect = [
+        httpx.RequestError("Request failed"),
+        httpx.Response(status_code=200, content=ANTIBOT_CONTENT_IDENTIFIER),
+        _create_success_response()
+    ]
+    hooks = RecordingHooks()
+    scraper.hooks.append(hooks)
+    scraper.max_request_attempts = 3
+
+    scraper.get(url)
+
+    assert hooks.calls == [
+        ("before_request", 1),
+        ("on_retry", 1, httpx.RequestError),
+        ("before_request", 2),
+        ("after_response", 2, 200),
+        ("on_antibot", 2),
+        ("on_retry", 2, AntiBotDetectedError),
+        ("before_request", 3),
+        ("after_response", 3, 200)
+    ]
+
+
+def test_get_request_does_not_retry_after_last_attempt(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).side_effect = httpx.RequestError("Request failed")
+    hooks = RecordingHooks()
+    scraper.hooks.append(hooks)
+    scraper.max_request_attempts = 2
+
+    with pytest.raises(MaxRequestAttemptsExceededError):
+        scraper.get(url)
+
+    assert [call[0] for call in hooks.calls] == ["before_request", "on_retry", "before_request"]
+
+
+def test_get_request_ignores_hook_errors(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).return_value = _create_success_response()
+
+    class FailingHooks(RequestHooks):
+        def before_request(self, method, url, attempt):
+            raise RuntimeError("hook failed")
+
+    metrics = MetricsCollector()
+    scraper.hooks.extend([FailingHooks(), metrics])
+
+    _assert_success_response(scraper.get(url))
+    assert metrics.response_count == 1
+
+
+def test_get_request_collects_metrics(scraper, mock_http):
+    url = "https://example.com"
+    mock_http.get(url).side_effect = [
+        httpx.Response(status_code=503),
+        _create_success_response(),
+        httpx.Response(status_code=200, content=ANTIBOT_CONTENT_IDENTIFIER)
+    ]
+    metrics = MetricsCollector()
+    scraper.hooks.append(metrics)
+    scraper.max_request_attempts = 2
+
+    scraper.get(url)
+    scraper.max_request_attempts = 1
+    with pytest.raises(AntiBotDetectedError):
+        scraper.get(url)
+
+    assert metrics.request_count == 2
+    assert metrics.attempt_count == 3
+    assert metrics.get_attempts_per_request() == {1: 1, 2: 1}
+    assert metrics.status_codes == {503: 1, 200: 2}
+    assert metrics.bytes_received == len(PAGE_CONTENT_IDENTIFIER) + len(ANTIBOT_CONTENT_IDENTIFIER)
+    assert metrics.retry_count == 1
+    assert metrics.antibot_count == 1
+    assert metrics.latency.count == 3
+
+
+def test_get_request_records_spans(scraper, mock_http, tracer):
+    url = "https://example.com"
+    mock_http.get(url).side_effect = [
+        httpx.Response(status_code=200, content=ANTIBOT_CONTENT_IDENTIFIER),
+        _create_success_response()
+    ]
+    scraper.max_request_attempts = 2
+
+    scraper.get(url)
+
+    first_send, second_send = tracer.get_spans("send_request")
+    assert first_send.attributes == {"method": "GET", "url": url, "attempt": 1}
+    assert second_send.attributes["attempt"] == 2
+    assert first_send.error is second_send.error is None
+
+    first_validate, second_validate = tracer.get_spans("validate_response")
+    assert first_validate.error == "AntiBotDetectedError"
+    assert second_validate.attributes == {"status_code": 200}
+    assert first_validate.parent_id is second_validate.parent_id is None
+    assert not tracer.get_spans("wait")
+
+
+def test_get_request_spans_exclude_waiting(scraper, mock_http, tracer):
+    url = "https://example.com"
+    mock_http.get(url).return_value = _create_success_response()
+    scraper.rate_limiter = RateLimiter(rate=20, burst=1)
+    scraper.wait_strategy = lambda attempt: 0.05
+
+    for _ in range(3):
+        scraper.get(url)
+
+    summary = tracer.summarize()
+    assert summary["wait"].count == 3
+    assert summary["wait"].total >= 0.15
+    assert summary["send_request"].total < summary["wait"].total / 2
+
+
 def test_get_request_increments_counter(scraper, mock_http):
     url = "https://example.com"
     mock_http.get(url).return_value = _create_success_response()
@@ -184,6 +379,67 @@ def test_fetch_category(scraper, mock_http):
     assert result == "parsed_category"
 
 
+@pytest.fixture
+def cache(tmp_path):
+    with ResponseCache(tmp_path / "cache.sqlite", ttl=60) as cache:
+        yield cache
+
+
+def test_get_request_with_fresh_cached_response(scraper, mock_http, cache):
+    url = "https://example.com"
+    route = mock_http.get(url)
+    route.return_value = _create_success_response()
+    scraper.cache = cache
+
+    scraper.get(url, params={"page": 1})
+    response = scraper.get(url, params={"page": 1})
+
+    _assert_success_response(response)
+    assert route.call_count == 1
+    assert scraper.request_count == 1
+
+
+def test_get_request_with_different_params_is_not_cached(scraper, mock_http, cache):
+    url = "https://example.com"
+    route = mock_http.get(url)
+    route.return_value = _create_success_response()
+    scraper.cache = cache
+
+    scraper.get(url, params={"page": 1})
+    scraper.get(url, params={"page": 2})
+
+    assert route.call_count == 2
+
+
+def test_get_request_revalidates_stale_cached_response(scraper, mock_http, cache):
+    url = "https://example.com"
+    route = mock_http.get(url)
+    route.side_effect = [
+        httpx.Response(status_code=200, content=PAGE_CONTENT_IDENTIFIER, headers={"ETag": '"v1"'}),
+        httpx.Response(status_code=304, headers={"ETag": '"v1"'})
+    ]
+    scraper.cache = cache
+    cache.ttl = 0
+
+    scraper.get(url)
+    response = scraper.get(url)
+
+    _assert_success_response(response)
+    assert route.call_count == 2
+    assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+
+
+def test_get_request_does_not_cache_invalid_response(scraper, mock_http, cache):
+    url = "https://example.com"
+    mock_http.get(url).return_value = httpx.Response(status_code=200, content=ANTIBOT_CONTENT_IDENTIFIER)
+    scraper.cache = cache
+
+    with pytest.raises(AntiBotDetectedError):
+        scraper.get(url)
+
+    assert len(cache) == 0
+
+
 def test_set_user_agent(scraper):
     user_agent = "test_agent"
     scraper.set_user_agent(user_agent)
@@ -0,0 +1,121 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock, patch
+
+from yad2_scraper import tracing
+from yad2_scraper.tracing import Tracer, InMemoryTracer, OpenTelemetryTracer, get_tracer, set_tracer
+
+
+def test_default_tracer_does_nothing():
+    assert type(get_tracer()) is Tracer
+
+    with get_tracer().span("phase", attribute=1):
+        pass
+
+
+def test_set_tracer(tracer):
+    assert get_tracer() is tracer
+
+    set_tracer(None)
+    assert type(get_tracer()) is Tracer
+
+
+def test_in_memory_tracer_records_spans(tracer):
+    with tracer.span("outer", url="https://example.com"):
+        with tracer.span("inner"):
+            pass
+
+    inner, outer = tracer.spans
+    assert (outer.name, outer.parent_id, outer.attributes) == ("outer", None, {"url": "https://example.com"})
+    assert (inner.name, inner.parent_id, inner.attributes) == ("inner", outer.span_id, {})
+    assert outer.start_time <= inner.start_time
+    assert 0 <= inner.duration <= outer.duration
+    assert outer.error is None
+    assert tracer.get_spans("inner") == [inner]
+    assert tracer.get_spans(parent_id=outer.span_id) == [inner]
+
+
+def test_in_memory_tracer_records_errors(tracer):
+    with pytest.raises(ValueError):
+        with tracer.span("phase"):
+            raise ValueError("failed")
+
+    [span] = tracer.spans
+    assert span.error == "ValueError"
+
+    with tracer.span("next_phase"):
+        pass
+
+    assert tracer.get_spans("next_phase")[0].parent_id is None
+
+
+def test_in_memory_tracer_nests_spans_by_task(tracer):
+    async def run_phase(name: str):
+        with tracer.span(name):
+            await asyncio.sleep(0)
+            with tracer.span(f"{name}_inner"):
+                await asyncio.sleep(0)
+
+    async def run_phases():
+        await asyncio.gather(run_phase("first"), run_phase("second"))
+
+    asyncio.run(run_phases())
+
+    for name in ("first", "second"):
+        [outer] = tracer.get_spans(name)
+        [inner] = tracer.get_spans(f"{name}_inner")
+        assert outer.parent_id is None
+        assert inner.parent_id == outer.span_id
+
+
+def test_in_memory_tracer_max_spans():
+    tracer = InMemoryTracer(max_spans=2)
+
+    for name in ("first", "second", "third"):
+        with tracer.span(name):
+            pass
+
+    assert [span.name for span in tracer.spans] == ["second", "third"]
+
+
+def test_in_memory_tracer_summarize(tracer):
+    for _ in range(3):
+        with tracer.span("phase"):
+            pass
+
+    summary = tracer.summarize()["phase"]
+    assert summary.count == 3
+    assert summary.total == pytest.approx(sum(span.duration for span in tracer.spans))
+    assert summary.mean == pytest.approx(summary.total / 3)
+    assert summary.max == max(span.duration for span in tracer.spans)
+
+
+def test_in_memory_tracer_clear(tracer):
+    with tracer.span("phase"):
+        pass
+
+    tracer.clear()
+    assert tracer.spans == []
+    assert tracer.summarize() == {}
+
+
+def test_open_telemetry_tracer():
+    otel_tracer = MagicMock()
+    tracer = OpenTelemetryTracer(otel_tracer)
+
+    assert tracer.span("phase", attempt=1) is otel_tracer.start_as_current_span.return_value
+    otel_tracer.start_as_current_span.assert_called_once_with("phase", attributes={"attempt": 1})
+
+
+def test_open_telemetry_tracer_global_tracer():
+    with patch.object(tracing, "otel_trace") as mock_otel_trace:
+        tracer = OpenTelemetryTracer()
+
+    mock_otel_trace.get_tracer.assert_called_once_with("yad2_scraper")
+    assert tracer.tracer is mock_otel_trace.get_tracer.return_value
+
+
+def test_open_telemetry_tracer_not_installed():
+    with patch.object(tracing, "otel_trace", None):
+        with pytest.raises(ImportError, match="opentelemetry-api"):
+            OpenTelemetryTracer()
@@ -1,5 +1,7 @@
 import pytest
 from bs4 import BeautifulSoup
+from datetime import datetime
+from unittest.mock import patch
 
 from yad2_scraper.utils import (
     any_param_specified,
@@ -7,6 +9,9 @@ from yad2_scraper.utils import (
     get_parent_url,
     find_html_tag_by_class_substring,
     find_all_html_tags_by_class_substring,
+    find_next_data_script,
+    load_json,
+    dump_json,
     safe_access
 )
 
@@ -103,6 +108,83 @@ def test_find_all_html_tags_by_class_substring_no_match(soup):
     assert tags == []
 
 
+@pytest.mark.parametrize(
+    "html, expected",
+    [
+        ('<script id="__NEXT_DATA__" type="application/json">{"a": 1}</script>', b'{"a": 1}'),
+        (b'<script type="application/json" id="__NEXT_DATA__">{}</script>', b"{}"),
+        ("<SCRIPT id='__NEXT_DATA__'>[]</SCRIPT >", b"[]"),
+        ("<script id=__NEXT_DATA__>1</script>", b"1"),
+        ('<script>0</script><script id="__NEXT_DATA__">1</script><script>2</script>', b"1"),
+        ('<script id="__NEXT_DATA__"></script>', b""),
+    ],
+)
+def test_find_next_data_script(html, expected):
+    assert find_next_data_script(html) == expected
+
+
+@pytest.mark.parametrize(
+    "html",
+    [
+        "<html><body></body></html>",
+        '<script id="__NEXT_DATA_OTHER__">{}</script>',
+        '<script data-id="__NEXT_DATA__">{}</script>',
+        '<div id="__NEXT_DATA__">{}</div>',
+        '<script id="__NEXT_DATA__">{}',
+    ],
+)
+def test_find_next_data_script_not_found(html):
+    assert find_next_data_script(html) is None
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize("data", ['{"key": [1, 2.5, null, "value"]}', b'{"key": [1, 2.5, null, "value"]}'])
+def test_load_json(data, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+        assert load_json(data) == {"key": [1, 2.5, None, "value"]}
+    else:
+        with patch("yad2_scraper.utils.orjson", None):
+            assert load_json(data) == {"key": [1, 2.5, None, "value"]}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_json_invalid(use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+        with pytest.raises(ValueError):
+            load_json(b'{"key": ')
+    else:
+        with patch("yad2_scraper.utils.orjson", None), pytest.raises(ValueError):
+            load_json(b'{"key": ')
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_json(use_orjson):
+    obj = {"text": "טויוטה", "date": datetime(2025, 2, 14, 21, 30, 57), "values": [1, None]}
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+        data = dump_json(obj)
+    else:
+        with patch("yad2_scraper.utils.orjson", None):
+            data = dump_json(obj)
+
+    assert isinstance(data, bytes)
+    assert load_json(data) == {"text": "טויוטה", "date": "2025-02-14T21:30:57", "values": [1, None]}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_json_unsupported_type(use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+        with pytest.raises(TypeError):
+            dump_json(object())
+    else:
+        with patch("yad2_scraper.utils.orjson", None), pytest.raises(TypeError):
+            dump_json(object())
+
+
 @pytest.mark.parametrize(
     "to_call, exceptions, expected",
     [
@@ -1,4 +1,5 @@
 import io
+import pytest
 from yad2_scraper.vehicles.category import Yad2VehiclesCategory
 
 EXPECTED_VEHICLES_COUNT = 40
@@ -18,3 +19,53 @@ def test_load_next_data_no_data():
     empty_bytes_io = io.BytesIO()
     category = Yad2VehiclesCategory.from_html_io(empty_bytes_io)
     assert not category.load_next_data()
+
+
+def test_load_next_data_does_not_parse_html(cars_category):
+    category = Yad2VehiclesCategory(html=cars_category.html)
+    next_data = category.load_next_data()
+    assert len(next_data.get_data()) == EXPECTED_VEHICLES_COUNT
+    assert not category.is_parsed
+
+
+def test_parse_phases_record_spans(cars_category, tracer):
+    category = Yad2VehiclesCategory(html=cars_category.html)
+
+    category.load_next_data().get_data()
+    category.get_tags()
+
+    assert [span.name for span in tracer.spans] == ["load_next_data", "get_data", "parse_html", "get_tags"]
+    [parse_span] = tracer.get_spans("parse_html")
+    assert parse_span.parent_id == tracer.get_spans("get_tags")[0].span_id
+    assert parse_span.attributes == {"parser": category.parser}
+
+
+@pytest.mark.parametrize("parser, restrict_parse", [
+    ("html.parser", False),
+    ("html.parser", True),
+    ("lxml", False),
+    ("lxml", True),
+    ("html5lib", False)
+])
+def test_get_tags_with_parser_options(cars_category, cars_tags, parser, restrict_parse):
+    pytest.importorskip(parser.replace("html.parser", "html"))
+    category = Yad2VehiclesCategory(html=cars_category.html, parser=parser, restrict_parse=restrict_parse)
+
+    tags = category.get_tags()
+
+    assert len(tags) == EXPECTED_VEHICLES_COUNT
+    assert [tag.relative_link for tag in tags] == [tag.relative_link for tag in cars_tags]
+    assert [tag.price for tag in tags] == [tag.price for tag in cars_tags]
+
+
+def test_restrict_parse_only_parses_feed_items(cars_category):
+    category = Yad2VehiclesCategory.from_html_io(io.BytesIO(cars_category.html), restrict_parse=True)
+
+    assert category.soup.find("script") is None
+    assert len(category.soup.find_all("div", recursive=False)) == EXPECTED_VEHICLES_COUNT
+    assert len(category.load_next_data().get_data()) == EXPECTED_VEHICLES_COUNT
+
+
+def test_restrict_parse_unsupported_parser(cars_category):
+    with pytest.raises(ValueError, match="html5lib"):
+        Yad2VehiclesCategory(html=cars_category.html, parser="html5lib", restrict_parse=True)
@@ -0,0 +1,184 @@
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+from yad2_scraper.vehicles.columns import records_to_columns, ColumnsQuery, COLUMN_TYPES, DEFAULT_COLUMNS
+from yad2_scraper.vehicles.record import VehicleRecord
+
+numpy = pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module")
+def cars_columns(cars_next_data):
+    return cars_next_data.to_columns()
+
+
+def test_to_columns_default_fields(cars_next_data, cars_columns):
+    assert tuple(cars_columns) == DEFAULT_COLUMNS
+
+    for name, column in cars_columns.items():
+        assert isinstance(column, numpy.ma.MaskedArray)
+        assert column.dtype == numpy.dtype(COLUMN_TYPES[name][0])
+        assert len(column) == len(cars_next_data.get_records())
+
+
+@pytest.mark.parametrize("name", ["price", "km", "year_of_production", "hand", "engine_volume", "manufacturer_id"])
+def test_to_columns_matches_records(name, cars_next_data, cars_columns):
+    column = cars_columns[name]
+
+    for index, record in enumerate(cars_next_data.get_records()):
+        value = getattr(record, name)
+
+        if value is None:
+            assert column.mask[index]
+        else:
+            assert not column.mask[index]
+            assert column[index] == value
+
+
+def test_to_columns_dates(cars_next_data, cars_columns):
+    updated_at = [record.updated_at for record in cars_next_data.get_records()]
+    assert cars_columns["updated_at"].tolist() == updated_at
+
+
+def test_to_columns_selected_fields(cars_next_data):
+    columns = cars_next_data.to_columns(fields=["token", "price"])
+    assert list(columns) == ["token", "price"]
+
+
+def test_records_to_columns_masks_missing_values():
+    records = [
+        VehicleRecord.from_data({"token": "a", "price": 100, "dates": {"updatedAt": "2025-01-01T10:00:00"}}),
+        VehicleRecord.from_data({"token": "b", "specification": {"abs": True}})
+    ]
+
+    columns = records_to_columns(records, fields=["price", "has_abs", "updated_at", "token", "city"])
+
+    assert columns["price"].mask.tolist() == [False, True]
+    assert columns["price"].sum() == 100
+    assert columns["has_abs"].mask.tolist() == [True, False]
+    assert columns["updated_at"].mask.tolist() == [False, True]
+    assert columns["token"].tolist() == ["a", "b"]
+    assert columns["city"].mask.all()
+
+
+def test_records_to_columns_empty():
+    columns = records_to_columns([], fields=["price"])
+    assert len(columns["price"]) == 0
+
+
+def test_records_to_columns_unknown_field():
+    with pytest.raises(ValueError):
+        records_to_columns([], fields=["images"])
+
+
+def test_records_to_columns_without_numpy():
+    with patch("yad2_scraper.vehicles.columns.numpy", None):
+        with pytest.raises(ImportError):
+            records_to_columns([])
+
+
+@pytest.fixture
+def columns():
+    return {
+        "price": numpy.ma.MaskedArray([300, 100, 200, 100, 0], mask=[False, False, False, False, True]),
+        "hand": numpy.ma.MaskedArray([1, 2, 1, 3, 1], mask=[False] * 5),
+        "city": numpy.ma.MaskedArray(
+            numpy.array(["a", "b", "a", None, "c"], dtype=object), mask=[False, False, False, True, False]
+        ),
+        "has_abs": numpy.ma.MaskedArray([True, False, True, True, False], mask=[False, False, True, False, False]),
+        "updated_at": numpy.ma.MaskedArray(
+            numpy.array(["2025-01-01", "2025-01-03", "2025-01-02", "2025-01-05", "2025-01-04"], dtype="datetime64[s]")
+        )
+    }
+
+
+def _get_rows(query: ColumnsQuery):
+    return query.get_indexes().tolist()
+
+
+@pytest.mark.parametrize("op, value, expected_rows", [
+    ("==", 100, [1, 3]),
+    ("!=", 100, [0, 2]),
+    ("<", 200, [1, 3]),
+    ("<=", 200, [1, 2, 3]),
+    (">", 100, [0, 2]),
+    (">=", 300, [0])
+])
+def test_query_where(columns, op, value, expected_rows):
+    assert _get_rows(ColumnsQuery(columns).where("price", op, value)) == expected_rows
+
+
+def test_query_where_strings_skips_missing(columns):
+    assert _get_rows(ColumnsQuery(columns).where("city", "<", "b")) == [0, 2]
+
+
+def test_query_where_dates(columns):
+    assert _get_rows(ColumnsQuery(columns).where("updated_at", ">", datetime(2025, 1, 3))) == [3, 4]
+
+
+def test_query_chained_filters(columns):
+    query = ColumnsQuery(columns).between("price", (100, 300)).is_in("city", ["a", "b"]).where("hand", "==", 1)
+    assert _get_rows(query) == [0, 2]
+    assert query.count() == len(query) == 2
+
+
+def test_query_is_in_numbers(columns):
+    assert _get_rows(ColumnsQuery(columns).is_in("hand", [2, 3])) == [1, 3]
+
+
+def test_query_flags_and_nulls(columns):
+    query = ColumnsQuery(columns)
+    assert _get_rows(query.is_true("has_abs")) == [0, 3]
+    assert _get_rows(query.is_null("city")) == [3]
+    assert _get_rows(query.not_null("price")) == [0, 1, 2, 3]
+
+
+def test_query_is_immutable(columns):
+    query = ColumnsQuery(columns)
+    query.where("price", ">", 100)
+    assert len(query) == 5
+
+
+@pytest.mark.parametrize("descending, expected_rows", [(False, [1, 3, 2, 0, 4]), (True, [0, 2, 1, 3, 4])])
+def test_query_order_by(columns, descending, expected_rows):
+    assert _get_rows(ColumnsQuery(columns).order_by("price", descending=descending)) == expected_rows
+
+
+def test_query_order_by_strings(columns):
+    assert _get_rows(ColumnsQuery(columns).order_by("city", descending=True)) == [4, 1, 0, 2, 3]
+
+
+def test_query_head(columns):
+    query = ColumnsQuery(columns).order_by("updated_at", descending=True).head(2)
+    assert _get_rows(query) == [3, 4]
+    assert len(query) == 2
+
+
+def test_query_to_columns(columns):
+    selected = ColumnsQuery(columns).where("hand", "==", 1).order_by("price").to_columns(["price", "city"])
+
+    assert list(selected) == ["price", "city"]
+    assert selected["price"].tolist() == [200, 300, None]
+    assert selected["city"].tolist() == ["a", "a", "c"]
+
+
+def test_query_cars_columns(cars_columns):
+    query = ColumnsQuery(cars_columns).where("hand", "<=", 2).order_by("price", descending=True)
+    prices = query.to_columns(["price"])["price"].compressed()
+
+    assert len(query) > 0
+    assert (numpy.diff(prices) <= 0).all()
+
+
+def test_query_invalid_arguments(columns):
+    query = ColumnsQuery(columns)
+
+    with pytest.raises(ValueError):
+        query.where("price", "=~", 100)
+    with pytest.raises(ValueError):
+        query.where("km", "==", 100)
+    with pytest.raises(ValueError):
+        query.head(-1)
+    with pytest.raises(ValueError):
+        ColumnsQuery({"price": columns["price"], "km": numpy.ma.MaskedArray([1])})
@@ -0,0 +1,269 @@
+import io
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from yad2_scraper.scraper import Yad2Scraper
+from yad2_scraper.utils import load_json
+from yad2_scraper.bloom import BloomFilter
+from yad2_scraper.vehicles import Yad2VehiclesCrawler, VehiclesQueryFilters, OrderVehiclesBy, get_vehicle_category_url
+from yad2_scraper.vehicles.next_data import VehicleData
+from yad2_scraper.vehicles.record import VehicleRecord
+from yad2_scraper.vehicles.category import Yad2VehiclesCategory
+from yad2_scraper.vehicles.diff import ListingState
+from yad2_scraper.vehicles.store import VehicleStore
+
+EXPECTED_VEHICLES_PER_PAGE = 40
+
+
+@pytest.fixture
+def mock_scraper(cars_category):
+    mock = MagicMock(spec=Yad2Scraper)
+    mock.fetch_category.return_value = cars_category
+    return mock
+
+
+def test_cars_total_pages(cars_next_data):
+    assert cars_next_data.total_pages == 1616
+
+
+def test_crawl_yields_vehicle_data(mock_scraper):
+    crawler = Yad2VehiclesCrawler(mock_scraper, deduplicate=False)
+    params = VehiclesQueryFilters(order_by=OrderVehiclesBy.DATE)
+
+    vehicles = list(crawler.crawl("cars", params=params, max_pages=3))
+
+    assert len(vehicles) == 3 * EXPECTED_VEHICLES_PER_PAGE
+    assert all(isinstance(vehicle, VehicleData) for vehicle in vehicles)
+
+    for call in mock_scraper.fetch_category.call_args_list:
+        assert call.args[0] == get_vehicle_category_url("cars")
+        assert call.kwargs["params"].order_by == OrderVehiclesBy.DATE
+
+
+def test_crawl_records(mock_scraper):
+    crawler = Yad2VehiclesCrawler(mock_scraper, deduplicate=False)
+
+    records = list(crawler.crawl_records("cars", max_pages=2))
+
+    assert len(records) == 2 * EXPECTED_VEHICLES_PER_PAGE
+    assert all(isinstance(record, VehicleRecord) for record in records)
+
+
+def test_crawl_columns(mock_scraper):
+    pytest.importorskip("numpy")
+    crawler = Yad2VehiclesCrawler(mock_scraper, deduplicate=False)
+
+    columns = crawler.crawl_columns("cars", max_pages=2, fields=["price", "year_of_production"])
+
+    assert set(columns) == {"price", "year_of_production"}
+    assert len(columns["price"]) == 2 * EXPECTED_VEHICLES_PER_PAGE
+
+
+def _create_vehicles_html(tokens: list, total_pages: int, total: int = None) -> str:
+    vehicles = [{"token": token, "dates": {"updatedAt": "2025-02-14T21:30:57"}} for token in tokens]
+    data = {"private": vehicles, "pagination": {"pages": total_pages, "total": total}}
+    next_data = {"props": {"pageProps": {"dehydratedState": {"queries": [{"state": {"data": data}}]}}}}
+    return f'<html><script id="__NEXT_DATA__">{json.dumps(next_data)}</script></html>'
+
+
+def _create_vehicles_page(tokens: list, total_pages: int, total: int = None) -> Yad2VehiclesCategory:
+    return Yad2VehiclesCategory.from_html_io(io.StringIO(_create_vehicles_html(tokens, total_pages, total)))
+
+
+@pytest.fixture
+def paged_scraper():
+    pages = {
+        1: ["a1", "a2", "a3", "a4"],
+        2: ["b1", "b2", "b3", "b4"],
+        3: ["c1", "c2", "c3", "c4"],
+        4: ["d1", "d2", "d3", "d4"]
+    }
+    mock = MagicMock(spec=Yad2Scraper)
+    mock.fetch_category.side_effect = lambda url, category_type, params: _create_vehicles_page(
+        pages[params.page], total_pages=len(pages)
+    )
+    return mock
+
+
+def _fetched_pages(mock_scraper) -> list:
+    return [call.kwargs["params"].page for call in mock_scraper.fetch_category.call_args_list]
+
+
+def test_crawl_new_stops_at_known_page(paged_scraper):
+    crawler = Yad2VehiclesCrawler(paged_scraper)
+    seen = {"b2", "b3", "b4", "c1", "c2", "c3", "c4"}
+
+    vehicles = list(crawler.crawl_new("cars", seen, known_ratio=0.75))
+
+    assert [vehicle.token for vehicle in vehicles] == ["a1", "a2", "a3", "a4", "b1"]
+    assert _fetched_pages(paged_scraper) == [1, 2]
+    assert paged_scraper.fetch_category.call_args.kwargs["params"].order_by == OrderVehiclesBy.DATE
+
+
+def test_crawl_new_requires_entirely_known_page(paged_scraper):
+    crawler = Yad2VehiclesCrawler(paged_scraper)
+
+    vehicles = list(crawler.crawl_new("cars", {"b2", "b3", "b4", "c1", "c2", "c3", "c4"}, known_ratio=1))
+
+    assert [vehicle.token for vehicle in vehicles] == ["a1", "a2", "a3", "a4", "b1"]
+    assert _fetched_pages(paged_scraper) == [1, 2, 3]
+
+
+def test_crawl_new_crawls_all_pages_when_nothing_is_known(paged_scraper):
+    crawler = Yad2VehiclesCrawler(paged_scraper)
+
+    vehicles = list(crawler.crawl_new("cars", set(), max_pages=3))
+
+    assert len(vehicles) == 12
+    assert _fetched_pages(paged_scraper) == [1, 2, 3]
+
+
+def test_crawl_new_decodes_each_page_once(paged_scraper):
+    crawler = Yad2VehiclesCrawler(paged_scraper)
+
+    with patch.object(Yad2VehiclesCategory, "json_loads", side_effect=load_json) as mock_json_loads:
+        list(crawler.crawl_new("cars", set(), max_pages=3))
+
+    assert mock_json_loads.call_count == len(_fetched_pages(paged_scraper)) == 3
+
+
+def test_crawl_new_with_snapshot_yields_updated_vehicles(paged_scraper):
+    crawler = Yad2VehiclesCrawler(paged_scraper)
+    unchanged_state = ListingState(datetime(2025, 2, 14, 21, 30, 57), None)
+    snapshot = {token: unchanged_state for token in ["a1", "a2", "a3", "a4"]}
+    snapshot["a2"] = ListingState(datetime(2025, 1, 1), None)
+
+    vehicles = list(crawler.crawl_new("cars", snapshot, known_ratio=0.75))
+
+    assert [vehicle.token for vehicle in vehicles] == ["a2"]
+    assert _fetched_pages(paged_scraper) == [1]
+
+
+def test_crawl_new_with_store(paged_scraper, tmp_path):
+    crawler = Yad2VehiclesCrawler(paged_scraper)
+
+    with VehicleStore(tmp_path / "vehicles.sqlite") as store:
+        store.upsert(crawler.crawl_new("cars", store, max_pages=2))
+        assert len(store) == 8
+
+        vehicles = list(crawler.crawl_new("cars", store))
+
+    assert vehicles == []
+    assert _fetched_pages(paged_scraper)[-1] == 1
+
+
+@pytest.mark.parametrize("known_ratio", [0, 1.5])
+def test_crawl_new_invalid_known_ratio(mock_scraper, known_ratio):
+    with pytest.raises(ValueError):
+        list(Yad2VehiclesCrawler(mock_scraper).crawl_new("cars", set(), known_ratio=known_ratio))
+
+
+def test_crawl_deduplicates_tokens(mock_scraper):
+    crawler = Yad2VehiclesCrawler(mock_scraper)
+
+    vehicles = list(crawler.crawl("cars", max_pages=3))
+
+    assert len(vehicles) == EXPECTED_VEHICLES_PER_PAGE
+    assert len({vehicle.token for vehicle in vehicles}) == EXPECTED_VEHICLES_PER_PAGE
+    assert mock_scraper.fetch_category.call_count == 3
+
+
+@pytest.fixture
+def drifting_scraper():
+    # the listings shift down while the first crawl is running (a new listing was posted), and are stable afterwards
+    first_fetch_pages = {1: (["a1", "a2", "a3", "a4"], 12), 2: (["a4", "b1", "b2", "b3"], 13), 3: (["b4", "c1"], 13)}
+    next_fetch_pages = {1: (["n1", "a1", "a2", "a3"], 13), 2: (["a4", "b1", "b2", "b3"], 13), 3: (["b4", "c1"], 13)}
+    fetched_pages = set()
+
+    def fetch_html(params):
+        pages = next_fetch_pages if params.page in fetched_pages else first_fetch_pages
+        fetched_pages.add(params.page)
+        tokens, total = pages[params.page]
+        return _create_vehicles_html(tokens, total_pages=3, total=total)
+
+    mock = MagicMock(spec=Yad2Scraper)
+    mock.fetch_category.side_effect = lambda url, category_type, params: Yad2VehiclesCategory(html=fetch_html(params))
+    mock.get.side_effect = lambda url, params: MagicMock(content=fetch_html(params).encode())
+    return mock
+
+
+def test_crawl_drift_without_refetch(drifting_scraper):
+    crawler = Yad2VehiclesCrawler(drifting_scraper)
+
+    tokens = [vehicle.token for vehicle in crawler.crawl("cars")]
+
+    assert sorted(tokens) == ["a1", "a2", "a3", "a4", "b1", "b2", "b3", "b4", "c1"]
+    assert drifting_scraper.fetch_category.call_count == 3
+
+
+def test_crawl_drift_with_refetch(drifting_scraper):
+    crawler = Yad2VehiclesCrawler(drifting_scraper, refetch_on_drift=True)
+
+    tokens = [vehicle.token for vehicle in crawler.crawl("cars")]
+
+    assert sorted(tokens) == ["a1", "a2", "a3", "a4", "b1", "b2", "b3", "b4", "c1", "n1"]
+    assert sorted(_fetched_pages(drifting_scraper)) == [1, 1, 2, 2, 3, 3]
+
+
+def test_refetch_on_drift_requires_deduplicate(mock_scraper):
+    with pytest.raises(ValueError):
+        Yad2VehiclesCrawler(mock_scraper, deduplicate=False, refetch_on_drift=True)
+
+
+def test_crawl_new_with_bloom_filter(paged_scraper):
+    crawler = Yad2VehiclesCrawler(paged_scraper)
+    seen = BloomFilter(capacity=100)
+    seen.update(["a1", "a2", "a3", "a4"])
+
+    vehicles = list(crawler.crawl_new("cars", seen))
+
+    assert vehicles == []
+    assert _fetched_pages(paged_scraper) == [1]
+
+
+def test_crawl_deduplicates_with_bloom_filter(mock_scraper):
+    crawler = Yad2VehiclesCrawler(mock_scraper, seen_tokens_factory=lambda: BloomFilter(capacity=1000))
+    assert len(list(crawler.crawl("cars", max_pages=3))) == EXPECTED_VEHICLES_PER_PAGE
+
+
+@pytest.fixture
+def content_scraper(cars_category):
+    mock = MagicMock(spec=Yad2Scraper)
+    mock.get.return_value.content = cars_category.html
+    return mock
+
+
+def test_crawl_records_with_parse_processes(content_scraper, cars_next_data):
+    crawler = Yad2VehiclesCrawler(content_scraper, parse_processes=2)
+
+    records = list(crawler.crawl_records("cars", max_pages=3))
+
+    assert records == cars_next_data.get_records()
+    assert [call.kwargs["params"].page for call in content_scraper.get.call_args_list] == [1, 2, 3]
+    content_scraper.fetch_category.assert_not_called()
+
+
+def test_crawl_columns_with_parse_processes(content_scraper):
+    pytest.importorskip("numpy")
+    crawler = Yad2VehiclesCrawler(content_scraper, deduplicate=False, parse_processes=2)
+
+    columns = crawler.crawl_columns("cars", max_pages=2, fields=["price"])
+
+    assert len(columns["price"]) == 2 * EXPECTED_VEHICLES_PER_PAGE
+
+
+def test_crawl_records_drift_with_parse_processes(drifting_scraper):
+    crawler = Yad2VehiclesCrawler(drifting_scraper, refetch_on_drift=True, parse_processes=2)
+
+    tokens = [record.token for record in crawler.crawl_records("cars")]
+
+    assert sorted(tokens) == ["a1", "a2", "a3", "a4", "b1", "b2", "b3", "b4", "c1", "n1"]
+    assert sorted(call.kwargs["params"].page for call in drifting_scraper.get.call_args_list) == [1, 1, 2, 2, 3, 3]
+
+
+@pytest.mark.parametrize("parse_processes", [0, -1, 1.5])
+def test_crawler_invalid_parse_processes(mock_scraper, parse_processes):
+    with pytest.raises(ValueError):
+        Yad2VehiclesCrawler(mock_scraper, parse_processes=parse_processes)
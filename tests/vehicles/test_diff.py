@@ -0,0 +1,86 @@
+import pytest
+from datetime import datetime
+
+from yad2_scraper.vehicles.diff import ChangeType, ListingState, create_snapshot, diff_listings
+from yad2_scraper.vehicles.next_data import VehicleData
+from yad2_scraper.vehicles.store import VehicleStore
+
+
+def _create_data(token: str, price: int = 100000, updated_at: str = "2025-02-14T21:30:57") -> dict:
+    return {"token": token, "price": price, "dates": {"updatedAt": updated_at}}
+
+
+@pytest.fixture
+def previous_listings():
+    return [
+        _create_data("unchanged"),
+        _create_data("updated"),
+        _create_data("price_raised", price=100000),
+        _create_data("price_dropped", price=100000),
+        _create_data("disappeared")
+    ]
+
+
+@pytest.fixture
+def current_listings():
+    return [
+        _create_data("unchanged"),
+        _create_data("updated", updated_at="2025-02-15T10:00:00"),
+        _create_data("price_raised", price=110000),
+        _create_data("price_dropped", price=95000),
+        _create_data("new")
+    ]
+
+
+def test_listing_state_from_data():
+    assert ListingState.from_data(_create_data("a", price=5)) == ListingState(datetime(2025, 2, 14, 21, 30, 57), 5)
+    assert ListingState.from_data({"token": "a", "dates": {"updatedAt": "invalid"}}) == ListingState(None, None)
+
+
+def test_create_snapshot(previous_listings):
+    snapshot = create_snapshot([VehicleData(data) for data in previous_listings] + [{"price": 1}])
+
+    assert list(snapshot) == [data["token"] for data in previous_listings]
+    assert snapshot["price_dropped"] == ListingState(datetime(2025, 2, 14, 21, 30, 57), 100000)
+
+
+def test_diff_listings(previous_listings, current_listings):
+    changes = {change.token: change for change in diff_listings(create_snapshot(previous_listings), current_listings)}
+
+    assert {token: change.change_type for token, change in changes.items()} == {
+        "updated": ChangeType.UPDATED,
+        "price_raised": ChangeType.UPDATED,
+        "price_dropped": ChangeType.PRICE_DROPPED,
+        "new": ChangeType.NEW,
+        "disappeared": ChangeType.DISAPPEARED
+    }
+    assert changes["price_dropped"].price_drop == 5000
+    assert changes["price_raised"].price_drop is None
+    assert changes["new"].previous is None
+    assert changes["new"].data.token == "new"
+    assert changes["disappeared"].data is None
+    assert changes["disappeared"].previous.price == 100000
+
+
+def test_diff_listings_without_disappeared(previous_listings, current_listings):
+    changes = diff_listings(create_snapshot(previous_listings), current_listings, detect_disappeared=False)
+    assert ChangeType.DISAPPEARED not in {change.change_type for change in changes}
+
+
+def test_diff_listings_duplicates_and_missing_tokens():
+    changes = list(diff_listings({}, [_create_data("a"), _create_data("a"), {"price": 1}]))
+    assert [(change.change_type, change.token) for change in changes] == [(ChangeType.NEW, "a")]
+
+
+def test_diff_listings_identical_crawls(cars_next_data):
+    cars_data = cars_next_data.get_data()
+    assert list(diff_listings(create_snapshot(cars_data), cars_data)) == []
+
+
+def test_diff_listings_against_store(tmp_path, previous_listings, current_listings):
+    with VehicleStore(tmp_path / "vehicles.sqlite") as store:
+        store.upsert(previous_listings)
+        snapshot = store.get_snapshot()
+
+    assert snapshot == create_snapshot(previous_listings)
+    assert len(list(diff_listings(snapshot, current_listings))) == 5
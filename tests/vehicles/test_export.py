@@ -0,0 +1,92 @@
+import csv
+import gzip
+import json
+import pytest
+
+from yad2_scraper.vehicles.export import JsonLinesWriter, CsvWriter, export_jsonl, export_csv, to_record
+from yad2_scraper.vehicles.record import VehicleRecord
+
+
+def _read_text(path) -> str:
+    if path.suffix == ".gz":
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as file:
+            return file.read()
+    return path.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("file_name", ["cars.jsonl", "cars.jsonl.gz"])
+def test_export_jsonl(cars_next_data, tmp_path, file_name):
+    path = tmp_path / file_name
+    records = cars_next_data.get_records()
+
+    count = export_jsonl(iter(cars_next_data.get_data()), path)
+
+    lines = _read_text(path).splitlines()
+    assert count == len(lines) == len(records)
+
+    for line, record in zip(lines, records):
+        row = json.loads(line)
+        assert list(row) == list(VehicleRecord._fields)
+        assert row["token"] == record.token
+        assert row["price"] == record.price
+        assert row["city"] == record.city
+        assert row["has_abs"] == record.has_abs
+        assert row["updated_at"] == record.updated_at.isoformat()
+
+
+@pytest.mark.parametrize("file_name", ["cars.csv", "cars.csv.gz"])
+def test_export_csv(cars_next_data, tmp_path, file_name):
+    path = tmp_path / file_name
+    records = cars_next_data.get_records()
+
+    count = export_csv(cars_next_data.iter_raw_data(), path)
+
+    rows = list(csv.DictReader(_read_text(path).splitlines()))
+    assert count == len(rows) == len(records)
+
+    for row, record in zip(rows, records):
+        assert row["token"] == record.token
+        assert row["price"] == ("" if record.price is None else str(record.price))
+        assert row["year_of_production"] == str(record.year_of_production)
+        assert json.loads(row["car_tags"] or "null") == record.car_tags
+        assert row["test_date"] == ("" if record.test_date is None else record.test_date.isoformat())
+
+
+def test_export_selected_fields(cars_next_data, tmp_path):
+    path = tmp_path / "cars.csv"
+
+    export_csv(cars_next_data.get_records(), path, fields=["token", "price"])
+
+    header = path.read_text(encoding="utf-8").splitlines()[0]
+    assert header == "token,price"
+
+
+def test_export_compress_override(cars_next_data, tmp_path):
+    path = tmp_path / "cars.jsonl"
+
+    export_jsonl(cars_next_data.get_records(), path, compress=True)
+
+    with gzip.open(path) as file:
+        assert file.readline().startswith(b"{")
+
+
+def test_writer_incremental(tmp_path):
+    path = tmp_path / "cars.jsonl"
+
+    with JsonLinesWriter(path, fields=["token"]) as writer:
+        writer.write({"token": "a"})
+        assert writer.write_all([{"token": "b"}, {"token": "c"}]) == 2
+        assert writer.count == 3
+
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert rows == [{"token": "a"}, {"token": "b"}, {"token": "c"}]
+
+
+def test_writer_invalid_fields(tmp_path):
+    with pytest.raises(ValueError):
+        CsvWriter(tmp_path / "cars.csv", fields=["token", "unknown"])
+
+
+def test_to_record_invalid_listing():
+    with pytest.raises(TypeError):
+        to_record(["token"])
@@ -0,0 +1,67 @@
+import pickle
+import pytest
+from datetime import datetime
+
+from yad2_scraper.next_data import Field
+from yad2_scraper.vehicles.record import VehicleRecord
+
+# record fields which match a `VehicleData` property (or method, with the given field) of the same name
+MATCHING_PROPERTIES = [
+    "token", "page_link", "price", "customer_name", "customer_phone", "cover_image", "images", "description",
+    "updated_at", "created_at", "ends_at", "rebounced_at", "km", "engine_volume", "horse_power", "above_price",
+    "is_contact_lead_supported", "year_of_production", "month_of_production", "test_date", "seats",
+    "number_of_doors", "owner", "body_type", "combined_fuel_consumption", "has_air_conditioner", "has_abs",
+    "air_bags", "has_electric_window", "has_reverse_camera", "safety_points", "is_turbo", "has_box"
+]
+MATCHING_METHODS = [
+    ("top_area", Field.TEXT), ("top_area_id", Field.ID), ("city", Field.TEXT), ("city_id", Field.ID),
+    ("manufacturer", Field.TEXT), ("manufacturer_id", Field.ID), ("manufacturer_english", Field.ENGLISH_TEXT),
+    ("model", Field.TEXT), ("model_id", Field.ID), ("color", Field.TEXT), ("gear_box", Field.TEXT),
+    ("engine_type", Field.TEXT), ("car_family_types", Field.TEXT), ("car_tags", Field.TEXT),
+    ("ignition", Field.TEXT)
+]
+
+
+@pytest.fixture(scope="module")
+def cars_records(cars_next_data):
+    return cars_next_data.get_records()
+
+
+def test_get_records(cars_next_data, cars_records):
+    assert len(cars_records) == len(cars_next_data.get_data())
+    assert all(isinstance(record, VehicleRecord) for record in cars_records)
+
+
+@pytest.mark.parametrize("name", MATCHING_PROPERTIES)
+def test_record_matches_vehicle_data_property(name, cars_next_data, cars_records):
+    for vehicle_data, record in zip(cars_next_data.get_data(), cars_records):
+        assert getattr(record, name) == getattr(vehicle_data, name)
+
+
+@pytest.mark.parametrize("name, field", MATCHING_METHODS)
+def test_record_matches_vehicle_data_method(name, field, cars_next_data, cars_records):
+    method_name = name.replace("_id", "").replace("_english", "")
+
+    for vehicle_data, record in zip(cars_next_data.get_data(), cars_records):
+        assert getattr(record, name) == getattr(vehicle_data, method_name)(field)
+
+
+def test_record_fields_parsed(cars_next_data, cars_records):
+    for vehicle_data, record in zip(cars_next_data.get_data(), cars_records):
+        assert record.hand == vehicle_data.data["hand"]["id"]
+        assert record.sub_model == vehicle_data.data["subModel"]["text"]
+        assert isinstance(record.updated_at, datetime)
+
+
+def test_record_from_partial_data():
+    record = VehicleRecord.from_data({"token": "abc", "dates": {"updatedAt": "invalid"}, "carTag": None})
+
+    assert record.token == "abc"
+    assert record.updated_at is None
+    assert record.car_tags is None
+    assert record.price is None
+    assert record.city is None
+
+
+def test_record_is_picklable(cars_records):
+    assert pickle.loads(pickle.dumps(cars_records)) == cars_records
@@ -0,0 +1,112 @@
+import pytest
+from datetime import datetime
+
+from yad2_scraper.vehicles.store import VehicleStore, StoredVehicle
+from yad2_scraper.vehicles.next_data import VehicleData
+
+
+@pytest.fixture
+def store(tmp_path):
+    with VehicleStore(tmp_path / "vehicles.sqlite") as store:
+        yield store
+
+
+def _create_data(token: str, price: int = 100000, year: int = 2020, manufacturer_id: int = 1) -> dict:
+    return {
+        "token": token,
+        "price": price,
+        "manufacturer": {"id": manufacturer_id, "text": "manufacturer"},
+        "vehicleDates": {"yearOfProduction": year},
+        "dates": {"updatedAt": "2025-02-14T21:30:57"}
+    }
+
+
+def test_upsert_and_get(store, cars_next_data):
+    cars_data = cars_next_data.get_data()
+
+    assert store.upsert(cars_data, seen_at=1000) == len(cars_data)
+    assert len(store) == len(cars_data)
+
+    stored_vehicle = store.get(cars_data[0].token)
+    assert isinstance(stored_vehicle, StoredVehicle)
+    assert isinstance(stored_vehicle.data, VehicleData)
+    assert stored_vehicle.token == cars_data[0].token
+    assert stored_vehicle.data.data == cars_data[0].data
+    assert stored_vehicle.first_seen_at == stored_vehicle.last_seen_at == 1000
+    assert store.get("missing_token") is None
+
+
+def test_upsert_updates_existing_listings(store):
+    store.upsert([_create_data("a", price=100), _create_data("b")], seen_at=1000)
+    store.upsert([_create_data("a", price=90)], seen_at=2000)
+
+    stored_vehicle = store.get("a")
+    assert stored_vehicle.data.price == 90
+    assert stored_vehicle.first_seen_at == 1000
+    assert stored_vehicle.last_seen_at == 2000
+    assert store.get("b").last_seen_at == 1000
+    assert len(store) == 2
+
+
+def test_upsert_keeps_latest_last_seen(store):
+    store.upsert([_create_data("a")], seen_at=2000)
+    store.upsert([_create_data("a")], seen_at=1000)
+    assert store.get("a").last_seen_at == 2000
+
+
+def test_upsert_skips_listings_without_token(store):
+    data = _create_data("a")
+    del data["token"]
+
+    assert store.upsert([data]) == 0
+    assert len(store) == 0
+
+
+def test_contains_and_tokens(store):
+    store.upsert([_create_data("a"), _create_data("b")])
+
+    assert "a" in store
+    assert "c" not in store
+    assert sorted(store.get_tokens()) == ["a", "b"]
+
+
+def test_find(store):
+    store.upsert([
+        _create_data("a", price=300, year=2018, manufacturer_id=1),
+        _create_data("b", price=100, year=2020, manufacturer_id=2),
+        _create_data("c", price=200, year=2022, manufacturer_id=1)
+    ], seen_at=1000)
+    store.upsert([_create_data("c", price=200, year=2022, manufacturer_id=1)], seen_at=2000)
+
+    assert [v.token for v in store.find()] == ["b", "c", "a"]
+    assert [v.token for v in store.find(price_range=(300, 150))] == ["c", "a"]
+    assert [v.token for v in store.find(year_range=(2019, 2022), manufacturer_id=1)] == ["c"]
+    assert [v.token for v in store.find(seen_since=1500)] == ["c"]
+
+
+def test_delete(store):
+    store.upsert([_create_data("a"), _create_data("b")])
+
+    assert store.delete(["a", "missing_token"]) == 1
+    assert store.get_tokens() == ["b"]
+
+
+def test_store_is_persistent(tmp_path, cars_next_data):
+    path = tmp_path / "vehicles.sqlite"
+
+    with VehicleStore(path) as store:
+        store.upsert(cars_next_data.iter_raw_data())
+
+    with VehicleStore(path) as store:
+        assert len(store) == len(cars_next_data.get_data())
+
+
+def test_get_snapshot(store):
+    store.upsert([_create_data("a", price=100)], seen_at=1000)
+    store.upsert([_create_data("b", price=200)], seen_at=2000)
+
+    snapshot = store.get_snapshot()
+    assert set(snapshot) == {"a", "b"}
+    assert snapshot["a"].price == 100
+    assert snapshot["a"].updated_at == datetime(2025, 2, 14, 21, 30, 57)
+    assert set(store.get_snapshot(seen_since=1500)) == {"b"}
@@ -1,4 +1,7 @@
 import pytest
+from bs4 import BeautifulSoup
+
+from yad2_scraper.vehicles.tag import VehicleTagRecord
 
 
 @pytest.mark.parametrize(
@@ -99,3 +102,32 @@ def test_price_string(index, expected_value, cars_tags):
 )
 def test_price(index, expected_value, cars_tags):
     assert cars_tags[index].price == expected_value
+
+
+TAG_FIELDS = ["relative_link", "page_link", "image_url", "model", "marketing_text", "year_and_hand_string",
+              "price_string", "year", "hand", "price"]
+
+
+@pytest.fixture(scope="module")
+def cars_tag_records(cars_category):
+    return cars_category.get_tag_records()
+
+
+def test_tag_records_count(cars_tags, cars_tag_records):
+    assert len(cars_tag_records) == len(cars_tags)
+
+
+@pytest.mark.parametrize("field", TAG_FIELDS)
+def test_tag_records_match_tags(field, cars_tags, cars_tag_records):
+    for tag, tag_record in zip(cars_tags, cars_tag_records):
+        assert getattr(tag_record, field) == getattr(tag, field)
+
+
+def test_tag_record_missing_fields():
+    soup = BeautifulSoup('<div class="feedItemBox"><span class="price_abc">לא צוין מחיר</span></div>', "html.parser")
+
+    tag_record = VehicleTagRecord.from_tag(soup.div)
+
+    assert tag_record.model is None
+    assert tag_record.price_string == "לא צוין מחיר"
+    assert tag_record.price is None
@@ -1,8 +1,16 @@
-from typing import Optional, Type
+from typing import Optional, Type, Iterator
 
 from .scraper import Yad2Scraper, Category
+from .async_scraper import AsyncYad2Scraper
+from .cache import ResponseCache
+from .rate_limit import RateLimiter, AdaptiveRateLimiter
+from .hooks import RequestHooks
+from .metrics import MetricsCollector, LatencyHistogram
+from .tracing import Tracer, InMemoryTracer, OpenTelemetryTracer, get_tracer, set_tracer
+from .bloom import BloomFilter
 from .query import QueryFilters, OrderBy, NumberRange
 from .category import Yad2Category
+from .crawler import Yad2Crawler
 from .next_data import NextData, Field
 from .utils import any_param_specified
 from .vehicles import (
@@ -10,6 +18,8 @@ from .vehicles import (
     VehiclesQueryFilters,
     OrderVehiclesBy,
     VehicleCategory,
+    VehicleData,
+    Yad2VehiclesCrawler,
     get_vehicle_category_url
 )
 
@@ -97,3 +107,31 @@ def fetch_vehicle_category(
     url = get_vehicle_category_url(vehicle_category)
     default_scraper = get_default_scraper()
     return default_scraper.fetch_category(url, Yad2VehiclesCategory, params=params)
+
+
+def crawl_vehicle_category(
+        vehicle_category: VehicleCategory,
+        order_by: Optional[OrderVehiclesBy] = None,
+        price_range: [NumberRange] = None,
+        year_range: [NumberRange] = None,
+        max_pages: Optional[int] = None
+) -> Iterator[VehicleData]:
+    """
+    Crawls all the result pages of a specific vehicle category, while applying optional filters.
+
+    Args:
+        vehicle_category (VehicleCategory): The vehicle category to crawl.
+        order_by (Optional[OrderVehiclesBy], optional): The sorting order for the results (default is None).
+        price_range (Optional[List[NumberRange]], optional): The price range filter for the results (default is None).
+        year_range (Optional[List[NumberRange]], optional): The year range filter for the results (default is None).
+        max_pages (Optional[int], optional): The maximum number of pages to crawl (default is None, all pages).
+
+    Yields:
+        VehicleData: The data of each vehicle listed in the crawled pages, as the pages complete.
+
+    Notes:
+        This method uses the default scraper to fetch the pages.
+    """
+    params = VehiclesQueryFilters(order_by=order_by, price_range=price_range, year_range=year_range)
+    crawler = Yad2VehiclesCrawler(get_default_scraper())
+    return crawler.crawl(vehicle_category, params=params, max_pages=max_pages)
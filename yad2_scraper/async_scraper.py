@@ -0,0 +1,240 @@
+import asyncio
+import logging
+import httpx
+import time
+from typing import Optional, Dict, Any, Type, Sequence
+
+from yad2_scraper.scraper import BaseYad2Scraper, Category, WaitStrategy, QueryParamTypes
+from yad2_scraper.cache import ResponseCache, CachedResponse
+from yad2_scraper.rate_limit import RateLimiter
+from yad2_scraper.hooks import RequestHooks
+from yad2_scraper.tracing import get_tracer
+from yad2_scraper.constants import (
+    DEFAULT_REQUEST_HEADERS,
+    ALLOW_REQUEST_REDIRECTS,
+    VERIFY_REQUEST_SSL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncYad2Scraper(BaseYad2Scraper):
+    """An asynchronous scraper for fetching data from the Yad2 website, with bounded request concurrency"""
+
+    def __init__(
+            self,
+            client: Optional[httpx.AsyncClient] = None,
+            request_defaults: Optional[Dict[str, Any]] = None,
+            randomize_user_agent: bool = True,
+            wait_strategy: Optional[WaitStrategy] = None,
+            max_request_attempts: int = 1,
+            max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+            cache: Optional[ResponseCache] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            hooks: Optional[Sequence[RequestHooks]] = None
+    ):
+        """
+        Initializes the AsyncYad2Scraper with provided parameters.
+
+        Args:
+            client (Optional[httpx.AsyncClient]): An optional custom async HTTP client. If not provided, a default
+                client is used.
+            request_defaults (Optional[Dict[str, Any]]): Default parameters for requests such as headers, params, etc.
+            randomize_user_agent (bool): If True, a random User-Agent will be set for each request. Defaults to True.
+            wait_strategy (Optional[WaitStrategy]): A function to determine the wait time between requests.
+            max_request_attempts (int): The maximum number of retry attempts for failed requests. Defaults to 1.
+            max_concurrent_requests (int): The maximum number of requests that may be in flight at the same time.
+            cache (Optional[ResponseCache]): An optional response cache for GET requests.
+            rate_limiter (Optional[RateLimiter]): An optional rate limiter, which may be shared between scrapers.
+            hooks (Optional[Sequence[RequestHooks]]): Request lifecycle hooks (e.g. a `MetricsCollector`).
+        """
+        if not isinstance(max_concurrent_requests, int) or max_concurrent_requests <= 0:
+            raise ValueError(
+                f"max_concurrent_requests must be a positive integer, but got {max_concurrent_requests}"
+            )
+
+        super().__init__(
+            client=client or httpx.AsyncClient(
+                headers=DEFAULT_REQUEST_HEADERS,
+                follow_redirects=ALLOW_REQUEST_REDIRECTS,
+                verify=VERIFY_REQUEST_SSL
+            ),
+            request_defaults=request_defaults,
+            randomize_user_agent=randomize_user_agent,
+            wait_strategy=wait_strategy,
+            max_request_attempts=max_request_attempts,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            hooks=hooks
+        )
+        self.max_concurrent_requests = max_concurrent_requests
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Returns the semaphore bounding the in-flight requests (created lazily, inside the running event loop)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        return self._semaphore
+
+    async def fetch_category(
+            self,
+            url: str,
+            category_type: Type[Category],
+            params: Optional[QueryParamTypes] = None
+    ) -> Category:
+        """
+        Fetches and returns a category page from a given URL.
+
+        Args:
+            url (str): The URL of the category page.
+            category_type (Type[Category]): The class type of the category to be fetched.
+            params (Optional[QueryParamTypes]): Query parameters to be included in the request.
+
+        Returns:
+            Category: The fetched category, parsed from HTML.
+        """
+        logger.debug(f"Fetching category from URL: '{url}'")
+        response = await self.get(url, params)
+        logger.debug(f"Category fetched successfully from URL: '{url}'")
+        return category_type.from_html_io(response)
+
+    async def get(self, url: str, params: Optional[QueryParamTypes] = None) -> httpx.Response:
+        """Sends a GET request to the specified URL."""
+        return await self.request("GET", url, params=params)
+
+    async def request(self, method: str, url: str, params: Optional[QueryParamTypes] = None) -> httpx.Response:
+        """
+        Sends an HTTP request with multiple attempts logic.
+
+        Args:
+            method (str): The HTTP method (e.g., "GET", "POST").
+            url (str): The URL to send the request to.
+            params (Optional[QueryParamTypes]): Query parameters to be included in the request.
+
+        Returns:
+            httpx.Response: The HTTP response object.
+
+        Raises:
+            MaxRequestAttemptsExceededError: If the request exceeds the maximum number of attempts.
+        """
+        self._validate_max_request_attempts()
+        request_options = self._prepare_request_options(params=params)
+        cache_key = self._get_cache_key(method, url, request_options)
+        cached_response = self._load_cached_response(cache_key, request_options)
+
+        if cached_response and cached_response.is_fresh(self.cache.ttl):
+            return self._create_cached_response(method, url, request_options, cached_response)
+
+        error_list = []
+
+        for attempt in range(1, self.max_request_attempts + 1):
+            try:
+                response = await self._send_request(method, url, request_options, attempt, cached_response)
+            except Exception as error:
+                logger.error(f"{method} request to '{url}' failed {self._format_attempt_info(attempt)}: {error}")
+                self._record_rate_feedback(error)
+                self._run_failure_hooks(method, url, attempt, error)
+                error_list.append(error)
+            else:
+                self._record_rate_feedback()
+                self._store_response(cache_key, response)
+                return response
+
+        self._raise_request_failure(method, url, error_list)
+
+    async def close(self) -> None:
+        """Closes the async HTTP client and logs the closure."""
+        logger.debug("Closing scraper client")
+        await self.client.aclose()
+        logger.info("Scraper client closed")
+
+    async def _send_request(
+            self,
+            method: str,
+            url: str,
+            request_options: Dict[str, Any],
+            attempt: int,
+            cached_response: Optional[CachedResponse] = None
+    ) -> httpx.Response:
+        """
+        Sends an HTTP request with the specified method to the given URL, applying all necessary actions.
+
+        Args:
+            method (str): The HTTP method (e.g., 'GET', 'POST').
+            url (str): The target URL for the request.
+            request_options (Dict[str, Any]): Additional request options, including headers and parameters.
+            attempt (int): The current attempt number for the request.
+            cached_response (Optional[CachedResponse]): The stale cached response being revalidated (if any).
+
+        Returns:
+            httpx.Response: The HTTP response object received from the server (or revalidated from the cache).
+
+        Raises:
+            AntiBotDetectedError: If the response contains Anti-Bot content.
+            UnexpectedContentError: If a GET request does not contain expected content.
+        """
+        if self.randomize_user_agent:
+            self._set_random_user_agent(request_options)
+
+        if self.wait_strategy or self.rate_limiter:
+            with get_tracer().span("wait", attempt=attempt):
+                if self.wait_strategy:
+                    await self._apply_wait_strategy(attempt)
+
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire_async()
+
+        async with self.semaphore:
+            logger.info(f"Sending {method} request to URL: '{url}' {self._format_attempt_info(attempt)}")
+            self._run_hooks("before_request", method, url, attempt)
+            start_time = time.perf_counter()
+
+            with get_tracer().span("send_request", method=method, url=url, attempt=attempt):
+                response = await self.client.request(method, url, **request_options)
+
+            self._run_hooks("after_response", response, attempt, time.perf_counter() - start_time)
+
+        self._increment_request_count()
+        logger.debug(f"Received response {response.status_code} from '{url}' {self._format_attempt_info(attempt)}")
+        response = self._resolve_not_modified_response(response, cached_response)
+
+        with get_tracer().span("validate_response", status_code=response.status_code):
+            self._validate_response(response)
+
+        return response
+
+    async def _apply_wait_strategy(self, attempt: int):
+        """
+        Applies a wait time before making a request based on the wait strategy for the given attempt.
+
+        Args:
+            attempt (int): The current attempt number to calculate the wait time.
+        """
+        wait_time = self._get_wait_time(attempt)
+        if wait_time:
+            await asyncio.sleep(wait_time)
+
+    async def __aenter__(self):
+        """
+        Prepares the scraper to be used in an `async with` statement, allowing for resource management.
+
+        Returns:
+            AsyncYad2Scraper: The scraper instance to be used within the `async with` block.
+        """
+        logger.debug("Entering scraper context")
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Cleans up resources and closes the scraper client when exiting the `async with` statement.
+
+        Args:
+            exc_type: The exception type (if any).
+            exc_val: The exception value (if any).
+            exc_tb: The traceback object (if any).
+        """
+        logger.debug("Exiting scraper context")
+        await self.close()
@@ -0,0 +1,194 @@
+import hashlib
+import logging
+import math
+import mmap
+import struct
+from pathlib import Path
+from typing import Optional, Union, Iterable, List
+
+from yad2_scraper.constants import DEFAULT_BLOOM_FILTER_ERROR_RATE
+
+# file header: magic, version, number of bits, number of hash functions, capacity, error rate, count of added items
+_HEADER_FORMAT = "<4sHQIQdQ"
+_HEADER_SIZE = struct.calcsize(_HEADER_FORMAT)
+_MAGIC = b"Y2BF"
+_VERSION = 1
+_UINT64_MASK = (1 << 64) - 1
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    A memory-efficient probabilistic set of strings (e.g. listing tokens), which may be persisted to a file.
+
+    Membership checks have no false negatives, but may have false positives, at a rate of up to `error_rate` while at
+    most `capacity` items are added (the rate grows beyond it). Items cannot be removed.
+    The bits are stored in a memory-mapped file when a path is given, so large filters are paged in by the OS
+    instead of being loaded into memory, and are persisted between runs.
+    """
+
+    def __init__(
+            self,
+            capacity: int,
+            error_rate: float = DEFAULT_BLOOM_FILTER_ERROR_RATE,
+            path: Optional[Union[str, Path]] = None,
+            overwrite: bool = False
+    ):
+        """
+        Initializes an empty Bloom filter, sized for the given capacity and error rate.
+
+        Args:
+            capacity (int): The number of items the filter is sized for.
+            error_rate (float): The false positive rate (between 0 and 1) at full capacity. Defaults to 0.1%.
+            path (Optional[Union[str, Path]]): The path of a new file to memory-map the filter to. Use
+                `BloomFilter.open` (or `open_or_create`) to load an existing file. If not provided, the filter is
+                in memory.
+            overwrite (bool): Whether to overwrite the file at the path if it exists (discarding its items).
+
+        Raises:
+            FileExistsError: If the file at the path exists, and `overwrite` is False.
+        """
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError(f"capacity must be a positive integer, but got {capacity}")
+
+        if not 0 < error_rate < 1:
+            raise ValueError(f"error_rate must be between 0 and 1, but got {error_rate}")
+
+        if path is not None and not overwrite and Path(path).exists():
+            raise FileExistsError(
+                f"Bloom filter file already exists (open it with BloomFilter.open, or pass overwrite=True): '{path}'"
+            )
+
+        bit_count = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        hash_count = max(1, round(bit_count / capacity * math.log(2)))
+
+        self._init_state(capacity, error_rate, bit_count, hash_count, 0)
+        self.path = Path(path) if path is not None else None
+
+        if self.path is None:
+            self._bits = bytearray(self._byte_count)
+        else:
+            with self.path.open("wb") as file:
+                file.write(self._pack_header())
+                file.truncate(_HEADER_SIZE + self._byte_count)
+            self._bits = self._map_file()
+            self._bit_offset = _HEADER_SIZE * 8
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "BloomFilter":
+        """Open a Bloom filter persisted to the given file, memory-mapping it."""
+        path = Path(path)
+
+        with path.open("rb") as file:
+            header = file.read(_HEADER_SIZE)
+
+        if len(header) < _HEADER_SIZE:
+            raise ValueError(f"File is not a Bloom filter: '{path}'")
+
+        magic, version, bit_count, hash_count, capacity, error_rate, count = struct.unpack(_HEADER_FORMAT, header)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"File is not a Bloom filter (version {_VERSION}): '{path}'")
+
+        bloom_filter = cls.__new__(cls)
+        bloom_filter._init_state(capacity, error_rate, bit_count, hash_count, count)
+        bloom_filter.path = path
+        bloom_filter._bits = bloom_filter._map_file()
+        bloom_filter._bit_offset = _HEADER_SIZE * 8
+
+        logger.debug(f"Bloom filter opened with {count} items at: '{path}'")
+        return bloom_filter
+
+    @classmethod
+    def open_or_create(
+            cls,
+            path: Union[str, Path],
+            capacity: int,
+            error_rate: float = DEFAULT_BLOOM_FILTER_ERROR_RATE
+    ) -> "BloomFilter":
+        """
+        Open the Bloom filter persisted to the given file, or create it if the file does not exist.
+
+        Args:
+            path (Union[str, Path]): The path of the filter file.
+            capacity (int): The number of items a new filter is sized for.
+            error_rate (float): The false positive rate (between 0 and 1) of a new filter at full capacity.
+
+        Returns:
+            BloomFilter: The opened (or new) filter. An opened filter keeps its own capacity and error rate.
+        """
+        if Path(path).exists():
+            return cls.open(path)
+
+        return cls(capacity, error_rate, path=path)
+
+    @property
+    def size(self) -> int:
+        """Return the size (in bytes) of the bit array."""
+        return self._byte_count
+
+    def add(self, item: str):
+        """Add an item to the filter."""
+        bits = self._bits
+
+        for position in self._get_positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+
+        self.count += 1
+
+    def update(self, items: Iterable[str]):
+        """Add all the items to the filter."""
+        for item in items:
+            self.add(item)
+
+    def flush(self):
+        """Write the added items (and the header) to the file, if the filter is persisted."""
+        if isinstance(self._bits, mmap.mmap):
+            self._bits[:_HEADER_SIZE] = self._pack_header()
+            self._bits.flush()
+
+    def close(self):
+        """Flush and close the filter file, if the filter is persisted."""
+        if isinstance(self._bits, mmap.mmap) and not self._bits.closed:
+            self.flush()
+            self._bits.close()
+            logger.debug(f"Bloom filter closed with {self.count} items at: '{self.path}'")
+
+    def _init_state(self, capacity: int, error_rate: float, bit_count: int, hash_count: int, count: int):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bit_count = bit_count
+        self.hash_count = hash_count
+        self.count = count
+        self._byte_count = (bit_count + 7) // 8
+        self._bit_offset = 0
+
+    def _get_positions(self, item: str) -> List[int]:
+        """Return the bit positions of an item (with double hashing of a single 128-bit digest)."""
+        digest = int.from_bytes(hashlib.blake2b(item.encode(), digest_size=16).digest(), "little")
+        first_hash, second_hash = digest & _UINT64_MASK, (digest >> 64) | 1
+        bit_count, bit_offset = self.bit_count, self._bit_offset
+        return [bit_offset + (first_hash + i * second_hash) % bit_count for i in range(self.hash_count)]
+
+    def _map_file(self) -> mmap.mmap:
+        with self.path.open("r+b") as file:
+            return mmap.mmap(file.fileno(), _HEADER_SIZE + self._byte_count)
+
+    def _pack_header(self) -> bytes:
+        return struct.pack(
+            _HEADER_FORMAT, _MAGIC, _VERSION, self.bit_count, self.hash_count, self.capacity, self.error_rate, self.count
+        )
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._get_positions(item))
+
+    def __len__(self) -> int:
+        """Return the number of items added (including re-added items)."""
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,231 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import httpx
+from enum import Enum
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, NamedTuple, Union
+
+from yad2_scraper.constants import DEFAULT_CACHE_TTL, DEFAULT_CACHE_MAX_SIZE
+
+QueryParams = Optional[Dict[str, Any]]
+
+# headers describing the transferred (encoded) body, which does not match the stored decoded content
+_TRANSFER_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query_params(params: QueryParams) -> List[Tuple[str, str]]:
+    """Return the query parameters as sorted string pairs, excluding None values."""
+    if not params:
+        return []
+
+    normalized = []
+
+    for key, value in dict(params).items():
+        if value is None:
+            continue
+        if isinstance(value, Enum):
+            value = value.value
+        normalized.append((str(key), str(value)))
+
+    return sorted(normalized)
+
+
+class CachedResponse(NamedTuple):
+    """Represents a response stored in the response cache."""
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        """Return the number of seconds since the response was stored."""
+        return time.time() - self.stored_at
+
+    def is_fresh(self, ttl: float) -> bool:
+        """Check whether the response may be used without revalidation."""
+        return self.age < ttl
+
+    def get_validation_headers(self) -> Dict[str, str]:
+        """Return the conditional request headers (If-None-Match / If-Modified-Since) for revalidation."""
+        headers = httpx.Headers(self.headers)
+        validation_headers = {}
+
+        if "ETag" in headers:
+            validation_headers["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validation_headers["If-Modified-Since"] = headers["Last-Modified"]
+
+        return validation_headers
+
+    def revalidate(self, headers: httpx.Headers) -> "CachedResponse":
+        """Return the response revalidated now, with the headers of a "304 Not Modified" response merged in."""
+        merged_headers = httpx.Headers(self.headers)
+
+        for key, value in headers.items():
+            if key.lower() not in _TRANSFER_HEADERS:
+                merged_headers[key] = value
+
+        return self._replace(headers=merged_headers.multi_items(), stored_at=time.time())
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """Build an HTTP response object from the stored response."""
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request
+        )
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "CachedResponse":
+        """Create a stored response from an HTTP response object."""
+        headers = [(key, value) for key, value in response.headers.items() if key.lower() not in _TRANSFER_HEADERS]
+        return cls(response.status_code, headers, response.content, time.time())
+
+
+class ResponseCache:
+    """An on-disk (SQLite) cache of HTTP responses, with a TTL, size-bounded LRU eviction and revalidation."""
+
+    def __init__(
+            self,
+            path: Union[str, Path],
+            ttl: float = DEFAULT_CACHE_TTL,
+            max_size: int = DEFAULT_CACHE_MAX_SIZE
+    ):
+        """
+        Initializes the response cache, creating the cache database if it does not exist.
+
+        Args:
+            path (Union[str, Path]): The path of the cache database file.
+            ttl (float): The number of seconds a response is used without revalidation. Defaults to 10 minutes.
+            max_size (int): The maximum total size (in bytes) of the stored responses content. Defaults to 256 MB.
+        """
+        if ttl < 0:
+            raise ValueError(f"ttl must be a non-negative number, but got {ttl}")
+
+        if max_size <= 0:
+            raise ValueError(f"max_size must be a positive integer, but got {max_size}")
+
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+            """
+        )
+
+        logger.debug(f"Response cache opened at: '{self.path}'")
+
+    @staticmethod
+    def make_key(method: str, url: str, params: QueryParams = None) -> str:
+        """Create the cache key of a request, from its method, URL and normalized query parameters."""
+        key_data = json.dumps([method.upper(), url, normalize_query_params(params)])
+        return hashlib.sha256(key_data.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the stored response of the given key (and mark it as recently used), if it exists."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, headers, content, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if not row:
+                return None
+
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._connection.commit()
+
+        status_code, headers, content, stored_at = row
+        return CachedResponse(status_code, [tuple(header) for header in json.loads(headers)], content, stored_at)
+
+    def set(self, key: str, cached_response: CachedResponse):
+        """Store a response under the given key, evicting the least recently used responses if needed."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    cached_response.status_code,
+                    json.dumps(cached_response.headers),
+                    cached_response.content,
+                    len(cached_response.content),
+                    cached_response.stored_at,
+                    time.time()
+                )
+            )
+            self._evict()
+            self._connection.commit()
+
+    def delete(self, key: str):
+        """Delete the stored response of the given key, if it exists."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._connection.commit()
+
+    def clear(self):
+        """Delete all the stored responses."""
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    @property
+    def size(self) -> int:
+        """Return the total size (in bytes) of the stored responses content."""
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self._connection.close()
+
+        logger.debug(f"Response cache closed at: '{self.path}'")
+
+    def _evict(self):
+        """Delete the least recently used responses, until the total size is within the maximum size."""
+        total_size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total_size <= self.max_size:
+            return
+
+        rows = self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        evicted_keys = []
+
+        for key, size in rows:
+            if total_size <= self.max_size:
+                break
+            evicted_keys.append((key,))
+            total_size -= size
+
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted_keys)
+        logger.debug(f"Evicted {len(evicted_keys)} responses from the response cache")
+
+    def __len__(self) -> int:
+        """Return the number of stored responses."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
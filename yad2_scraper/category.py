@@ -1,31 +1,77 @@
-import json
-from bs4 import BeautifulSoup, Tag
-from typing import Optional, List, Union, TextIO, BinaryIO
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from typing import Optional, List, Union, TextIO, BinaryIO, Literal
 
 from yad2_scraper.next_data import NextData
-from yad2_scraper.utils import find_all_html_tags_by_class_substring
-from yad2_scraper.constants import NEXT_DATA_SCRIPT_ID
+from yad2_scraper.utils import find_next_data_script, load_json, JsonLoads
+from yad2_scraper.class_index import ClassSubstringIndex
+from yad2_scraper.tracing import get_tracer
+from yad2_scraper.constants import NEXT_DATA_SCRIPT_ID, DEFAULT_HTML_PARSER
+
+HtmlParser = Literal["html.parser", "lxml", "html5lib"]
 
 
 class Yad2Category:
     """Represents a Yad2 category parsed from an HTML page."""
 
-    def __init__(self, soup: BeautifulSoup):
-        """Initialize with a BeautifulSoup object."""
-        self.soup = soup
+    parser: HtmlParser = DEFAULT_HTML_PARSER
+    json_loads: JsonLoads = staticmethod(load_json)
+
+    def __init__(
+            self,
+            soup: Optional[BeautifulSoup] = None,
+            html: Optional[Union[str, bytes]] = None,
+            parser: Optional[HtmlParser] = None
+    ):
+        """Initialize with a BeautifulSoup object and/or the raw HTML (parsed lazily, on first access of `soup`)."""
+        if soup is None and html is None:
+            raise ValueError("Either a soup or a raw HTML must be provided")
+
+        self._soup = soup
+        self._class_index = None
+        self.html = html
+
+        if parser is not None:
+            self.parser = parser
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """Return the parsed HTML document, parsing the raw HTML on first access."""
+        if self._soup is None:
+            with get_tracer().span("parse_html", parser=self.parser):
+                self._soup = BeautifulSoup(self.html, self.parser, parse_only=self.get_parse_only())
+        return self._soup
+
+    @property
+    def class_index(self) -> ClassSubstringIndex:
+        """Return the class-substring index of the HTML document, building it on first access."""
+        if self._class_index is None:
+            self._class_index = ClassSubstringIndex(self.soup)
+        return self._class_index
+
+    @property
+    def is_parsed(self) -> bool:
+        """Check whether the HTML document was already parsed."""
+        return self._soup is not None
 
     @classmethod
-    def from_html_io(cls, html_io: Union[TextIO, BinaryIO]):
-        """Create an instance from an HTML file-like object."""
-        html = html_io.read()
-        soup = BeautifulSoup(html, "html.parser")
-        return cls(soup)
+    def from_html_io(cls, html_io: Union[TextIO, BinaryIO], parser: Optional[HtmlParser] = None):
+        """Create an instance from an HTML file-like object (the HTML is parsed only when tags are requested)."""
+        return cls(html=html_io.read(), parser=parser)
+
+    def get_parse_only(self) -> Optional[SoupStrainer]:
+        """Return a strainer restricting the parsed parts of the document (None parses the whole document)."""
+        return None
 
     def load_next_data(self) -> Optional[NextData]:
-        """Extract and parse Next.js data from the page."""
-        tag = self.soup.find("script", id=NEXT_DATA_SCRIPT_ID)
-        return NextData(json.loads(tag.string)) if tag else None
+        """Extract and parse Next.js data from the page (sliced directly from the raw HTML, if available)."""
+        with get_tracer().span("load_next_data"):
+            if self.html is not None:
+                script = find_next_data_script(self.html)
+                return NextData(self.json_loads(script)) if script else None
+
+            tag = self.soup.find("script", id=NEXT_DATA_SCRIPT_ID)
+            return NextData(self.json_loads(str(tag.string))) if tag else None
 
     def find_all_tags_by_class_substring(self, tag_name: str, substring: str) -> List[Tag]:
-        """Find all HTML tags with a class containing the given substring."""
-        return find_all_html_tags_by_class_substring(self.soup, tag_name, substring)
+        """Find all HTML tags with a class containing the given substring (using the class-substring index)."""
+        return self.class_index.find_all(tag_name, substring)
@@ -0,0 +1,121 @@
+import bisect
+import re
+from bs4 import BeautifulSoup, Tag
+from typing import Dict, List, Optional, Union
+
+from yad2_scraper.utils import find_html_tag_by_class_substring, find_all_html_tags_by_class_substring
+
+_WHITESPACE_PATTERN = re.compile(r"\s")
+
+
+class ClassSubstringIndex:
+    """
+    An index of the elements of a parsed document by their class names, for fast class-substring lookups.
+
+    The document is walked once, numbering its elements in document order and mapping each class name to the
+    positions of its elements. A lookup then scans the distinct class names (far fewer than the elements) for the
+    substring, and merges the positions of the matching ones, so the results (and their order) match a `find_all`
+    with a class-substring filter. A substring with whitespace may match across the class names of an element, so it
+    falls back to a document search.
+    The index is a snapshot: it does not reflect changes to the document after it was built.
+    """
+
+    def __init__(self, soup: Union[BeautifulSoup, Tag]):
+        """Initialize the index, walking the whole document."""
+        self.soup = soup
+        self._elements: List[Tag] = []
+        self._positions: Dict[int, int] = {}  # element id -> position
+        self._end_positions: List[int] = []  # position -> position of the last descendant
+        self._positions_by_class: Dict[str, List[int]] = {}
+        self._positions_by_substring: Dict[str, List[int]] = {}
+        self._build()
+
+    def find_all(self, tag_name: str, substring: str, within: Optional[Tag] = None) -> List[Tag]:
+        """Find all the elements (in document order) with a class containing the given substring."""
+        if _WHITESPACE_PATTERN.search(substring):
+            return find_all_html_tags_by_class_substring(within or self.soup, tag_name, substring)
+
+        return [
+            self._elements[position] for position in self._iter_positions(substring, within)
+            if self._elements[position].name == tag_name
+        ]
+
+    def find(self, tag_name: str, substring: str, within: Optional[Tag] = None) -> Optional[Tag]:
+        """Find the first element (in document order) with a class containing the given substring."""
+        if _WHITESPACE_PATTERN.search(substring):
+            return find_html_tag_by_class_substring(within or self.soup, tag_name, substring)
+
+        for position in self._iter_positions(substring, within):
+            if self._elements[position].name == tag_name:
+                return self._elements[position]
+
+        return None
+
+    def _iter_positions(self, substring: str, within: Optional[Tag]):
+        """Iterate over the positions of the elements with a class containing the substring (within an element)."""
+        positions = self._get_substring_positions(substring)
+
+        if within is None:
+            yield from positions
+            return
+
+        within_position = self._positions.get(id(within))
+        if within_position is None:  # not an indexed element (e.g. the document itself)
+            yield from positions
+            return
+
+        end_position = self._end_positions[within_position]
+        start_index = bisect.bisect_right(positions, within_position)
+
+        for position in positions[start_index:]:
+            if position > end_position:
+                break
+            yield position
+
+    def _get_substring_positions(self, substring: str) -> List[int]:
+        """Return the sorted positions of the elements with a class containing the substring (cached per substring)."""
+        positions = self._positions_by_substring.get(substring)
+
+        if positions is None:
+            matching_classes = [class_name for class_name in self._positions_by_class if substring in class_name]
+
+            if len(matching_classes) == 1:
+                positions = self._positions_by_class[matching_classes[0]]
+            else:
+                positions = sorted({
+                    position for class_name in matching_classes for position in self._positions_by_class[class_name]
+                })
+
+            self._positions_by_substring[substring] = positions
+
+        return positions
+
+    def _build(self):
+        """Walk the document once, numbering its elements and mapping their class names to their positions."""
+        open_positions = []  # the positions of the ancestors of the current element
+
+        for element in self.soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+
+            position = len(self._elements)
+            parent_position = self._positions.get(id(element.parent))
+
+            while open_positions and open_positions[-1] != parent_position:
+                self._end_positions[open_positions.pop()] = position - 1
+
+            self._elements.append(element)
+            self._positions[id(element)] = position
+            self._end_positions.append(position)
+            open_positions.append(position)
+
+            class_names = element.get("class")
+            if isinstance(class_names, str):
+                class_names = class_names.split()
+
+            for class_name in dict.fromkeys(class_names or ()):
+                self._positions_by_class.setdefault(class_name, []).append(position)
+
+        last_position = len(self._elements) - 1
+        for position in open_positions:
+            self._end_positions[position] = last_position
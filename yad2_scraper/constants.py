@@ -17,11 +17,29 @@ DEFAULT_REQUEST_HEADERS = {
 
 ALLOW_REQUEST_REDIRECTS = True
 VERIFY_REQUEST_SSL = True
+DEFAULT_MAX_CONCURRENT_REQUESTS = 10
+
+DEFAULT_ADAPTIVE_RATE_INCREASE_STEP = 0.05  # requests per second, per second
+DEFAULT_ADAPTIVE_RATE_DECREASE_FACTOR = 0.5
+DEFAULT_ADAPTIVE_RATE_DECREASE_COOLDOWN = 5  # seconds
+
+DEFAULT_CACHE_TTL = 10 * 60  # seconds
+DEFAULT_CACHE_MAX_SIZE = 256 * 1024 * 1024  # bytes
+
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)  # seconds (upper bounds)
 
 ANTIBOT_CONTENT_IDENTIFIER = b"Are you for real"  # robot-captcha
 PAGE_CONTENT_IDENTIFIER = b"https://www.yad2.co.il/"
+THROTTLE_STATUS_CODES = {429}  # in addition to all 5xx status codes
 
 FIRST_PAGE_NUMBER = 1
+DEFAULT_CRAWLER_MAX_WORKERS = 8
+DEFAULT_EARLY_STOP_KNOWN_RATIO = 0.9  # of the listings in a page
+DEFAULT_BLOOM_FILTER_ERROR_RATE = 0.001
 NOT_MENTIONED_PRICE_RANGE = 0, 0
 
+DEFAULT_EXPORT_BUFFER_SIZE = 1024 * 1024  # bytes
+DEFAULT_EXPORT_COMPRESS_LEVEL = 6
+
+DEFAULT_HTML_PARSER = "html.parser"
 NEXT_DATA_SCRIPT_ID = "__NEXT_DATA__"
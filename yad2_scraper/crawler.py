@@ -0,0 +1,147 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Type, Iterator, Iterable, Tuple
+
+from yad2_scraper.scraper import Yad2Scraper, Category
+from yad2_scraper.query import QueryFilters
+from yad2_scraper.constants import FIRST_PAGE_NUMBER, DEFAULT_CRAWLER_MAX_WORKERS
+
+CrawledPage = Tuple[int, Category]
+
+logger = logging.getLogger(__name__)
+
+
+class Yad2Crawler:
+    """Crawls all the result pages of a category search, fetching the pages concurrently."""
+
+    def __init__(self, scraper: Optional[Yad2Scraper] = None, max_workers: int = DEFAULT_CRAWLER_MAX_WORKERS):
+        """
+        Initializes the crawler with provided parameters.
+
+        Args:
+            scraper (Optional[Yad2Scraper]): The scraper used to fetch the pages. If not provided, a new one is created.
+            max_workers (int): The maximum number of pages fetched at the same time. Defaults to 8.
+        """
+        if not isinstance(max_workers, int) or max_workers <= 0:
+            raise ValueError(f"max_workers must be a positive integer, but got {max_workers}")
+
+        self.scraper = scraper or Yad2Scraper()
+        self.max_workers = max_workers
+
+    def crawl_pages(
+            self,
+            url: str,
+            category_type: Type[Category],
+            params: Optional[QueryFilters] = None,
+            max_pages: Optional[int] = None
+    ) -> Iterator[CrawledPage]:
+        """
+        Crawls the result pages of a category search, starting from the page specified in the query filters.
+
+        The first page is fetched on its own, to read the total page count from its Next.js data.
+        The remaining pages are then fetched concurrently, and yielded in the order they complete.
+
+        Args:
+            url (str): The URL of the category.
+            category_type (Type[Category]): The class type of the category pages to be fetched.
+            params (Optional[QueryFilters]): The query filters of the search (the page is overridden per page).
+            max_pages (Optional[int]): The maximum number of pages to crawl. If not provided, all pages are crawled.
+
+        Yields:
+            CrawledPage: A tuple of the page number and the fetched category page.
+        """
+        params = params or QueryFilters()
+        first_page_number = params.page or FIRST_PAGE_NUMBER
+
+        first_page = self.fetch_page(url, category_type, params, first_page_number)
+        yield first_page_number, first_page
+
+        last_page_number = self._get_last_page_number(first_page, first_page_number, max_pages)
+        page_numbers = range(first_page_number + 1, last_page_number + 1)
+        logger.info(f"Crawling {len(page_numbers)} more pages from URL: '{url}'")
+
+        yield from self.fetch_pages(url, category_type, params, page_numbers)
+
+    def fetch_pages(
+            self,
+            url: str,
+            category_type: Type[Category],
+            params: QueryFilters,
+            page_numbers: Iterable[int]
+    ) -> Iterator[CrawledPage]:
+        """
+        Fetches the given pages concurrently, yielding them in the order they complete.
+
+        Args:
+            url (str): The URL of the category.
+            category_type (Type[Category]): The class type of the category pages to be fetched.
+            params (QueryFilters): The query filters of the search (the page is overridden per page).
+            page_numbers (Iterable[int]): The numbers of the pages to fetch.
+
+        Yields:
+            CrawledPage: A tuple of the page number and the fetched category page.
+        """
+        page_numbers = list(page_numbers)
+        if not page_numbers:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(page_numbers))) as executor:
+            futures = {
+                executor.submit(self.fetch_page, url, category_type, params, page_number): page_number
+                for page_number in page_numbers
+            }
+
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:  # do not wait for pending pages, if the crawl is stopped early
+                    future.cancel()
+
+    def fetch_page(self, url: str, category_type: Type[Category], params: QueryFilters, page_number: int) -> Category:
+        """
+        Fetches a single result page of a category search.
+
+        Args:
+            url (str): The URL of the category.
+            category_type (Type[Category]): The class type of the category page to be fetched.
+            params (QueryFilters): The query filters of the search.
+            page_number (int): The number of the page to fetch.
+
+        Returns:
+            Category: The fetched category page.
+        """
+        page_params = params.copy(update={"page": page_number})
+        return self.scraper.fetch_category(url, category_type, params=page_params)
+
+    def fetch_page_content(self, url: str, params: QueryFilters, page_number: int) -> bytes:
+        """Fetches the raw HTML of a single result page of a category search, without parsing it."""
+        page_params = params.copy(update={"page": page_number})
+        return self.scraper.get(url, params=page_params).content
+
+    @staticmethod
+    def _get_last_page_number(first_page: Category, first_page_number: int, max_pages: Optional[int]) -> int:
+        """
+        Calculates the number of the last page to crawl.
+
+        Args:
+            first_page (Category): The first crawled page, containing the total page count in its Next.js data.
+            first_page_number (int): The number of the first crawled page.
+            max_pages (Optional[int]): The maximum number of pages to crawl.
+
+        Returns:
+            int: The number of the last page to crawl (equals to `first_page_number` if there are no more pages).
+        """
+        next_data = first_page.load_next_data()
+        total_pages = next_data.total_pages if next_data else None
+        return Yad2Crawler._limit_last_page_number(total_pages, first_page_number, max_pages)
+
+    @staticmethod
+    def _limit_last_page_number(total_pages: Optional[int], first_page_number: int, max_pages: Optional[int]) -> int:
+        """Calculates the number of the last page to crawl, from the total page count of the search."""
+        last_page_number = max(total_pages or first_page_number, first_page_number)
+
+        if max_pages is not None:
+            last_page_number = min(last_page_number, first_page_number + max_pages - 1)
+
+        return last_page_number
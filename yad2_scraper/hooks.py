@@ -0,0 +1,24 @@
+import httpx
+
+
+class RequestHooks:
+    """
+    Hooks into the lifecycle of the requests sent by a scraper (e.g. to collect metrics or traces).
+
+    Subclass it and override the hooks of interest (each hook does nothing by default). The hooks are called
+    synchronously by both the synchronous and asynchronous scrapers, possibly from multiple threads, so they should be
+    fast and thread-safe. Errors raised by hooks are logged and ignored, so they never fail a request.
+    Responses served from the response cache (without sending a request) do not trigger hooks.
+    """
+
+    def before_request(self, method: str, url: str, attempt: int):
+        """Called right before each request attempt is sent (after waiting for the wait strategy and rate limiter)."""
+
+    def after_response(self, response: httpx.Response, attempt: int, elapsed: float):
+        """Called when a response is received (before it is validated), with the elapsed seconds of the attempt."""
+
+    def on_retry(self, method: str, url: str, attempt: int, error: Exception):
+        """Called when a request attempt failed and another attempt will be made."""
+
+    def on_antibot(self, response: httpx.Response, attempt: int):
+        """Called when a response contains Anti-Bot content."""
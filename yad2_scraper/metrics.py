@@ -0,0 +1,161 @@
+import bisect
+import threading
+import httpx
+from collections import Counter
+from typing import Optional, Sequence, Dict, Any
+
+from yad2_scraper.hooks import RequestHooks
+from yad2_scraper.constants import DEFAULT_LATENCY_BUCKETS
+
+
+class LatencyHistogram:
+    """A histogram of latencies (in seconds) over fixed buckets, like a Prometheus histogram (not thread-safe)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initializes an empty histogram.
+
+        Args:
+            buckets (Sequence[float]): The increasing upper bounds (in seconds) of the buckets. Latencies above the
+                last bound are counted in an overflow bucket. Defaults to 50ms-10s buckets.
+        """
+        if not buckets or any(bound <= 0 for bound in buckets) or list(buckets) != sorted(set(buckets)):
+            raise ValueError(f"buckets must be increasing positive bounds, but got {buckets}")
+
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)  # the last bucket counts the latencies above all bounds
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Return the mean latency, if any latency was observed."""
+        return self.sum / self.count if self.count else None
+
+    def observe(self, latency: float):
+        """Add a latency to the histogram."""
+        self.bucket_counts[bisect.bisect_left(self.buckets, latency)] += 1
+        self.count += 1
+        self.sum += latency
+        self.max = max(self.max, latency)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile (between 0 and 1) as the upper bound of its bucket (or the maximum, if it overflows)."""
+        if not 0 <= q <= 1:
+            raise ValueError(f"q must be between 0 and 1, but got {q}")
+
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        cumulative_count = 0
+
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank and cumulative_count:
+                return min(bound, self.max)
+
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the histogram as a dictionary, with cumulative bucket counts (keyed by their upper bounds)."""
+        buckets = {}
+        cumulative_count = 0
+
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            cumulative_count += bucket_count
+            buckets[f"{bound:g}"] = cumulative_count
+
+        buckets["+Inf"] = self.count
+        return {"count": self.count, "sum": self.sum, "max": self.max, "buckets": buckets}
+
+
+class MetricsCollector(RequestHooks):
+    """
+    Collects the metrics of the requests sent by scrapers: latencies, received bytes, attempts, status codes,
+    retries and Anti-Bot detections. It may be shared between scrapers, threads and asyncio tasks.
+
+    Add it to the hooks of a scraper, and read its counters (or its `snapshot()`, e.g. to export to a dashboard).
+    """
+
+    def __init__(self, latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initializes the metrics collector with empty metrics.
+
+        Args:
+            latency_buckets (Sequence[float]): The upper bounds (in seconds) of the latency histogram buckets.
+        """
+        self.latency_buckets = tuple(latency_buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def mean_attempts_per_request(self) -> Optional[float]:
+        """Return the mean number of attempts per request, if any request was sent."""
+        return self.attempt_count / self.request_count if self.request_count else None
+
+    def get_attempts_per_request(self) -> Dict[int, int]:
+        """Return the number of requests (including in-flight ones) by their number of attempts so far."""
+        with self._lock:
+            return self._count_attempts_per_request()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a consistent copy of all the metrics, as a JSON-serializable dictionary."""
+        with self._lock:
+            return {
+                "requests": self.request_count,
+                "attempts": self.attempt_count,
+                "attempts_per_request": {
+                    str(attempts): count for attempts, count in self._count_attempts_per_request().items()
+                },
+                "responses": self.response_count,
+                "bytes_received": self.bytes_received,
+                "status_codes": {str(status_code): count for status_code, count in self.status_codes.items()},
+                "retries": self.retry_count,
+                "antibot_detections": self.antibot_count,
+                "latency": self.latency.to_dict()
+            }
+
+    def reset(self):
+        """Reset all the metrics."""
+        with self._lock:
+            self.request_count = 0
+            self.attempt_count = 0
+            self.attempts_reached = Counter()  # attempt number -> number of requests which reached it
+            self.response_count = 0
+            self.bytes_received = 0
+            self.status_codes = Counter()
+            self.retry_count = 0
+            self.antibot_count = 0
+            self.latency = LatencyHistogram(self.latency_buckets)
+
+    def _count_attempts_per_request(self) -> Dict[int, int]:
+        """Count the requests by their number of attempts, from the number of requests which reached each attempt."""
+        return {
+            attempt: count - self.attempts_reached[attempt + 1]
+            for attempt, count in sorted(self.attempts_reached.items())
+            if count > self.attempts_reached[attempt + 1]
+        }
+
+    def before_request(self, method: str, url: str, attempt: int):
+        with self._lock:
+            self.attempt_count += 1
+            self.attempts_reached[attempt] += 1
+            if attempt == 1:
+                self.request_count += 1
+
+    def after_response(self, response: httpx.Response, attempt: int, elapsed: float):
+        with self._lock:
+            self.response_count += 1
+            self.bytes_received += len(response.content)
+            self.status_codes[response.status_code] += 1
+            self.latency.observe(elapsed)
+
+    def on_retry(self, method: str, url: str, attempt: int, error: Exception):
+        with self._lock:
+            self.retry_count += 1
+
+    def on_antibot(self, response: httpx.Response, attempt: int):
+        with self._lock:
+            self.antibot_count += 1
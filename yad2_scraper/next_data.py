@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import List, Union
+from typing import List, Union, Optional
 
 from yad2_scraper.utils import safe_access
 
@@ -55,6 +55,23 @@ class NextData:
         """Extract query data from Next.js state."""
         return self.data["props"]["pageProps"]["dehydratedState"]["queries"]
 
+    @property
+    def pagination(self) -> Optional[dict]:
+        """Extract the pagination data (pages, perPage, total) of the first query which contains it."""
+        for query in self.queries:
+            data = query["state"].get("data")
+
+            if isinstance(data, dict) and "pagination" in data:
+                return data["pagination"]
+
+        return None
+
+    @property
+    def total_pages(self) -> Optional[int]:
+        """Return the total number of result pages, if the pagination data exists."""
+        pagination = self.pagination
+        return pagination.get("pages") if pagination else None
+
     def __getitem__(self, item):
         """Allow dictionary-style access to data."""
         return self.data[item]
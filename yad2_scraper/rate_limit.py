@@ -0,0 +1,186 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional
+
+from yad2_scraper.constants import (
+    DEFAULT_ADAPTIVE_RATE_INCREASE_STEP,
+    DEFAULT_ADAPTIVE_RATE_DECREASE_FACTOR,
+    DEFAULT_ADAPTIVE_RATE_DECREASE_COOLDOWN
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    A token-bucket rate limiter, which may be shared between scrapers, threads and asyncio tasks.
+
+    Each request takes a token from the bucket, which refills at `rate` tokens per second up to `burst` tokens.
+    When the bucket is empty, the token is reserved in advance and the caller waits (outside any lock) until it is
+    due, so concurrent callers are spaced evenly instead of waking up together.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initializes the rate limiter with a full bucket.
+
+        Args:
+            rate (float): The maximum sustained number of requests per second.
+            burst (Optional[int]): The maximum number of requests sent back-to-back. Defaults to `max(1, int(rate))`.
+        """
+        if burst is None:
+            burst = max(1, int(rate))
+
+        if burst <= 0:
+            raise ValueError(f"burst must be a positive integer, but got {burst}")
+
+        self._lock = threading.Lock()
+        self._rate = 0.0
+        self.burst = burst
+        self.rate = rate
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """Returns the maximum sustained number of requests per second."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: float):
+        """Sets the maximum sustained number of requests per second, keeping the tokens refilled so far."""
+        if rate <= 0:
+            raise ValueError(f"rate must be a positive number, but got {rate}")
+
+        with self._lock:
+            if self._rate:
+                self._refill()
+            self._rate = float(rate)
+
+    def acquire(self) -> float:
+        """
+        Takes a token from the bucket, sleeping until it is available.
+
+        Returns:
+            float: The number of seconds waited.
+        """
+        wait_time = self._reserve()
+
+        if wait_time > 0:
+            logger.debug(f"Rate limit reached, waiting {wait_time:.2f} seconds before request")
+            time.sleep(wait_time)
+
+        return wait_time
+
+    async def acquire_async(self) -> float:
+        """
+        Takes a token from the bucket, asynchronously sleeping until it is available.
+
+        Returns:
+            float: The number of seconds waited.
+        """
+        wait_time = self._reserve()
+
+        if wait_time > 0:
+            logger.debug(f"Rate limit reached, waiting {wait_time:.2f} seconds before request")
+            await asyncio.sleep(wait_time)
+
+        return wait_time
+
+    def record_success(self):
+        """Records a successful response (ignored by a fixed-rate limiter)."""
+        pass
+
+    def record_throttle(self):
+        """Records a throttled response, e.g. an Anti-Bot page or HTTP 429 (ignored by a fixed-rate limiter)."""
+        pass
+
+    def _reserve(self) -> float:
+        """
+        Reserves a token from the bucket (which may go into debt for callers that have to wait).
+
+        Returns:
+            float: The number of seconds until the reserved token is due.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+    def _refill(self):
+        """Adds the tokens accumulated since the last update, up to the burst size (must be called under lock)."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """
+    A token-bucket rate limiter, which tunes its rate with AIMD (additive increase, multiplicative decrease) feedback.
+
+    Every successful response raises the rate by `increase_step / rate`, so the rate grows by about `increase_step`
+    requests per second for each second of clean traffic. Every throttled response (Anti-Bot page, HTTP 429 or 5xx)
+    multiplies the rate by `decrease_factor`, at most once per `decrease_cooldown` seconds, so a burst of throttled
+    responses to requests which were already in flight cuts the rate only once.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            min_rate: float,
+            max_rate: float,
+            burst: Optional[int] = None,
+            increase_step: float = DEFAULT_ADAPTIVE_RATE_INCREASE_STEP,
+            decrease_factor: float = DEFAULT_ADAPTIVE_RATE_DECREASE_FACTOR,
+            decrease_cooldown: float = DEFAULT_ADAPTIVE_RATE_DECREASE_COOLDOWN
+    ):
+        """
+        Initializes the adaptive rate limiter with a full bucket.
+
+        Args:
+            rate (float): The initial number of requests per second.
+            min_rate (float): The lowest rate the limiter may decrease to.
+            max_rate (float): The highest rate the limiter may increase to.
+            burst (Optional[int]): The maximum number of requests sent back-to-back. Defaults to `max(1, int(rate))`.
+            increase_step (float): The rate increase (requests per second) per second of clean traffic.
+            decrease_factor (float): The factor (between 0 and 1) the rate is multiplied by when throttled.
+            decrease_cooldown (float): The minimal number of seconds between two rate decreases.
+        """
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError(f"Expected 0 < min_rate <= rate <= max_rate, but got {min_rate}, {rate}, {max_rate}")
+
+        if not 0 < decrease_factor < 1:
+            raise ValueError(f"decrease_factor must be between 0 and 1, but got {decrease_factor}")
+
+        super().__init__(rate, burst)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.decrease_cooldown = decrease_cooldown
+        self.success_count = 0
+        self.throttle_count = 0
+        self._feedback_lock = threading.Lock()
+        self._decreased_at: Optional[float] = None
+
+    def record_success(self):
+        """Records a successful response, additively increasing the rate."""
+        with self._feedback_lock:
+            self.success_count += 1
+            self.rate = min(self.max_rate, self.rate + self.increase_step / self.rate)
+
+    def record_throttle(self):
+        """Records a throttled response, multiplicatively decreasing the rate (unless it was just decreased)."""
+        with self._feedback_lock:
+            self.throttle_count += 1
+            now = time.monotonic()
+
+            if self._decreased_at is not None and now - self._decreased_at < self.decrease_cooldown:
+                return
+
+            self._decreased_at = now
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+
+        logger.warning(f"Throttled response received, decreased request rate to {self.rate:.2f} per second")
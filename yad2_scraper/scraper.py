@@ -1,18 +1,24 @@
 import logging
 import httpx
 import time
+import threading
 from fake_useragent import FakeUserAgent
-from typing import Optional, Dict, Any, Callable, Union, Type, TypeVar
+from typing import Optional, Dict, Any, Callable, Union, Type, TypeVar, List, Sequence
 
 from yad2_scraper.category import Yad2Category
 from yad2_scraper.query import QueryFilters
+from yad2_scraper.cache import ResponseCache, CachedResponse
+from yad2_scraper.rate_limit import RateLimiter
+from yad2_scraper.hooks import RequestHooks
+from yad2_scraper.tracing import get_tracer
 from yad2_scraper.exceptions import AntiBotDetectedError, UnexpectedContentError, MaxRequestAttemptsExceededError
 from yad2_scraper.constants import (
     DEFAULT_REQUEST_HEADERS,
     ALLOW_REQUEST_REDIRECTS,
     VERIFY_REQUEST_SSL,
     ANTIBOT_CONTENT_IDENTIFIER,
-    PAGE_CONTENT_IDENTIFIER
+    PAGE_CONTENT_IDENTIFIER,
+    THROTTLE_STATUS_CODES
 )
 
 Category = TypeVar("Category", bound=Yad2Category)
@@ -23,37 +29,55 @@ fua = FakeUserAgent()
 logger = logging.getLogger(__name__)
 
 
-class Yad2Scraper:
-    """A scraper for fetching data from the Yad2 website, with robust features"""
+def is_throttle_error(error: Exception) -> bool:
+    """Check whether an error indicates the scraper is being throttled (Anti-Bot page, HTTP 429 or 5xx)."""
+    if isinstance(error, AntiBotDetectedError):
+        return True
+
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return status_code in THROTTLE_STATUS_CODES or httpx.codes.is_server_error(status_code)
+
+    return False
+
+
+class BaseYad2Scraper:
+    """Shared state and request helpers of the synchronous and asynchronous Yad2 scrapers."""
 
     def __init__(
             self,
-            client: Optional[httpx.Client] = None,
+            client: Union[httpx.Client, httpx.AsyncClient],
             request_defaults: Optional[Dict[str, Any]] = None,
             randomize_user_agent: bool = True,
             wait_strategy: Optional[WaitStrategy] = None,
-            max_request_attempts: int = 1
+            max_request_attempts: int = 1,
+            cache: Optional[ResponseCache] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            hooks: Optional[Sequence[RequestHooks]] = None
     ):
         """
-        Initializes the Yad2Scraper with provided parameters.
+        Initializes the scraper state shared by all scraper types.
 
         Args:
-            client (Optional[httpx.Client]): An optional custom HTTP client. If not provided, a default client is used.
+            client (Union[httpx.Client, httpx.AsyncClient]): The HTTP client used to send requests.
             request_defaults (Optional[Dict[str, Any]]): Default parameters for requests such as headers, params, etc.
             randomize_user_agent (bool): If True, a random User-Agent will be set for each request. Defaults to True.
             wait_strategy (Optional[WaitStrategy]): A function to determine the wait time between requests.
             max_request_attempts (int): The maximum number of retry attempts for failed requests. Defaults to 1.
+            cache (Optional[ResponseCache]): An optional response cache for GET requests.
+            rate_limiter (Optional[RateLimiter]): An optional rate limiter, which may be shared between scrapers.
+            hooks (Optional[Sequence[RequestHooks]]): Request lifecycle hooks (e.g. a `MetricsCollector`).
         """
-        self.client = client or httpx.Client(
-            headers=DEFAULT_REQUEST_HEADERS,
-            follow_redirects=ALLOW_REQUEST_REDIRECTS,
-            verify=VERIFY_REQUEST_SSL
-        )
+        self.client = client
         self.request_defaults = request_defaults or {}
         self.randomize_user_agent = randomize_user_agent
         self.wait_strategy = wait_strategy
         self.max_request_attempts = max_request_attempts
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.hooks = list(hooks or [])
         self._request_count = 0
+        self._request_count_lock = threading.Lock()
 
         logger.debug(f"Scraper initialized with client: {self.client}")
 
@@ -83,46 +107,63 @@ class Yad2Scraper:
         self.client.cookies.set("noscript", value)
         logger.debug(f"NoScript (noscript) client cookie set to: '{value}'")
 
-    def fetch_category(
-            self,
-            url: str,
-            category_type: Type[Category],
-            params: Optional[QueryParamTypes] = None
-    ) -> Category:
+    def _increment_request_count(self):
+        """Increments the request counter, safely across threads sharing the scraper."""
+        with self._request_count_lock:
+            self._request_count += 1
+
+    def _record_rate_feedback(self, error: Optional[Exception] = None):
         """
-        Fetches and returns a category page from a given URL.
+        Reports the outcome of a request attempt to the rate limiter, allowing an adaptive one to tune its rate.
 
         Args:
-            url (str): The URL of the category page.
-            category_type (Type[Category]): The class type of the category to be fetched.
-            params (Optional[QueryParamTypes]): Query parameters to be included in the request.
+            error (Optional[Exception]): The error of the attempt, or None if it succeeded.
+        """
+        if not self.rate_limiter:
+            return
 
-        Returns:
-            Category: The fetched category, parsed from HTML.
+        if error is None:
+            self.rate_limiter.record_success()
+        elif is_throttle_error(error):
+            self.rate_limiter.record_throttle()
+
+    def _run_hooks(self, hook_name: str, *args):
         """
-        logger.debug(f"Fetching category from URL: '{url}'")
-        response = self.get(url, params)
-        logger.debug(f"Category fetched successfully from URL: '{url}'")
-        return category_type.from_html_io(response)
+        Calls a lifecycle hook of all the request hooks, logging (and ignoring) their errors.
 
-    def get(self, url: str, params: Optional[QueryParamTypes] = None) -> httpx.Response:
-        """Sends a GET request to the specified URL."""
-        return self.request("GET", url, params=params)
+        Args:
+            hook_name (str): The name of the hook (e.g. "before_request").
+            *args: The arguments of the hook.
+        """
+        for hooks in self.hooks:
+            try:
+                getattr(hooks, hook_name)(*args)
+            except Exception:
+                logger.exception(f"Request hook '{hook_name}' of {hooks} failed")
 
-    def request(self, method: str, url: str, params: Optional[QueryParamTypes] = None) -> httpx.Response:
+    def _run_failure_hooks(self, method: str, url: str, attempt: int, error: Exception):
         """
-        Sends an HTTP request with multiple attempts logic.
+        Calls the hooks of a failed request attempt: the Anti-Bot hook, and the retry hook if attempts remain.
 
         Args:
-            method (str): The HTTP method (e.g., "GET", "POST").
-            url (str): The URL to send the request to.
-            params (Optional[QueryParamTypes]): Query parameters to be included in the request.
+            method (str): The HTTP method of the request.
+            url (str): The URL of the request.
+            attempt (int): The number of the failed attempt.
+            error (Exception): The error of the attempt.
+        """
+        if isinstance(error, AntiBotDetectedError):
+            self._run_hooks("on_antibot", error.response, attempt)
 
-        Returns:
-            httpx.Response: The HTTP response object.
+        if attempt < self.max_request_attempts:
+            self._run_hooks("on_retry", method, url, attempt, error)
+
+    def _validate_max_request_attempts(self):
+        """
+        Validates the configured maximum number of request attempts.
 
         Raises:
-            MaxRequestAttemptsExceededError: If the request exceeds the maximum number of attempts.
+            TypeError: If `max_request_attempts` is not an integer.
+            ValueError: If `max_request_attempts` is not a positive integer.
         """
         if not isinstance(self.max_request_attempts, int):
             raise TypeError(f"max_request_attempts must be of type 'int', but got {type(self.max_request_attempts)}")
@@ -130,16 +171,19 @@ class Yad2Scraper:
         if self.max_request_attempts <= 0:
             raise ValueError(f"max_request_attempts must be a positive integer, but got {self.max_request_attempts}")
 
-        request_options = self._prepare_request_options(params=params)
-        error_list = []
+    def _raise_request_failure(self, method: str, url: str, error_list: List[Exception]):
+        """
+        Raises the appropriate error after all request attempts have failed.
 
-        for attempt in range(1, self.max_request_attempts + 1):
-            try:
-                return self._send_request(method, url, request_options, attempt)
-            except Exception as error:
-                logger.error(f"{method} request to '{url}' failed {self._format_attempt_info(attempt)}: {error}")
-                error_list.append(error)
+        Args:
+            method (str): The HTTP method of the failed request.
+            url (str): The URL of the failed request.
+            error_list (List[Exception]): The errors raised by each attempt, in order.
 
+        Raises:
+            Exception: The single error, if only one attempt was allowed.
+            MaxRequestAttemptsExceededError: If multiple attempts were made.
+        """
         if self.max_request_attempts == 1:
             raise error_list[0]  # only one error exists, raise it
 
@@ -147,61 +191,127 @@ class Yad2Scraper:
         logger.error(str(max_attempts_error))
         raise max_attempts_error from error_list[-1]  # multiple errors exist, raise from the last one
 
-    def close(self) -> None:
-        """Closes the HTTP client and logs the closure."""
-        logger.debug("Closing scraper client")
-        self.client.close()
-        logger.info("Scraper client closed")
+    def _prepare_request_options(self, params: Optional[QueryParamTypes] = None) -> Dict[str, Any]:
+        """
+        Prepares the request options to be passed to the HTTP client's request method, based on the default options.
+
+        Args:
+            params (Optional[QueryParamTypes]): Optional query parameters to include in the request.
 
-    def _send_request(self, method: str, url: str, request_options: Dict[str, Any], attempt: int) -> httpx.Response:
+        Returns:
+            Dict[str, Any]: A dictionary of the request options, including headers and query parameters.
         """
-        Sends an HTTP request with the specified method to the given URL, applying all necessary actions.
+        logger.debug("Preparing request options from defaults")
+        request_options = self.request_defaults.copy()
+
+        for option_name in ("headers", "params"):  # copy nested options, so concurrent requests will not share them
+            if option_name in request_options:
+                request_options[option_name] = dict(request_options[option_name])
+
+        if params:
+            request_options.setdefault("params", {}).update(params)
+            logger.debug(f"Updated request options with query params: {params}")
+
+        return request_options
+
+    def _get_cache_key(self, method: str, url: str, request_options: Dict[str, Any]) -> Optional[str]:
+        """
+        Creates the cache key of a request, if the request may be cached.
 
         Args:
-            method (str): The HTTP method (e.g., 'GET', 'POST').
-            url (str): The target URL for the request.
-            request_options (Dict[str, Any]): Additional request options, including headers and parameters.
-            attempt (int): The current attempt number for the request.
+            method (str): The HTTP method of the request.
+            url (str): The URL of the request.
+            request_options (Dict[str, Any]): The request options, including the query parameters.
 
         Returns:
-            httpx.Response: The HTTP response object received from the server.
+            Optional[str]: The cache key, or None if there is no cache or the request is not a GET request.
+        """
+        if self.cache is None or method.upper() != "GET":
+            return None
 
-        Raises:
-            AntiBotDetectedError: If the response contains Anti-Bot content.
-            UnexpectedContentError: If a GET request does not contain expected content.
+        return self.cache.make_key(method, url, request_options.get("params"))
+
+    def _load_cached_response(
+            self,
+            cache_key: Optional[str],
+            request_options: Dict[str, Any]
+    ) -> Optional[CachedResponse]:
         """
-        if self.randomize_user_agent:
-            self._set_random_user_agent(request_options)
+        Loads the cached response of a request. If it is stale, the revalidation headers are added to the request.
 
-        if self.wait_strategy:
-            self._apply_wait_strategy(attempt)
+        Args:
+            cache_key (Optional[str]): The cache key of the request (None if the request is not cached).
+            request_options (Dict[str, Any]): The request options to update with the revalidation headers.
 
-        logger.info(f"Sending {method} request to URL: '{url}' {self._format_attempt_info(attempt)}")
-        response = self.client.request(method, url, **request_options)
-        self._request_count += 1
-        logger.debug(f"Received response {response.status_code} from '{url}' {self._format_attempt_info(attempt)}")
-        self._validate_response(response)
+        Returns:
+            Optional[CachedResponse]: The cached response, or None if it does not exist.
+        """
+        if not cache_key:
+            return None
 
-        return response
+        cached_response = self.cache.get(cache_key)
 
-    def _prepare_request_options(self, params: Optional[QueryParamTypes] = None) -> Dict[str, Any]:
+        if cached_response and not cached_response.is_fresh(self.cache.ttl):
+            request_options.setdefault("headers", {}).update(cached_response.get_validation_headers())
+            logger.debug("Updated request options with cached response revalidation headers")
+
+        return cached_response
+
+    def _create_cached_response(
+            self,
+            method: str,
+            url: str,
+            request_options: Dict[str, Any],
+            cached_response: CachedResponse
+    ) -> httpx.Response:
         """
-        Prepares the request options to be passed to the HTTP client's request method, based on the default options.
+        Creates the HTTP response object of a fresh cached response, without sending a request.
 
         Args:
-            params (Optional[QueryParamTypes]): Optional query parameters to include in the request.
+            method (str): The HTTP method of the request.
+            url (str): The URL of the request.
+            request_options (Dict[str, Any]): The request options, including the query parameters.
+            cached_response (CachedResponse): The fresh cached response.
 
         Returns:
-            Dict[str, Any]: A dictionary of the request options, including headers and query parameters.
+            httpx.Response: The HTTP response object of the cached response.
         """
-        logger.debug("Preparing request options from defaults")
-        request_options = self.request_defaults.copy()
+        logger.info(f"Using cached response for {method} request to URL: '{url}'")
+        request = httpx.Request(method, url, params=request_options.get("params"))
+        return cached_response.to_response(request)
 
-        if params:
-            request_options.setdefault("params", {}).update(params)
-            logger.debug(f"Updated request options with query params: {params}")
+    @staticmethod
+    def _resolve_not_modified_response(
+            response: httpx.Response,
+            cached_response: Optional[CachedResponse]
+    ) -> httpx.Response:
+        """
+        Replaces a "304 Not Modified" response with the revalidated cached response.
 
-        return request_options
+        Args:
+            response (httpx.Response): The HTTP response object received from the server.
+            cached_response (Optional[CachedResponse]): The cached response which was revalidated (if any).
+
+        Returns:
+            httpx.Response: The cached response (with updated headers) if it was not modified, else the response.
+        """
+        if not cached_response or response.status_code != httpx.codes.NOT_MODIFIED:
+            return response
+
+        logger.debug("Cached response was not modified, using it")
+        return cached_response.revalidate(response.headers).to_response(response.request)
+
+    def _store_response(self, cache_key: Optional[str], response: httpx.Response):
+        """
+        Stores a validated response in the cache.
+
+        Args:
+            cache_key (Optional[str]): The cache key of the request (None if the request is not cached).
+            response (httpx.Response): The validated HTTP response object to store.
+        """
+        if cache_key:
+            self.cache.set(cache_key, CachedResponse.from_response(response))
+            logger.debug("Stored response in the response cache")
 
     @staticmethod
     def _set_random_user_agent(request_options: Dict[str, str]):
@@ -215,19 +325,22 @@ class Yad2Scraper:
         request_options.setdefault("headers", {})["User-Agent"] = user_agent
         logger.debug(f"Updated request options with random User-Agent header: '{user_agent}'")
 
-    def _apply_wait_strategy(self, attempt: int):
+    def _get_wait_time(self, attempt: int) -> Optional[float]:
         """
-        Applies a wait time before making a request based on the wait strategy for the given attempt.
+        Calculates the wait time before a request based on the wait strategy for the given attempt.
 
         Args:
             attempt (int): The current attempt number to calculate the wait time.
+
+        Returns:
+            Optional[float]: The number of seconds to wait, or None if no wait is required.
         """
         wait_time = self.wait_strategy(attempt)
         if not wait_time:
-            return
+            return None
 
         logger.debug(f"Waiting {wait_time:.2f} seconds before request {self._format_attempt_info(attempt)}")
-        time.sleep(wait_time)
+        return wait_time
 
     @staticmethod
     def _validate_response(response: httpx.Response):
@@ -271,6 +384,185 @@ class Yad2Scraper:
         """
         return f"(attempt {attempt}/{self.max_request_attempts})"
 
+
+class Yad2Scraper(BaseYad2Scraper):
+    """A scraper for fetching data from the Yad2 website, with robust features"""
+
+    def __init__(
+            self,
+            client: Optional[httpx.Client] = None,
+            request_defaults: Optional[Dict[str, Any]] = None,
+            randomize_user_agent: bool = True,
+            wait_strategy: Optional[WaitStrategy] = None,
+            max_request_attempts: int = 1,
+            cache: Optional[ResponseCache] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            hooks: Optional[Sequence[RequestHooks]] = None
+    ):
+        """
+        Initializes the Yad2Scraper with provided parameters.
+
+        Args:
+            client (Optional[httpx.Client]): An optional custom HTTP client. If not provided, a default client is used.
+            request_defaults (Optional[Dict[str, Any]]): Default parameters for requests such as headers, params, etc.
+            randomize_user_agent (bool): If True, a random User-Agent will be set for each request. Defaults to True.
+            wait_strategy (Optional[WaitStrategy]): A function to determine the wait time between requests.
+            max_request_attempts (int): The maximum number of retry attempts for failed requests. Defaults to 1.
+            cache (Optional[ResponseCache]): An optional response cache for GET requests.
+            rate_limiter (Optional[RateLimiter]): An optional rate limiter, which may be shared between scrapers.
+            hooks (Optional[Sequence[RequestHooks]]): Request lifecycle hooks (e.g. a `MetricsCollector`).
+        """
+        super().__init__(
+            client=client or httpx.Client(
+                headers=DEFAULT_REQUEST_HEADERS,
+                follow_redirects=ALLOW_REQUEST_REDIRECTS,
+                verify=VERIFY_REQUEST_SSL
+            ),
+            request_defaults=request_defaults,
+            randomize_user_agent=randomize_user_agent,
+            wait_strategy=wait_strategy,
+            max_request_attempts=max_request_attempts,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            hooks=hooks
+        )
+
+    def fetch_category(
+            self,
+            url: str,
+            category_type: Type[Category],
+            params: Optional[QueryParamTypes] = None
+    ) -> Category:
+        """
+        Fetches and returns a category page from a given URL.
+
+        Args:
+            url (str): The URL of the category page.
+            category_type (Type[Category]): The class type of the category to be fetched.
+            params (Optional[QueryParamTypes]): Query parameters to be included in the request.
+
+        Returns:
+            Category: The fetched category, parsed from HTML.
+        """
+        logger.debug(f"Fetching category from URL: '{url}'")
+        response = self.get(url, params)
+        logger.debug(f"Category fetched successfully from URL: '{url}'")
+        return category_type.from_html_io(response)
+
+    def get(self, url: str, params: Optional[QueryParamTypes] = None) -> httpx.Response:
+        """Sends a GET request to the specified URL."""
+        return self.request("GET", url, params=params)
+
+    def request(self, method: str, url: str, params: Optional[QueryParamTypes] = None) -> httpx.Response:
+        """
+        Sends an HTTP request with multiple attempts logic.
+
+        Args:
+            method (str): The HTTP method (e.g., "GET", "POST").
+            url (str): The URL to send the request to.
+            params (Optional[QueryParamTypes]): Query parameters to be included in the request.
+
+        Returns:
+            httpx.Response: The HTTP response object.
+
+        Raises:
+            MaxRequestAttemptsExceededError: If the request exceeds the maximum number of attempts.
+        """
+        self._validate_max_request_attempts()
+        request_options = self._prepare_request_options(params=params)
+        cache_key = self._get_cache_key(method, url, request_options)
+        cached_response = self._load_cached_response(cache_key, request_options)
+
+        if cached_response and cached_response.is_fresh(self.cache.ttl):
+            return self._create_cached_response(method, url, request_options, cached_response)
+
+        error_list = []
+
+        for attempt in range(1, self.max_request_attempts + 1):
+            try:
+                response = self._send_request(method, url, request_options, attempt, cached_response)
+            except Exception as error:
+                logger.error(f"{method} request to '{url}' failed {self._format_attempt_info(attempt)}: {error}")
+                self._record_rate_feedback(error)
+                self._run_failure_hooks(method, url, attempt, error)
+                error_list.append(error)
+            else:
+                self._record_rate_feedback()
+                self._store_response(cache_key, response)
+                return response
+
+        self._raise_request_failure(method, url, error_list)
+
+    def close(self) -> None:
+        """Closes the HTTP client and logs the closure."""
+        logger.debug("Closing scraper client")
+        self.client.close()
+        logger.info("Scraper client closed")
+
+    def _send_request(
+            self,
+            method: str,
+            url: str,
+            request_options: Dict[str, Any],
+            attempt: int,
+            cached_response: Optional[CachedResponse] = None
+    ) -> httpx.Response:
+        """
+        Sends an HTTP request with the specified method to the given URL, applying all necessary actions.
+
+        Args:
+            method (str): The HTTP method (e.g., 'GET', 'POST').
+            url (str): The target URL for the request.
+            request_options (Dict[str, Any]): Additional request options, including headers and parameters.
+            attempt (int): The current attempt number for the request.
+            cached_response (Optional[CachedResponse]): The stale cached response being revalidated (if any).
+
+        Returns:
+            httpx.Response: The HTTP response object received from the server (or revalidated from the cache).
+
+        Raises:
+            AntiBotDetectedError: If the response contains Anti-Bot content.
+            UnexpectedContentError: If a GET request does not contain expected content.
+        """
+        if self.randomize_user_agent:
+            self._set_random_user_agent(request_options)
+
+        if self.wait_strategy or self.rate_limiter:
+            with get_tracer().span("wait", attempt=attempt):
+                if self.wait_strategy:
+                    self._apply_wait_strategy(attempt)
+
+                if self.rate_limiter:
+                    self.rate_limiter.acquire()
+
+        logger.info(f"Sending {method} request to URL: '{url}' {self._format_attempt_info(attempt)}")
+        self._run_hooks("before_request", method, url, attempt)
+        start_time = time.perf_counter()
+
+        with get_tracer().span("send_request", method=method, url=url, attempt=attempt):
+            response = self.client.request(method, url, **request_options)
+
+        self._run_hooks("after_response", response, attempt, time.perf_counter() - start_time)
+        self._increment_request_count()
+        logger.debug(f"Received response {response.status_code} from '{url}' {self._format_attempt_info(attempt)}")
+        response = self._resolve_not_modified_response(response, cached_response)
+
+        with get_tracer().span("validate_response", status_code=response.status_code):
+            self._validate_response(response)
+
+        return response
+
+    def _apply_wait_strategy(self, attempt: int):
+        """
+        Applies a wait time before making a request based on the wait strategy for the given attempt.
+
+        Args:
+            attempt (int): The current attempt number to calculate the wait time.
+        """
+        wait_time = self._get_wait_time(attempt)
+        if wait_time:
+            time.sleep(wait_time)
+
     def __enter__(self):
         """
         Prepares the scraper to be used in a `with` statement, allowing for resource management.
@@ -0,0 +1,160 @@
+import contextvars
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Optional, Dict, List, Any, NamedTuple, ContextManager, Iterator
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+SpanAttributes = Dict[str, Any]
+
+_NULL_SPAN = nullcontext()
+
+
+class Tracer:
+    """
+    Traces the phases of scraping a page as timed spans: waiting for the wait strategy and rate limiter (`wait`),
+    sending the request over the network (`send_request`), validating the response (`validate_response`), parsing the
+    HTML (`parse_html`), loading the Next.js data (`load_next_data`) and extracting the listings (`get_data`,
+    `get_records`, `get_tags`).
+
+    The base tracer does nothing (the default, so tracing costs nothing unless enabled). Subclass it and override `span`
+    to report the spans to another sink, and enable it with `set_tracer`.
+    """
+
+    def span(self, name: str, **attributes) -> ContextManager:
+        """Return a context manager timing a phase (nested in the phase which is running in the current context)."""
+        return _NULL_SPAN
+
+
+class RecordedSpan(NamedTuple):
+    """Represents a finished span recorded by an in-memory tracer."""
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    start_time: float  # seconds, of the performance counter
+    duration: float  # seconds
+    attributes: SpanAttributes
+    error: Optional[str]  # the name of the exception type, if the phase failed
+
+
+class SpanSummary(NamedTuple):
+    """Represents the aggregated durations (in seconds) of the recorded spans of a phase."""
+    count: int
+    total: float
+    mean: float
+    max: float
+
+
+class InMemoryTracer(Tracer):
+    """
+    A tracer which records the finished spans in memory, for profiling and tests.
+
+    Spans are nested by the context they run in, so the spans of a request are nested correctly across threads and
+    asyncio tasks. Spans recorded in other processes (e.g. crawler parse processes) are not collected.
+    """
+
+    def __init__(self, max_spans: Optional[int] = None):
+        """
+        Initializes an empty in-memory tracer.
+
+        Args:
+            max_spans (Optional[int]): The maximum number of kept spans (the oldest are dropped). If not provided,
+                all the spans are kept.
+        """
+        self._spans = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+        self._span_ids = itertools.count(1)
+        self._current_span_id = contextvars.ContextVar(f"current_span_id_{id(self)}", default=None)
+
+    @property
+    def spans(self) -> List[RecordedSpan]:
+        """Return the recorded spans, in the order they finished."""
+        with self._lock:
+            return list(self._spans)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[None]:
+        span_id = next(self._span_ids)
+        parent_id = self._current_span_id.get()
+        context_token = self._current_span_id.set(span_id)
+        error = None
+        start_time = time.perf_counter()
+
+        try:
+            yield
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = time.perf_counter() - start_time
+            self._current_span_id.reset(context_token)
+
+            with self._lock:
+                self._spans.append(RecordedSpan(span_id, parent_id, name, start_time, duration, attributes, error))
+
+    def get_spans(self, name: Optional[str] = None, parent_id: Optional[int] = None) -> List[RecordedSpan]:
+        """Return the recorded spans with the given name and/or parent span."""
+        return [
+            span for span in self.spans
+            if (name is None or span.name == name) and (parent_id is None or span.parent_id == parent_id)
+        ]
+
+    def summarize(self) -> Dict[str, SpanSummary]:
+        """Aggregate the durations of the recorded spans by their phase (name)."""
+        durations_by_name: Dict[str, List[float]] = {}
+
+        for span in self.spans:
+            durations_by_name.setdefault(span.name, []).append(span.duration)
+
+        return {
+            name: SpanSummary(len(durations), sum(durations), sum(durations) / len(durations), max(durations))
+            for name, durations in durations_by_name.items()
+        }
+
+    def clear(self):
+        """Remove all the recorded spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class OpenTelemetryTracer(Tracer):
+    """A tracer which reports the spans to OpenTelemetry, nested in the current OpenTelemetry span."""
+
+    def __init__(self, tracer: Optional["otel_trace.Tracer"] = None):
+        """
+        Initializes the OpenTelemetry tracer.
+
+        Args:
+            tracer (Optional[opentelemetry.trace.Tracer]): The OpenTelemetry tracer to start the spans with.
+                If not provided, the tracer of the global tracer provider is used (requires `opentelemetry-api`).
+        """
+        if tracer is None:
+            if otel_trace is None:
+                raise ImportError("OpenTelemetry is required, install it with: pip install opentelemetry-api")
+
+            tracer = otel_trace.get_tracer("yad2_scraper")
+
+        self.tracer = tracer
+
+    def span(self, name: str, **attributes) -> ContextManager:
+        return self.tracer.start_as_current_span(name, attributes=attributes)
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Return the tracer of the scraping phases (a no-op tracer, unless one was set)."""
+    return _tracer
+
+
+def set_tracer(tracer: Optional[Tracer]):
+    """Set the tracer of the scraping phases (None disables tracing)."""
+    global _tracer
+    _tracer = tracer if tracer is not None else Tracer()
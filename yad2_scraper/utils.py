@@ -1,6 +1,24 @@
+import re
+import json
 import functools
+from datetime import date
 from bs4 import BeautifulSoup, Tag
-from typing import Union, List, Tuple, Any
+from typing import Union, List, Tuple, Any, Optional, Callable
+
+from yad2_scraper.constants import NEXT_DATA_SCRIPT_ID
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JsonLoads = Callable[[Union[str, bytes]], Any]
+
+_NEXT_DATA_SCRIPT_START_PATTERN = re.compile(
+    rf"""<script\b[^>]*?\sid\s*=\s*(["']?){NEXT_DATA_SCRIPT_ID}\1(?=[\s/>])[^>]*>""".encode(),
+    re.IGNORECASE
+)
+_SCRIPT_END_PATTERN = re.compile(rb"</script\s*>", re.IGNORECASE)
 
 def any_param_specified(*params: Any) -> bool:
     """Check if any parameter is not None."""
@@ -24,6 +42,41 @@ def find_all_html_tags_by_class_substring(e: Union[BeautifulSoup, Tag], tag_name
     """Find all HTML tags with a class containing the given substring."""
     return e.find_all(tag_name, class_=lambda class_name: class_name and substring in class_name)
 
+def find_next_data_script(html: Union[str, bytes]) -> Optional[bytes]:
+    """Slice the content of the Next.js data script directly from raw HTML, without parsing the document."""
+    if isinstance(html, str):
+        html = html.encode()
+
+    start_match = _NEXT_DATA_SCRIPT_START_PATTERN.search(html)
+    if not start_match:
+        return None
+
+    end_match = _SCRIPT_END_PATTERN.search(html, start_match.end())
+    if not end_match:
+        return None
+
+    return html[start_match.end():end_match.start()]
+
+def load_json(data: Union[str, bytes]) -> Any:
+    """Decode JSON data, using orjson if it is installed (decoding bytes directly), else the stdlib decoder."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dump_json(obj: Any) -> bytes:
+    """Encode an object as UTF-8 JSON (dates in ISO format), using orjson if it is installed, else the stdlib encoder."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_encode_json_default)
+    return json.dumps(obj, ensure_ascii=False, default=_encode_json_default).encode()
+
+def _encode_json_default(obj: Any) -> Any:
+    """Encode the objects not supported by the JSON encoders (dates, and sets as lists)."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def safe_access(exceptions: Tuple = (), default: Any = None):
     """Decorator to safely execute a function, returning a default value on exception."""
     def decorator(func):
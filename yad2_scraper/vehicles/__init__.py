@@ -1,5 +1,11 @@
 from .urls import VEHICLES_URL, VehicleCategory, get_vehicle_category_url
 from .query import VehiclesQueryFilters, OrderVehiclesBy
 from .category import Yad2VehiclesCategory
-from .tag import VehicleTag
-from .next_data import VehiclesNextData
+from .tag import VehicleTag, VehicleTagRecord
+from .record import VehicleRecord
+from .columns import VehicleColumns, ColumnsQuery, records_to_columns
+from .next_data import VehiclesNextData, VehicleData
+from .crawler import Yad2VehiclesCrawler
+from .diff import ChangeType, ListingChange, ListingState, Snapshot, create_snapshot, diff_listings
+from .store import VehicleStore, StoredVehicle
+from .export import JsonLinesWriter, CsvWriter, export_jsonl, export_csv
@@ -1,17 +1,71 @@
-from typing import List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import List, Optional, Union, TextIO, BinaryIO
 
-from yad2_scraper.category import Yad2Category
-from yad2_scraper.vehicles.tag import VehicleTag
+from yad2_scraper.category import Yad2Category, HtmlParser
+from yad2_scraper.vehicles.tag import VehicleTag, VehicleTagRecord
 from yad2_scraper.vehicles.next_data import VehiclesNextData
+from yad2_scraper.tracing import get_tracer
+
+FEED_ITEM_CLASS_SUBSTRING = "feedItemBox"
+
+UNRESTRICTED_PARSERS = ("html5lib",)  # parsers which ignore the strainer, and always build the whole document
+
+FEED_ITEMS_STRAINER = SoupStrainer(
+    "div",
+    class_=lambda class_name: class_name and FEED_ITEM_CLASS_SUBSTRING in class_name
+)
 
 
 class Yad2VehiclesCategory(Yad2Category):
     """Represents a Yad2 vehicles category parsed from an HTML page."""
 
+    restrict_parse: bool = False
+
+    def __init__(
+            self,
+            soup: Optional[BeautifulSoup] = None,
+            html: Optional[Union[str, bytes]] = None,
+            parser: Optional[HtmlParser] = None,
+            restrict_parse: Optional[bool] = None
+    ):
+        """
+        Initialize with a BeautifulSoup object and/or the raw HTML (parsed lazily, on first access of `soup`).
+
+        With `restrict_parse`, only the vehicle cards (feed items) are parsed into the soup. The Next.js data
+        is sliced directly from the raw HTML either way. The html5lib parser does not support restricted parsing.
+        """
+        super().__init__(soup, html, parser)
+
+        if restrict_parse is not None:
+            self.restrict_parse = restrict_parse
+
+        if self.restrict_parse and self.parser in UNRESTRICTED_PARSERS:
+            raise ValueError(f"The {self.parser} parser does not support restrict_parse, use another parser")
+
+    @classmethod
+    def from_html_io(
+            cls,
+            html_io: Union[TextIO, BinaryIO],
+            parser: Optional[HtmlParser] = None,
+            restrict_parse: Optional[bool] = None
+    ):
+        """Create an instance from an HTML file-like object (the HTML is parsed only when tags are requested)."""
+        return cls(html=html_io.read(), parser=parser, restrict_parse=restrict_parse)
+
+    def get_parse_only(self) -> Optional[SoupStrainer]:
+        """Return a strainer of the vehicle cards if the parse is restricted, else None (parse the whole document)."""
+        return FEED_ITEMS_STRAINER if self.restrict_parse else None
+
     def get_tags(self) -> List[VehicleTag]:
         """Retrieve and return a list of tags from the current vehicle page."""
-        tags = self.find_all_tags_by_class_substring("div", "feedItemBox")
-        return [VehicleTag(tag) for tag in tags]
+        with get_tracer().span("get_tags"):
+            tags = self.find_all_tags_by_class_substring("div", FEED_ITEM_CLASS_SUBSTRING)
+            return [VehicleTag(tag, self.class_index) for tag in tags]
+
+    def get_tag_records(self) -> List[VehicleTagRecord]:
+        """Retrieve and return a list of tag records from the current vehicle page (a single pass per vehicle card)."""
+        tags = self.find_all_tags_by_class_substring("div", FEED_ITEM_CLASS_SUBSTRING)
+        return [VehicleTagRecord.from_tag(tag) for tag in tags]
 
     def load_next_data(self) -> Optional[VehiclesNextData]:
         """Extract and parse Next.js data from the current vehicle page."""
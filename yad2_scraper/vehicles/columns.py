@@ -0,0 +1,257 @@
+import operator
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Any, TYPE_CHECKING
+
+from yad2_scraper.vehicles.record import VehicleRecord
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if TYPE_CHECKING:
+    from numpy.ma import MaskedArray
+
+VehicleColumns = Dict[str, "MaskedArray"]
+
+_INT_FIELDS = (
+    "price", "top_area_id", "area_id", "manufacturer_id", "model_id", "sub_model_id", "color_id", "km", "hand",
+    "engine_volume", "horse_power", "year_of_production", "month_of_production", "gear_box_id", "engine_type_id",
+    "seats", "number_of_doors", "air_bags", "has_electric_window", "safety_points"
+)
+_FLOAT_FIELDS = ("combined_fuel_consumption",)
+_DATETIME_FIELDS = ("updated_at", "created_at", "ends_at", "rebounced_at", "test_date")
+_BOOL_FIELDS = tuple(
+    name for name, field_type in VehicleRecord.__annotations__.items()
+    if field_type == Optional[bool] and name not in _INT_FIELDS
+)
+_STRING_FIELDS = (
+    "token", "customer_name", "top_area", "area", "city_id", "city", "manufacturer", "manufacturer_english", "model",
+    "model_english", "sub_model", "color", "gear_box", "engine_type", "owner", "body_type", "power_train_architecture",
+    "ignition"
+)
+
+# the (dtype, fill value of null entries) of each column
+COLUMN_TYPES = {
+    **{name: ("int64", 0) for name in _INT_FIELDS},
+    **{name: ("float64", float("nan")) for name in _FLOAT_FIELDS},
+    **{name: ("datetime64[s]", None) for name in _DATETIME_FIELDS},
+    **{name: ("bool", False) for name in _BOOL_FIELDS},
+    **{name: ("object", None) for name in _STRING_FIELDS},
+}
+DEFAULT_COLUMNS = tuple(name for name in VehicleRecord._fields if name in COLUMN_TYPES)
+
+
+def records_to_columns(records: Iterable[VehicleRecord], fields: Optional[Sequence[str]] = None) -> VehicleColumns:
+    """
+    Converts vehicle records into columns: one typed NumPy masked array per field, masking the missing values.
+
+    Args:
+        records (Iterable[VehicleRecord]): The vehicle records to convert.
+        fields (Optional[Sequence[str]]): The fields to convert. Defaults to every field with a column type.
+
+    Returns:
+        VehicleColumns: A mapping of each field to its column, whose `mask` is True where the value is missing.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+        ValueError: If a field has no column type.
+    """
+    if numpy is None:
+        raise ImportError("NumPy is required for columnar export, install it with: pip install numpy")
+
+    fields = DEFAULT_COLUMNS if fields is None else tuple(fields)
+    unknown_fields = [name for name in fields if name not in COLUMN_TYPES]
+
+    if unknown_fields:
+        raise ValueError(f"Fields have no column type: {unknown_fields}")
+
+    records = list(records)
+    field_indexes = [VehicleRecord._fields.index(name) for name in fields]
+    values_by_index = list(zip(*records)) if records else [()] * len(VehicleRecord._fields)
+
+    return {
+        name: _create_column(values_by_index[index], *COLUMN_TYPES[name])
+        for name, index in zip(fields, field_indexes)
+    }
+
+
+def _create_column(values: Sequence[Any], dtype: str, fill_value: Any) -> "MaskedArray":
+    """Create a masked array of the given values, replacing the null values with the fill value (and masking them)."""
+    mask = numpy.fromiter((value is None for value in values), dtype=bool, count=len(values))
+
+    if mask.any():
+        values = [fill_value if value is None else value for value in values]
+
+    data = numpy.empty(len(values), dtype=dtype)
+    data[:] = values
+    return numpy.ma.MaskedArray(data, mask=mask)
+
+
+_COMPARISON_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge
+}
+
+
+class ColumnsQuery:
+    """
+    A local query over vehicle columns, evaluating filters as vectorized mask operations.
+
+    Queries are immutable: every filter, order or limit returns a new query. Like SQL, a missing (masked) value never
+    matches a filter, and is ordered last.
+    """
+
+    def __init__(
+            self,
+            columns: VehicleColumns,
+            mask: Optional["numpy.ndarray"] = None,
+            order_field: Optional[str] = None,
+            descending: bool = False,
+            limit: Optional[int] = None
+    ):
+        """
+        Initializes the query over the given columns (which must all have the same length).
+
+        Args:
+            columns (VehicleColumns): The columns to query, e.g. the result of `to_columns()`.
+            mask (Optional[numpy.ndarray]): The rows selected so far. Defaults to all rows.
+            order_field (Optional[str]): The field to order the selected rows by. Defaults to the original order.
+            descending (bool): Whether to order the selected rows in descending order.
+            limit (Optional[int]): The maximum number of rows to select.
+        """
+        if numpy is None:
+            raise ImportError("NumPy is required for columnar queries, install it with: pip install numpy")
+
+        lengths = {len(column) for column in columns.values()}
+
+        if len(lengths) > 1:
+            raise ValueError(f"Columns must have the same length, but got lengths: {sorted(lengths)}")
+
+        self.columns = columns
+        self.row_count = lengths.pop() if lengths else 0
+        self.mask = numpy.ones(self.row_count, dtype=bool) if mask is None else mask
+        self.order_field = order_field
+        self.descending = descending
+        self.limit = limit
+
+    def where(self, field: str, op: str, value: Any) -> "ColumnsQuery":
+        """Filter the rows whose field compares to the value with the given operator ('==', '!=', '<', ... '>=')."""
+        if op not in _COMPARISON_OPERATORS:
+            raise ValueError(f"Unsupported operator '{op}', expected one of: {list(_COMPARISON_OPERATORS)}")
+
+        column = self._get_column(field)
+        valid_mask = ~numpy.ma.getmaskarray(column)
+        matches = numpy.zeros(len(column), dtype=bool)
+        matches[valid_mask] = _COMPARISON_OPERATORS[op](column.data[valid_mask], _to_column_value(column, value))
+        return self._filter(matches)
+
+    def between(self, field: str, value_range: Tuple[Any, Any]) -> "ColumnsQuery":
+        """Filter the rows whose field is within the (inclusive) range."""
+        min_value, max_value = value_range
+        return self.where(field, ">=", min_value).where(field, "<=", max_value)
+
+    def is_in(self, field: str, values: Iterable[Any]) -> "ColumnsQuery":
+        """Filter the rows whose field is one of the values."""
+        column = self._get_column(field)
+
+        if column.dtype == object:
+            values = set(values)
+            matches = numpy.fromiter((value in values for value in column.data), dtype=bool, count=len(column))
+        else:
+            matches = numpy.isin(column.data, [_to_column_value(column, value) for value in values])
+
+        return self._filter(matches & ~numpy.ma.getmaskarray(column))
+
+    def is_true(self, field: str) -> "ColumnsQuery":
+        """Filter the rows whose (boolean) field is true."""
+        return self.where(field, "==", True)
+
+    def is_null(self, field: str) -> "ColumnsQuery":
+        """Filter the rows whose field is missing."""
+        return self._filter(numpy.ma.getmaskarray(self._get_column(field)))
+
+    def not_null(self, field: str) -> "ColumnsQuery":
+        """Filter the rows whose field is not missing."""
+        return self._filter(~numpy.ma.getmaskarray(self._get_column(field)))
+
+    def order_by(self, field: str, descending: bool = False) -> "ColumnsQuery":
+        """Order the selected rows by the field (stable, with missing values last)."""
+        self._get_column(field)
+        return self._derive(order_field=field, descending=descending)
+
+    def head(self, limit: int) -> "ColumnsQuery":
+        """Select at most the given number of rows (after ordering)."""
+        if limit < 0:
+            raise ValueError(f"limit must be a non-negative integer, but got {limit}")
+
+        return self._derive(limit=limit)
+
+    def get_indexes(self) -> "numpy.ndarray":
+        """Return the indexes of the selected rows, in order."""
+        indexes = numpy.flatnonzero(self.mask)
+
+        if self.order_field is not None:
+            indexes = self._order_indexes(indexes)
+
+        return indexes if self.limit is None else indexes[:self.limit]
+
+    def to_columns(self, fields: Optional[Sequence[str]] = None) -> VehicleColumns:
+        """Return the selected rows as columns (all the queried fields by default)."""
+        indexes = self.get_indexes()
+        fields = self.columns if fields is None else fields
+        return {name: self._get_column(name)[indexes] for name in fields}
+
+    def count(self) -> int:
+        """Return the number of selected rows."""
+        return len(self)
+
+    def _get_column(self, field: str) -> "MaskedArray":
+        """Return the column of the field, raising a ValueError if it is not queried."""
+        try:
+            return self.columns[field]
+        except KeyError:
+            raise ValueError(f"Field '{field}' is not one of the queried columns: {list(self.columns)}") from None
+
+    def _filter(self, matches: "numpy.ndarray") -> "ColumnsQuery":
+        """Create a copy of this query, selecting only the rows which also match."""
+        return self._derive(mask=self.mask & matches)
+
+    def _derive(self, **changes: Any) -> "ColumnsQuery":
+        """Create a copy of this query, with the given attributes changed."""
+        attributes = dict(
+            mask=self.mask,
+            order_field=self.order_field,
+            descending=self.descending,
+            limit=self.limit
+        )
+        attributes.update(changes)
+        return type(self)(self.columns, **attributes)
+
+    def _order_indexes(self, indexes: "numpy.ndarray") -> "numpy.ndarray":
+        """Order the row indexes by the order field, keeping ties in their original order and missing values last."""
+        column = self._get_column(self.order_field)
+        null_mask = numpy.ma.getmaskarray(column)[indexes]
+        valid_indexes, null_indexes = indexes[~null_mask], indexes[null_mask]
+
+        if self.descending:
+            # a stable ascending sort of the reversed rows, reversed back, is a stable descending sort
+            reversed_indexes = valid_indexes[::-1]
+            valid_indexes = reversed_indexes[numpy.argsort(column.data[reversed_indexes], kind="stable")][::-1]
+        else:
+            valid_indexes = valid_indexes[numpy.argsort(column.data[valid_indexes], kind="stable")]
+
+        return numpy.concatenate([valid_indexes, null_indexes])
+
+    def __len__(self) -> int:
+        return len(self.get_indexes()) if self.limit is not None else int(self.mask.sum())
+
+
+def _to_column_value(column: "MaskedArray", value: Any) -> Any:
+    """Convert the value to the type of the column (e.g. a datetime to numpy.datetime64)."""
+    if column.dtype.kind == "M" and value is not None:
+        return numpy.datetime64(value, "s")
+    return value
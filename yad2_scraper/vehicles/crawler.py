@@ -0,0 +1,375 @@
+import logging
+import operator
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import (
+    Optional, Iterator, Iterable, Sequence, Container, Mapping, Union, Callable, Protocol, List, Any, NamedTuple
+)
+
+from yad2_scraper.crawler import Yad2Crawler, CrawledPage
+from yad2_scraper.scraper import Yad2Scraper
+from yad2_scraper.vehicles.urls import VehicleCategory, get_vehicle_category_url
+from yad2_scraper.vehicles.query import VehiclesQueryFilters, OrderVehiclesBy
+from yad2_scraper.vehicles.category import Yad2VehiclesCategory
+from yad2_scraper.vehicles.next_data import VehicleData
+from yad2_scraper.vehicles.record import VehicleRecord
+from yad2_scraper.vehicles.columns import VehicleColumns, records_to_columns
+from yad2_scraper.vehicles.diff import ListingState
+from yad2_scraper.vehicles.store import VehicleStore
+from yad2_scraper.vehicles.pipeline import parse_vehicles_page
+from yad2_scraper.constants import FIRST_PAGE_NUMBER, DEFAULT_CRAWLER_MAX_WORKERS, DEFAULT_EARLY_STOP_KNOWN_RATIO
+
+
+class SeenTokens(Protocol):
+    """A set of the tokens yielded in a crawl (e.g. a `set`, or a `BloomFilter` for very large crawls)."""
+
+    def add(self, token: str): ...
+
+    def __contains__(self, token: str) -> bool: ...
+
+
+# the listings seen in previous crawls: their tokens, their states (by token) or a vehicle store
+SeenListings = Union[Container[str], Mapping[str, ListingState], VehicleStore]
+
+
+class _VehiclesPage(NamedTuple):
+    """A crawled page: its number, its total listing count and its vehicles (raw data or records)."""
+    page_number: int
+    total: Optional[int]
+    vehicles: list
+
+
+logger = logging.getLogger(__name__)
+
+
+class Yad2VehiclesCrawler(Yad2Crawler):
+    """
+    Crawls all the result pages of a vehicle category search, fetching the pages concurrently.
+
+    Listings shift between pages while a crawl is running (new posts and bumped listings push the others down, removed
+    listings pull them up), so a vehicle may be listed on two pages, and another may be skipped. The crawler yields
+    each vehicle token once, and a page is considered drifted if it lists already yielded vehicles, or if its total
+    listing count differs from the first page. Drifted pages and the pages before them may be re-fetched at the end
+    of the crawl, to yield the vehicles which shifted across their boundaries.
+    """
+
+    def __init__(
+            self,
+            scraper: Optional[Yad2Scraper] = None,
+            max_workers: int = DEFAULT_CRAWLER_MAX_WORKERS,
+            deduplicate: bool = True,
+            refetch_on_drift: bool = False,
+            seen_tokens_factory: Callable[[], SeenTokens] = set,
+            parse_processes: Optional[int] = None
+    ):
+        """
+        Initializes the vehicles crawler with provided parameters.
+
+        Args:
+            scraper (Optional[Yad2Scraper]): The scraper used to fetch the pages. If not provided, a new one is created.
+            max_workers (int): The maximum number of pages fetched at the same time. Defaults to 8.
+            deduplicate (bool): Whether to yield each vehicle token once per crawl. Defaults to True.
+            refetch_on_drift (bool): Whether to re-fetch the boundaries of drifted pages (requires `deduplicate`).
+            seen_tokens_factory (Callable[[], SeenTokens]): Creates the set of tokens yielded in each crawl.
+                Defaults to `set`.
+            parse_processes (Optional[int]): The number of worker processes parsing the pages of record (and column)
+                crawls, while the threads only fetch them. If not provided, the threads also parse the pages.
+        """
+        if refetch_on_drift and not deduplicate:
+            raise ValueError("refetch_on_drift requires deduplicate")
+
+        if parse_processes is not None and (not isinstance(parse_processes, int) or parse_processes <= 0):
+            raise ValueError(f"parse_processes must be a positive integer, but got {parse_processes}")
+
+        super().__init__(scraper, max_workers)
+        self.deduplicate = deduplicate
+        self.seen_tokens_factory = seen_tokens_factory
+        self.refetch_on_drift = refetch_on_drift
+        self.parse_processes = parse_processes
+
+    def crawl(
+            self,
+            vehicle_category: VehicleCategory,
+            params: Optional[VehiclesQueryFilters] = None,
+            max_pages: Optional[int] = None
+    ) -> Iterator[VehicleData]:
+        """
+        Crawls the result pages of a vehicle category search, yielding the vehicles as the pages complete.
+
+        Args:
+            vehicle_category (VehicleCategory): The vehicle category to crawl.
+            params (Optional[VehiclesQueryFilters]): The query filters of the search.
+            max_pages (Optional[int]): The maximum number of pages to crawl. If not provided, all pages are crawled.
+
+        Yields:
+            VehicleData: The data of each vehicle listed in the crawled pages.
+        """
+        for vehicle_data in self._crawl_raw_data(vehicle_category, params, max_pages):
+            yield VehicleData(vehicle_data)
+
+    def crawl_records(
+            self,
+            vehicle_category: VehicleCategory,
+            params: Optional[VehiclesQueryFilters] = None,
+            max_pages: Optional[int] = None
+    ) -> Iterator[VehicleRecord]:
+        """
+        Crawls the result pages of a vehicle category search, yielding compact vehicle records as the pages complete.
+
+        If the crawler has parse processes, the raw pages are parsed into records in the worker processes (using all
+        the CPU cores for large crawls), and only the records are passed back.
+
+        Args:
+            vehicle_category (VehicleCategory): The vehicle category to crawl.
+            params (Optional[VehiclesQueryFilters]): The query filters of the search.
+            max_pages (Optional[int]): The maximum number of pages to crawl. If not provided, all pages are crawled.
+
+        Yields:
+            VehicleRecord: The record of each vehicle listed in the crawled pages.
+        """
+        if self.parse_processes:
+            yield from self._crawl_parsed_records(vehicle_category, params, max_pages)
+            return
+
+        for vehicle_data in self._crawl_raw_data(vehicle_category, params, max_pages):
+            yield VehicleRecord.from_data(vehicle_data)
+
+    def crawl_columns(
+            self,
+            vehicle_category: VehicleCategory,
+            params: Optional[VehiclesQueryFilters] = None,
+            max_pages: Optional[int] = None,
+            fields: Optional[Sequence[str]] = None
+    ) -> VehicleColumns:
+        """
+        Crawls the result pages of a vehicle category search, returning all the vehicles as columns (requires NumPy).
+
+        Args:
+            vehicle_category (VehicleCategory): The vehicle category to crawl.
+            params (Optional[VehiclesQueryFilters]): The query filters of the search.
+            max_pages (Optional[int]): The maximum number of pages to crawl. If not provided, all pages are crawled.
+            fields (Optional[Sequence[str]]): The fields to include. Defaults to every field with a column type.
+
+        Returns:
+            VehicleColumns: A mapping of each field to a NumPy masked array, masking the missing values.
+        """
+        return records_to_columns(self.crawl_records(vehicle_category, params, max_pages), fields)
+
+    def crawl_new(
+            self,
+            vehicle_category: VehicleCategory,
+            seen: SeenListings,
+            params: Optional[VehiclesQueryFilters] = None,
+            max_pages: Optional[int] = None,
+            known_ratio: float = DEFAULT_EARLY_STOP_KNOWN_RATIO
+    ) -> Iterator[VehicleData]:
+        """
+        Crawls the result pages of a search ordered by date one by one, yielding only the new (or updated) vehicles,
+        and stops once it reaches a page which was mostly covered by previous crawls.
+
+        A vehicle is known if its token was seen. When the seen listings include their states (a snapshot or a vehicle
+        store), a vehicle is known only if its update time did not change, so bumped listings are yielded again.
+
+        Args:
+            vehicle_category (VehicleCategory): The vehicle category to crawl.
+            seen (SeenListings): The listings seen in previous crawls (a set of tokens, a snapshot or a vehicle store).
+            params (Optional[VehiclesQueryFilters]): The query filters of the search. Defaults to ordering by date.
+            max_pages (Optional[int]): The maximum number of pages to crawl. If not provided, all pages may be crawled.
+            known_ratio (float): The ratio (between 0 and 1) of known vehicles in a page, from which the crawl stops.
+
+        Yields:
+            VehicleData: The data of each vehicle which is not known, in the order of the pages.
+        """
+        if not 0 < known_ratio <= 1:
+            raise ValueError(f"known_ratio must be between 0 and 1, but got {known_ratio}")
+
+        params = params or VehiclesQueryFilters(order_by=OrderVehiclesBy.DATE)
+        if params.order_by != OrderVehiclesBy.DATE:
+            logger.warning(f"Crawling new vehicles expects ordering by date, but got order: {params.order_by}")
+
+        if isinstance(seen, VehicleStore):
+            seen = seen.get_snapshot()
+
+        url = get_vehicle_category_url(vehicle_category)
+        page_number = params.page or FIRST_PAGE_NUMBER
+        last_page_number = None
+        seen_tokens = self.seen_tokens_factory()
+
+        while last_page_number is None or page_number <= last_page_number:
+            next_data = self.fetch_page(url, Yad2VehiclesCategory, params, page_number).load_next_data()
+
+            if last_page_number is None:
+                total_pages = next_data.total_pages if next_data else None
+                last_page_number = self._limit_last_page_number(total_pages, page_number, max_pages)
+
+            vehicles = next_data.get_data() if next_data else []
+            new_vehicles = [vehicle for vehicle in vehicles if not _is_known(vehicle, seen)]
+            yield from (vehicle for vehicle in new_vehicles if not self._is_duplicate(vehicle.token, seen_tokens))
+
+            if not vehicles or len(vehicles) - len(new_vehicles) >= known_ratio * len(vehicles):
+                logger.info(f"Stopped crawling at page {page_number}, reached vehicles known from previous crawls")
+                return
+
+            page_number += 1
+
+    def _crawl_raw_data(
+            self,
+            vehicle_category: VehicleCategory,
+            params: Optional[VehiclesQueryFilters],
+            max_pages: Optional[int]
+    ) -> Iterator[dict]:
+        """Crawls the result pages of a vehicle category search, yielding the raw data of each (deduplicated) vehicle."""
+        url = get_vehicle_category_url(vehicle_category)
+        params = params or VehiclesQueryFilters()
+
+        def refetch_pages(page_numbers: List[int]) -> Iterator[_VehiclesPage]:
+            return _read_vehicles_pages(self.fetch_pages(url, Yad2VehiclesCategory, params, page_numbers))
+
+        pages = _read_vehicles_pages(self.crawl_pages(url, Yad2VehiclesCategory, params=params, max_pages=max_pages))
+        yield from self._deduplicate_pages(url, pages, refetch_pages, get_token=operator.methodcaller("get", "token"))
+
+    def _crawl_parsed_records(
+            self,
+            vehicle_category: VehicleCategory,
+            params: Optional[VehiclesQueryFilters],
+            max_pages: Optional[int]
+    ) -> Iterator[VehicleRecord]:
+        """Crawls the result pages of a vehicle category search, parsing the pages in a pool of worker processes."""
+        url = get_vehicle_category_url(vehicle_category)
+        params = params or VehiclesQueryFilters()
+
+        with ProcessPoolExecutor(max_workers=self.parse_processes) as process_pool:
+            def refetch_pages(page_numbers: List[int]) -> Iterator[_VehiclesPage]:
+                return self._fetch_parsed_pages(url, params, page_numbers, process_pool)
+
+            pages = self._crawl_parsed_pages(url, params, max_pages, process_pool)
+            yield from self._deduplicate_pages(url, pages, refetch_pages, get_token=operator.attrgetter("token"))
+
+    def _crawl_parsed_pages(
+            self,
+            url: str,
+            params: VehiclesQueryFilters,
+            max_pages: Optional[int],
+            process_pool: ProcessPoolExecutor
+    ) -> Iterator[_VehiclesPage]:
+        """Crawls the result pages like `crawl_pages`, fetching the raw pages and parsing them in the process pool."""
+        first_page_number = params.page or FIRST_PAGE_NUMBER
+
+        content = self.fetch_page_content(url, params, first_page_number)
+        first_page = process_pool.submit(parse_vehicles_page, content).result()
+        yield _VehiclesPage(first_page_number, first_page.total, first_page.records)
+
+        last_page_number = self._limit_last_page_number(first_page.total_pages, first_page_number, max_pages)
+        page_numbers = range(first_page_number + 1, last_page_number + 1)
+        logger.info(f"Crawling {len(page_numbers)} more pages from URL: '{url}'")
+
+        yield from self._fetch_parsed_pages(url, params, page_numbers, process_pool)
+
+    def _fetch_parsed_pages(
+            self,
+            url: str,
+            params: VehiclesQueryFilters,
+            page_numbers: Iterable[int],
+            process_pool: ProcessPoolExecutor
+    ) -> Iterator[_VehiclesPage]:
+        """
+        Fetches the given pages concurrently, parsing each page in the process pool as soon as it is fetched, and
+        yielding the parsed pages in the order they complete (so the fetching and the parsing overlap).
+        """
+        page_numbers = list(page_numbers)
+        if not page_numbers:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(page_numbers))) as executor:
+            fetch_futures = {
+                executor.submit(self.fetch_page_content, url, params, page_number): page_number
+                for page_number in page_numbers
+            }
+            parse_futures = {}
+
+            try:
+                while fetch_futures or parse_futures:
+                    done_futures, _ = wait([*fetch_futures, *parse_futures], return_when=FIRST_COMPLETED)
+
+                    for future in done_futures:
+                        if future in fetch_futures:
+                            page_number = fetch_futures.pop(future)
+                            parse_futures[process_pool.submit(parse_vehicles_page, future.result())] = page_number
+                        else:
+                            page_number = parse_futures.pop(future)
+                            page = future.result()
+                            yield _VehiclesPage(page_number, page.total, page.records)
+            finally:
+                for future in [*fetch_futures, *parse_futures]:  # do not wait for pending pages, if stopped early
+                    future.cancel()
+
+    def _deduplicate_pages(
+            self,
+            url: str,
+            pages: Iterator[_VehiclesPage],
+            refetch_pages: Callable[[List[int]], Iterator[_VehiclesPage]],
+            get_token: Callable[[Any], Optional[str]]
+    ) -> Iterator[Any]:
+        """Yield the (deduplicated) vehicles of the crawled pages, re-fetching the boundaries of drifted pages."""
+        seen_tokens = self.seen_tokens_factory()
+        crawled_page_numbers = set()
+        drifted_page_numbers = set()
+        expected_total = None
+
+        for page_number, total, vehicles in pages:
+            crawled_page_numbers.add(page_number)
+            if not vehicles:
+                continue
+
+            expected_total = total if expected_total is None else expected_total  # the first page is yielded first
+            duplicate_count = 0
+
+            for vehicle in vehicles:
+                if self._is_duplicate(get_token(vehicle), seen_tokens):
+                    duplicate_count += 1
+                else:
+                    yield vehicle
+
+            if duplicate_count or total != expected_total:
+                logger.debug(f"Page {page_number} drifted ({duplicate_count} duplicates, {total} total listings)")
+                drifted_page_numbers.add(page_number)
+
+        if not (self.refetch_on_drift and drifted_page_numbers):
+            return
+
+        boundary_page_numbers = {number for page in drifted_page_numbers for number in (page - 1, page)}
+        refetch_page_numbers = sorted(boundary_page_numbers & crawled_page_numbers)
+        logger.info(f"Re-fetching {len(refetch_page_numbers)} boundary pages of drifted pages from URL: '{url}'")
+
+        for _, _, vehicles in refetch_pages(refetch_page_numbers):
+            yield from (vehicle for vehicle in vehicles if not self._is_duplicate(get_token(vehicle), seen_tokens))
+
+    def _is_duplicate(self, token: Optional[str], seen_tokens: SeenTokens) -> bool:
+        """Check whether the vehicle token was already yielded in this crawl (marking it as yielded if not)."""
+        if not self.deduplicate or token is None:
+            return False
+        if token in seen_tokens:
+            return True
+
+        seen_tokens.add(token)
+        return False
+
+
+def _read_vehicles_pages(pages: Iterable[CrawledPage]) -> Iterator[_VehiclesPage]:
+    """Read the total listing count and the raw vehicle data of each crawled page."""
+    for page_number, category in pages:
+        next_data = category.load_next_data()
+
+        if next_data:
+            total = (next_data.pagination or {}).get("total")
+            yield _VehiclesPage(page_number, total, list(next_data.iter_raw_data()))
+        else:
+            yield _VehiclesPage(page_number, None, [])
+
+
+def _is_known(vehicle: VehicleData, seen: Union[Container[str], Mapping[str, ListingState]]) -> bool:
+    """Check whether the vehicle was seen in a previous crawl (unchanged, if the seen listings include states)."""
+    if isinstance(seen, Mapping):
+        previous_state = seen.get(vehicle.token)
+        return previous_state is not None and previous_state.updated_at == vehicle.updated_at
+
+    return vehicle.token in seen
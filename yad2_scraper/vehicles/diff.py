@@ -0,0 +1,136 @@
+import logging
+from datetime import datetime
+from enum import Enum
+from typing import Dict, Iterable, Iterator, Optional, NamedTuple, Union
+
+from yad2_scraper.next_data import convert_string_date_to_datetime
+from yad2_scraper.vehicles.next_data import VehicleData
+
+Listing = Union[VehicleData, dict]
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeType(str, Enum):
+    """Enum representing the ways a listing may change between two crawls."""
+    NEW = "new"
+    UPDATED = "updated"
+    PRICE_DROPPED = "price_dropped"
+    DISAPPEARED = "disappeared"
+
+
+class ListingState(NamedTuple):
+    """Represents the state of a listing that is compared between crawls (its last update time and price)."""
+    updated_at: Optional[datetime]
+    price: Optional[int]
+
+    @classmethod
+    def from_data(cls, data: dict) -> "ListingState":
+        """Create the state of a listing from its raw vehicle data."""
+        try:
+            updated_at = convert_string_date_to_datetime(data["dates"]["updatedAt"])
+        except (KeyError, TypeError, ValueError):
+            updated_at = None
+
+        return cls(updated_at, data.get("price"))
+
+
+# the state of each listing by its token
+Snapshot = Dict[str, ListingState]
+
+
+class ListingChange(NamedTuple):
+    """Represents a change of a single listing, compared to the previous snapshot."""
+    change_type: ChangeType
+    token: str
+    data: Optional[VehicleData]  # None for disappeared listings
+    previous: Optional[ListingState]  # None for new listings
+
+    @property
+    def price_drop(self) -> Optional[int]:
+        """Return how much the price dropped, if it did."""
+        if self.change_type != ChangeType.PRICE_DROPPED:
+            return None
+        return self.previous.price - self.data.price
+
+
+def create_snapshot(listings: Iterable[Listing]) -> Snapshot:
+    """Create a snapshot of the listings (vehicle-data objects or raw vehicle data), to diff a later crawl against."""
+    snapshot = {}
+
+    for listing in listings:
+        data = _get_data(listing)
+        token = data.get("token")
+
+        if token is not None:
+            snapshot[token] = ListingState.from_data(data)
+
+    return snapshot
+
+
+def diff_listings(
+        previous_snapshot: Snapshot,
+        listings: Iterable[Listing],
+        detect_disappeared: bool = True
+) -> Iterator[ListingChange]:
+    """
+    Compares the listings of a crawl to the previous snapshot, yielding only the changed listings.
+
+    Every listing is looked up by its token in the snapshot (a hash index), so the crawl is streamed once.
+    A listing is new if its token is not in the snapshot, price-dropped if its price decreased, and updated if its price
+    or update time changed otherwise. Unchanged listings are not yielded.
+
+    Args:
+        previous_snapshot (Snapshot): The snapshot of the previous crawl (e.g. from `create_snapshot`).
+        listings (Iterable[Listing]): The listings of the current crawl (vehicle-data objects or raw vehicle data).
+        detect_disappeared (bool): Whether to yield the snapshot listings which are missing from the crawl, after all
+            the listings are compared. Disable it for partial crawls, where missing listings were simply not reached.
+
+    Yields:
+        ListingChange: The change of each new, updated, price-dropped or disappeared listing.
+    """
+    seen_tokens = set()
+    change_counts = dict.fromkeys(ChangeType, 0)
+
+    for listing in listings:
+        data = _get_data(listing)
+        token = data.get("token")
+
+        if token is None or token in seen_tokens:
+            continue
+
+        seen_tokens.add(token)
+        previous_state = previous_snapshot.get(token)
+        change_type = _classify_change(previous_state, ListingState.from_data(data))
+
+        if change_type is not None:
+            change_counts[change_type] += 1
+            yield ListingChange(change_type, token, VehicleData(data), previous_state)
+
+    if detect_disappeared:
+        for token, previous_state in previous_snapshot.items():
+            if token not in seen_tokens:
+                change_counts[ChangeType.DISAPPEARED] += 1
+                yield ListingChange(ChangeType.DISAPPEARED, token, None, previous_state)
+
+    logger.debug(f"Compared {len(seen_tokens)} listings: " + ", ".join(
+        f"{count} {change_type.value}" for change_type, count in change_counts.items()
+    ))
+
+
+def _classify_change(previous_state: Optional[ListingState], state: ListingState) -> Optional[ChangeType]:
+    """Classify the change of a listing between its previous and current states (None if it did not change)."""
+    if previous_state is None:
+        return ChangeType.NEW
+
+    if previous_state.price is not None and state.price is not None and state.price < previous_state.price:
+        return ChangeType.PRICE_DROPPED
+
+    if state != previous_state:
+        return ChangeType.UPDATED
+
+    return None
+
+
+def _get_data(listing: Listing) -> dict:
+    return listing.data if isinstance(listing, VehicleData) else listing
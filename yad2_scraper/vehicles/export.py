@@ -0,0 +1,196 @@
+import csv
+import gzip
+import io
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Union, Optional, Iterable, Sequence, BinaryIO, List, Any
+
+from yad2_scraper.utils import dump_json
+from yad2_scraper.vehicles.record import VehicleRecord
+from yad2_scraper.vehicles.next_data import VehicleData
+from yad2_scraper.constants import DEFAULT_EXPORT_BUFFER_SIZE, DEFAULT_EXPORT_COMPRESS_LEVEL
+
+Listing = Union[VehicleRecord, VehicleData, dict]
+
+logger = logging.getLogger(__name__)
+
+
+def to_record(listing: Listing) -> VehicleRecord:
+    """Convert a listing (a record, a vehicle-data object or raw vehicle data) to a flat vehicle record."""
+    if isinstance(listing, VehicleRecord):
+        return listing
+    if isinstance(listing, VehicleData):
+        return VehicleRecord.from_data(listing.data)
+    if isinstance(listing, dict):
+        return VehicleRecord.from_data(listing)
+
+    raise TypeError(f"Expected a VehicleRecord, VehicleData or dict listing, but got: {type(listing).__name__}")
+
+
+class VehiclesWriter:
+    """
+    A base streaming writer of vehicle listings, which flattens every listing into the (stable) record fields.
+
+    The output is buffered and written incrementally (optionally gzip-compressed), so memory stays constant no matter
+    how many listings are written.
+    """
+
+    def __init__(
+            self,
+            path: Union[str, Path],
+            fields: Optional[Sequence[str]] = None,
+            compress: Optional[bool] = None,
+            buffer_size: int = DEFAULT_EXPORT_BUFFER_SIZE
+    ):
+        """
+        Initializes the writer, opening (and truncating) the output file.
+
+        Args:
+            path (Union[str, Path]): The path of the output file.
+            fields (Optional[Sequence[str]]): The record fields to write, in order. Defaults to all the record fields.
+            compress (Optional[bool]): Whether to gzip-compress the output. Defaults to whether the path ends with '.gz'.
+            buffer_size (int): The size (in bytes) of the output buffer.
+        """
+        self.path = Path(path)
+        self.fields = VehicleRecord._fields if fields is None else tuple(fields)
+        self.compress = self.path.suffix == ".gz" if compress is None else compress
+        self.count = 0
+
+        unknown_fields = [name for name in self.fields if name not in VehicleRecord._fields]
+        if unknown_fields:
+            raise ValueError(f"Fields are not vehicle record fields: {unknown_fields}")
+
+        self._field_indexes = [VehicleRecord._fields.index(name) for name in self.fields]
+        self._file = self._open(buffer_size)
+
+    def write(self, listing: Listing):
+        """Write a single listing."""
+        record = to_record(listing)
+        self._write_values([record[index] for index in self._field_indexes])
+        self.count += 1
+
+    def write_all(self, listings: Iterable[Listing]) -> int:
+        """Write all the listings (consuming an iterator lazily), and return the number of listings written."""
+        count = self.count
+
+        for listing in listings:
+            self.write(listing)
+
+        return self.count - count
+
+    def close(self):
+        """Flush and close the output file."""
+        self._file.close()
+        logger.debug(f"Exported {self.count} listings to: '{self.path}'")
+
+    def _open(self, buffer_size: int) -> BinaryIO:
+        """Open the output file for binary writing, through a gzip stream if compressed."""
+        if self.compress:
+            return io.BufferedWriter(gzip.open(self.path, "wb", DEFAULT_EXPORT_COMPRESS_LEVEL), buffer_size)
+        return open(self.path, "wb", buffering=buffer_size)
+
+    def _write_values(self, values: List[Any]):
+        """Write the values of the fields of a single listing."""
+        raise NotImplementedError
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class JsonLinesWriter(VehiclesWriter):
+    """A streaming writer of vehicle listings to JSON Lines, one flat JSON object per listing."""
+
+    def _write_values(self, values: List[Any]):
+        self._file.write(dump_json(dict(zip(self.fields, values))))
+        self._file.write(b"\n")
+
+
+class CsvWriter(VehiclesWriter):
+    """A streaming writer of vehicle listings to CSV, with a header row (lists are written as JSON arrays)."""
+
+    def __init__(
+            self,
+            path: Union[str, Path],
+            fields: Optional[Sequence[str]] = None,
+            compress: Optional[bool] = None,
+            buffer_size: int = DEFAULT_EXPORT_BUFFER_SIZE
+    ):
+        super().__init__(path, fields, compress, buffer_size)
+        self._text_file = io.TextIOWrapper(self._file, encoding="utf-8", newline="", write_through=True)
+        self._csv_writer = csv.writer(self._text_file)
+        self._csv_writer.writerow(self.fields)
+        # only the datetime and list fields need formatting, the rest are written as they are
+        self._formatters = [
+            (position, _CSV_FORMATTERS[name]) for position, name in enumerate(self.fields) if name in _CSV_FORMATTERS
+        ]
+
+    def close(self):
+        self._text_file.detach()
+        super().close()
+
+    def _write_values(self, values: List[Any]):
+        for position, formatter in self._formatters:
+            if values[position] is not None:
+                values[position] = formatter(values[position])
+
+        self._csv_writer.writerow(values)
+
+
+def _format_csv_list(value: list) -> str:
+    return dump_json(value).decode()
+
+
+# the formatters of the record fields which are not written as they are (None is written as an empty cell)
+_CSV_FORMATTERS = {
+    name: datetime.isoformat if field_type == Optional[datetime] else _format_csv_list
+    for name, field_type in VehicleRecord.__annotations__.items()
+    if field_type in (Optional[datetime], Optional[List[str]])
+}
+
+
+def export_jsonl(
+        listings: Iterable[Listing],
+        path: Union[str, Path],
+        fields: Optional[Sequence[str]] = None,
+        compress: Optional[bool] = None
+) -> int:
+    """
+    Streams the listings (e.g. from a crawl) to a JSON Lines file.
+
+    Args:
+        listings (Iterable[Listing]): The listings to export (records, vehicle-data objects or raw vehicle data).
+        path (Union[str, Path]): The path of the output file.
+        fields (Optional[Sequence[str]]): The record fields to export, in order. Defaults to all the record fields.
+        compress (Optional[bool]): Whether to gzip-compress the output. Defaults to whether the path ends with '.gz'.
+
+    Returns:
+        int: The number of exported listings.
+    """
+    with JsonLinesWriter(path, fields=fields, compress=compress) as writer:
+        return writer.write_all(listings)
+
+
+def export_csv(
+        listings: Iterable[Listing],
+        path: Union[str, Path],
+        fields: Optional[Sequence[str]] = None,
+        compress: Optional[bool] = None
+) -> int:
+    """
+    Streams the listings (e.g. from a crawl) to a CSV file.
+
+    Args:
+        listings (Iterable[Listing]): The listings to export (records, vehicle-data objects or raw vehicle data).
+        path (Union[str, Path]): The path of the output file.
+        fields (Optional[Sequence[str]]): The record fields to export, in order. Defaults to all the record fields.
+        compress (Optional[bool]): Whether to gzip-compress the output. Defaults to whether the path ends with '.gz'.
+
+    Returns:
+        int: The number of exported listings.
+    """
+    with CsvWriter(path, fields=fields, compress=compress) as writer:
+        return writer.write_all(listings)
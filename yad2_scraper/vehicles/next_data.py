@@ -1,6 +1,6 @@
 import itertools
 from datetime import datetime
-from typing import List, Any, Iterator, Optional
+from typing import List, Any, Iterator, Optional, Sequence
 
 from yad2_scraper.next_data import (
     SafeAccessOptionalKeysMeta,
@@ -10,7 +10,10 @@ from yad2_scraper.next_data import (
     convert_string_date_to_datetime
 )
 from yad2_scraper.utils import join_url
+from yad2_scraper.tracing import get_tracer
 from yad2_scraper.vehicles.urls import VEHICLES_URL
+from yad2_scraper.vehicles.record import VehicleRecord
+from yad2_scraper.vehicles.columns import VehicleColumns, records_to_columns
 
 
 class VehicleData(metaclass=SafeAccessOptionalKeysMeta):
@@ -309,8 +312,20 @@ class VehiclesNextData(NextData):
 
     def get_data(self) -> List[VehicleData]:
         """Extract and return a list of vehicle-data objects from the stored queries."""
-        data_list = []
+        with get_tracer().span("get_data"):
+            return [VehicleData(vehicle_data) for vehicle_data in self.iter_raw_data()]
 
+    def get_records(self) -> List[VehicleRecord]:
+        """Extract and return a list of compact vehicle records from the stored queries."""
+        with get_tracer().span("get_records"):
+            return [VehicleRecord.from_data(vehicle_data) for vehicle_data in self.iter_raw_data()]
+
+    def to_columns(self, fields: Optional[Sequence[str]] = None) -> VehicleColumns:
+        """Extract and return the vehicles as columns (one NumPy masked array per field, requires NumPy)."""
+        return records_to_columns(self.get_records(), fields)
+
+    def iter_raw_data(self) -> Iterator[dict]:
+        """Iterate over the raw data dictionaries of the vehicles in the stored queries."""
         for query in self.queries:
             data = query["state"].get("data")
 
@@ -319,6 +334,4 @@ class VehiclesNextData(NextData):
 
             for vehicle_data in itertools.chain.from_iterable(data.values()):
                 if isinstance(vehicle_data, dict):
-                    data_list.append(VehicleData(vehicle_data))
-
-        return data_list
+                    yield vehicle_data
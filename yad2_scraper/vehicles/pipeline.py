@@ -0,0 +1,21 @@
+from typing import Optional, List, NamedTuple
+
+from yad2_scraper.vehicles.category import Yad2VehiclesCategory
+from yad2_scraper.vehicles.record import VehicleRecord
+
+
+class ParsedVehiclesPage(NamedTuple):
+    """Represents a vehicles result page parsed in a worker process (compact and cheap to pass between processes)."""
+    total_pages: Optional[int]
+    total: Optional[int]
+    records: List[VehicleRecord]
+
+
+def parse_vehicles_page(content: bytes) -> ParsedVehiclesPage:
+    """Parse the raw HTML of a vehicles result page into its pagination and vehicle records (in a worker process)."""
+    next_data = Yad2VehiclesCategory(html=content).load_next_data()
+    if not next_data:
+        return ParsedVehiclesPage(None, None, [])
+
+    pagination = next_data.pagination or {}
+    return ParsedVehiclesPage(pagination.get("pages"), pagination.get("total"), next_data.get_records())
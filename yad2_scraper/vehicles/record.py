@@ -0,0 +1,213 @@
+from datetime import datetime
+from typing import NamedTuple, Optional, List, Tuple, Callable, Any, Union
+
+from yad2_scraper.next_data import convert_string_date_to_datetime
+from yad2_scraper.utils import join_url
+from yad2_scraper.vehicles.urls import VEHICLES_URL
+
+FieldPath = Tuple[Union[str, int], ...]
+
+
+def _convert_texts(objects: List[dict]) -> List[str]:
+    return [obj["text"] for obj in objects]
+
+
+class VehicleRecord(NamedTuple):
+    """A compact, immutable record of a single vehicle, with all fields extracted in one pass (dates parsed once)."""
+    token: Optional[str]
+    price: Optional[int]
+    customer_name: Optional[str]
+    customer_phone: Optional[str]
+    top_area_id: Optional[int]
+    top_area: Optional[str]
+    area_id: Optional[int]
+    area: Optional[str]
+    city_id: Optional[str]
+    city: Optional[str]
+    cover_image: Optional[str]
+    images: Optional[List[str]]
+    description: Optional[str]
+    updated_at: Optional[datetime]
+    created_at: Optional[datetime]
+    ends_at: Optional[datetime]
+    rebounced_at: Optional[datetime]
+    manufacturer_id: Optional[int]
+    manufacturer: Optional[str]
+    manufacturer_english: Optional[str]
+    model_id: Optional[int]
+    model: Optional[str]
+    model_english: Optional[str]
+    sub_model_id: Optional[int]
+    sub_model: Optional[str]
+    color_id: Optional[int]
+    color: Optional[str]
+    km: Optional[int]
+    hand: Optional[int]
+    engine_volume: Optional[int]
+    horse_power: Optional[int]
+    above_price: Optional[str]
+    is_contact_lead_supported: Optional[bool]
+    year_of_production: Optional[int]
+    month_of_production: Optional[int]
+    test_date: Optional[datetime]
+    gear_box_id: Optional[int]
+    gear_box: Optional[str]
+    engine_type_id: Optional[int]
+    engine_type: Optional[str]
+    car_family_types: Optional[List[str]]
+    seats: Optional[int]
+    number_of_doors: Optional[int]
+    owner: Optional[str]
+    body_type: Optional[str]
+    combined_fuel_consumption: Optional[float]
+    power_train_architecture: Optional[str]
+    car_tags: Optional[List[str]]
+    has_air_conditioner: Optional[bool]
+    has_power_steering: Optional[bool]
+    has_magnesium_wheel: Optional[bool]
+    has_tire_pressure_monitoring_system: Optional[bool]
+    has_abs: Optional[bool]
+    air_bags: Optional[int]
+    has_control_stability: Optional[bool]
+    has_electric_window: Optional[int]
+    has_breaking_assist_system: Optional[bool]
+    has_reverse_camera: Optional[bool]
+    has_adaptive_cruise_control: Optional[bool]
+    has_high_beams_auto_control: Optional[bool]
+    has_blind_spot_assist: Optional[bool]
+    has_identify_pedestrians: Optional[bool]
+    has_seat_belts_sensors: Optional[bool]
+    has_identifying_dangerous_nearing: Optional[bool]
+    has_auto_lighting_in_forward: Optional[bool]
+    has_identify_traffic_signs: Optional[bool]
+    ignition: Optional[str]
+    safety_points: Optional[int]
+    is_handicapped_friendly: Optional[bool]
+    has_sun_roof: Optional[bool]
+    is_turbo: Optional[bool]
+    has_road_deviation_control: Optional[bool]
+    has_forward_distance_monitor: Optional[bool]
+    has_box: Optional[bool]
+
+    @property
+    def page_link(self) -> str:
+        return join_url(VEHICLES_URL, f"item/{self.token}")
+
+    @classmethod
+    def from_data(cls, data: dict) -> "VehicleRecord":
+        """Create a record from the raw data of a vehicle, extracting every field in one pass."""
+        return cls._make([_extract_field(data, path, converter) for path, converter in _FIELD_EXTRACTORS])
+
+
+def _extract_field(data: dict, path: FieldPath, converter: Optional[Callable[[Any], Any]]) -> Any:
+    """Extract the value in the given path of the data, returning None if any key along the path is missing."""
+    value = data
+
+    try:
+        for key in path:
+            value = value[key]
+    except (KeyError, IndexError, TypeError):
+        return None
+
+    if value is None or converter is None:
+        return value
+
+    try:
+        return converter(value)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+
+
+_SPECIFICATION_FIELDS = {
+    "has_air_conditioner": "airConditioner",
+    "has_power_steering": "powerSteering",
+    "has_magnesium_wheel": "magnesiumWheel",
+    "has_tire_pressure_monitoring_system": "tirePressureMonitoringSystem",
+    "has_abs": "abs",
+    "air_bags": "airBags",
+    "has_control_stability": "controlStability",
+    "has_electric_window": "electricWindow",
+    "has_breaking_assist_system": "breakingAssistSystem",
+    "has_reverse_camera": "reverseCamera",
+    "has_adaptive_cruise_control": "adaptiveCruiseControl",
+    "has_high_beams_auto_control": "highBeamsAutoControl",
+    "has_blind_spot_assist": "blindSpotAssist",
+    "has_identify_pedestrians": "identifyPedestrians",
+    "has_seat_belts_sensors": "seatBeltsSensors",
+    "has_identifying_dangerous_nearing": "identifyingDangerousNearing",
+    "has_auto_lighting_in_forward": "autoLightingInForward",
+    "has_identify_traffic_signs": "identifyTrafficSigns",
+    "safety_points": "safetyPoints",
+    "is_handicapped_friendly": "isHandicappedFriendly",
+    "has_sun_roof": "sunRoof",
+    "is_turbo": "isTurbo",
+    "has_road_deviation_control": "roadDeviationControl",
+    "has_forward_distance_monitor": "forwardDistanceMonitor",
+    "has_box": "box",
+}
+
+_FIELD_PATHS = {
+    "token": ("token",),
+    "price": ("price",),
+    "customer_name": ("customer", "name"),
+    "customer_phone": ("customer", "phone"),
+    "top_area_id": ("address", "topArea", "id"),
+    "top_area": ("address", "topArea", "text"),
+    "area_id": ("address", "area", "id"),
+    "area": ("address", "area", "text"),
+    "city_id": ("address", "city", "id"),
+    "city": ("address", "city", "text"),
+    "cover_image": ("metaData", "coverImage"),
+    "images": ("metaData", "images"),
+    "description": ("metaData", "description"),
+    "updated_at": ("dates", "updatedAt"),
+    "created_at": ("dates", "createdAt"),
+    "ends_at": ("dates", "endsAt"),
+    "rebounced_at": ("dates", "rebouncedAt"),
+    "manufacturer_id": ("manufacturer", "id"),
+    "manufacturer": ("manufacturer", "text"),
+    "manufacturer_english": ("manufacturer", "textEng"),
+    "model_id": ("model", "id"),
+    "model": ("model", "text"),
+    "model_english": ("model", "textEng"),
+    "sub_model_id": ("subModel", "id"),
+    "sub_model": ("subModel", "text"),
+    "color_id": ("color", "id"),
+    "color": ("color", "text"),
+    "km": ("km",),
+    "hand": ("hand", "id"),
+    "engine_volume": ("engineVolume",),
+    "horse_power": ("horsePower",),
+    "above_price": ("abovePrice",),
+    "is_contact_lead_supported": ("isContactLeadSupported",),
+    "year_of_production": ("vehicleDates", "yearOfProduction"),
+    "month_of_production": ("vehicleDates", "monthOfProduction", "id"),
+    "test_date": ("vehicleDates", "testDate"),
+    "gear_box_id": ("gearBox", "id"),
+    "gear_box": ("gearBox", "text"),
+    "engine_type_id": ("engineType", "id"),
+    "engine_type": ("engineType", "text"),
+    "car_family_types": ("carFamilyType",),
+    "seats": ("seats",),
+    "number_of_doors": ("numberOfDoors",),
+    "owner": ("owner", "text"),
+    "body_type": ("bodyType", "text"),
+    "combined_fuel_consumption": ("combinedFuelConsumption",),
+    "power_train_architecture": ("powertrainArchitecture", "text"),
+    "car_tags": ("carTag",),
+    "ignition": ("specification", "ignition", "text"),
+    **{name: ("specification", key) for name, key in _SPECIFICATION_FIELDS.items()},
+}
+
+_FIELD_CONVERTERS = {
+    "updated_at": convert_string_date_to_datetime,
+    "created_at": convert_string_date_to_datetime,
+    "ends_at": convert_string_date_to_datetime,
+    "rebounced_at": convert_string_date_to_datetime,
+    "test_date": convert_string_date_to_datetime,
+    "car_family_types": _convert_texts,
+    "car_tags": _convert_texts,
+}
+
+# the (path, converter) of each field, in the order of the record fields
+_FIELD_EXTRACTORS = tuple((_FIELD_PATHS[name], _FIELD_CONVERTERS.get(name)) for name in VehicleRecord._fields)
@@ -0,0 +1,220 @@
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Union, Optional, Iterable, Iterator, List, Tuple, NamedTuple, Any
+
+from yad2_scraper.query import NumberRange
+from yad2_scraper.utils import dump_json, load_json
+from yad2_scraper.vehicles.record import VehicleRecord
+from yad2_scraper.vehicles.next_data import VehicleData
+from yad2_scraper.vehicles.diff import ListingState, Snapshot
+
+StoredListing = Union[VehicleData, dict]
+
+# the listing columns (besides the raw data and seen times), extracted from the record fields of the same name
+_LISTING_COLUMNS = ("price", "year_of_production", "manufacturer_id", "model_id", "km", "hand", "city", "updated_at")
+
+logger = logging.getLogger(__name__)
+
+
+class StoredVehicle(NamedTuple):
+    """Represents a vehicle listing in the vehicle store, with the times it was first and last seen."""
+    data: VehicleData
+    first_seen_at: float
+    last_seen_at: float
+
+    @property
+    def token(self) -> str:
+        return self.data.token
+
+
+class VehicleStore:
+    """
+    A local (SQLite) store of vehicle listings, keyed by the listing token.
+
+    Listings are upserted in batches (a single transaction per batch), keeping the time each listing was first seen
+    and updating the time it was last seen, so repeated crawls can be persisted and queried without re-scraping.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initializes the vehicle store, creating the store database if it does not exist.
+
+        Args:
+            path (Union[str, Path]): The path of the store database file.
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS vehicles (
+                token TEXT PRIMARY KEY,
+                price INTEGER,
+                year_of_production INTEGER,
+                manufacturer_id INTEGER,
+                model_id INTEGER,
+                km INTEGER,
+                hand INTEGER,
+                city TEXT,
+                updated_at TEXT,
+                data TEXT NOT NULL,
+                first_seen_at REAL NOT NULL,
+                last_seen_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS vehicles_price ON vehicles (price);
+            CREATE INDEX IF NOT EXISTS vehicles_year_of_production ON vehicles (year_of_production);
+            CREATE INDEX IF NOT EXISTS vehicles_manufacturer_id ON vehicles (manufacturer_id, model_id);
+            CREATE INDEX IF NOT EXISTS vehicles_last_seen_at ON vehicles (last_seen_at);
+            """
+        )
+
+        logger.debug(f"Vehicle store opened at: '{self.path}'")
+
+    def upsert(self, listings: Iterable[StoredListing], seen_at: Optional[float] = None) -> int:
+        """
+        Inserts new listings and updates existing ones (by token) in a single transaction.
+
+        Args:
+            listings (Iterable[StoredListing]): The listings to store (vehicle-data objects or raw vehicle data).
+            seen_at (Optional[float]): The time (epoch seconds) the listings were seen. Defaults to now.
+
+        Returns:
+            int: The number of listings stored (listings without a token are skipped).
+        """
+        seen_at = time.time() if seen_at is None else seen_at
+        rows = [row for row in (_create_row(listing, seen_at) for listing in listings) if row[0] is not None]
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"""
+                INSERT INTO vehicles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (token) DO UPDATE SET
+                    {", ".join(f"{column} = excluded.{column}" for column in _LISTING_COLUMNS)},
+                    data = excluded.data,
+                    last_seen_at = MAX(last_seen_at, excluded.last_seen_at)
+                """,
+                rows
+            )
+
+        logger.debug(f"Upserted {len(rows)} listings into the vehicle store")
+        return len(rows)
+
+    def get(self, token: str) -> Optional[StoredVehicle]:
+        """Return the stored listing of the given token, if it exists."""
+        rows = self._fetch("SELECT data, first_seen_at, last_seen_at FROM vehicles WHERE token = ?", (token,))
+        return _create_stored_vehicle(rows[0]) if rows else None
+
+    def get_tokens(self) -> List[str]:
+        """Return the tokens of all the stored listings."""
+        return [token for token, in self._fetch("SELECT token FROM vehicles")]
+
+    def get_snapshot(self, seen_since: Optional[float] = None) -> Snapshot:
+        """Return the state (update time and price) of each stored listing, to diff a crawl against."""
+        sql = "SELECT token, updated_at, price FROM vehicles"
+        params = ()
+
+        if seen_since is not None:
+            sql += " WHERE last_seen_at >= ?"
+            params = (seen_since,)
+
+        return {
+            token: ListingState(updated_at and datetime.fromisoformat(updated_at), price)
+            for token, updated_at, price in self._fetch(sql, params)
+        }
+
+    def find(
+            self,
+            price_range: Optional[NumberRange] = None,
+            year_range: Optional[NumberRange] = None,
+            manufacturer_id: Optional[int] = None,
+            model_id: Optional[int] = None,
+            seen_since: Optional[float] = None
+    ) -> Iterator[StoredVehicle]:
+        """
+        Iterates over the stored listings which match all the given (indexed) filters, ordered by price.
+
+        Args:
+            price_range (Optional[NumberRange]): The (inclusive) price range of the listings.
+            year_range (Optional[NumberRange]): The (inclusive) production year range of the listings.
+            manufacturer_id (Optional[int]): The manufacturer ID of the listings.
+            model_id (Optional[int]): The model ID of the listings.
+            seen_since (Optional[float]): The earliest time (epoch seconds) the listings were last seen.
+
+        Yields:
+            StoredVehicle: Each matching stored listing.
+        """
+        conditions, params = [], []
+
+        for column, value_range in (("price", price_range), ("year_of_production", year_range)):
+            if value_range is not None:
+                conditions.append(f"{column} BETWEEN ? AND ?")
+                params.extend((min(value_range), max(value_range)))
+
+        for column, value in (("manufacturer_id", manufacturer_id), ("model_id", model_id)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        if seen_since is not None:
+            conditions.append("last_seen_at >= ?")
+            params.append(seen_since)
+
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self._fetch(
+            f"SELECT data, first_seen_at, last_seen_at FROM vehicles {where_clause} ORDER BY price",
+            tuple(params)
+        )
+
+        for row in rows:
+            yield _create_stored_vehicle(row)
+
+    def delete(self, tokens: Iterable[str]) -> int:
+        """Delete the stored listings of the given tokens, and return the number of deleted listings."""
+        with self._lock, self._connection:
+            cursor = self._connection.executemany("DELETE FROM vehicles WHERE token = ?", ((t,) for t in tokens))
+            return cursor.rowcount
+
+    def close(self):
+        """Close the store database."""
+        with self._lock:
+            self._connection.close()
+
+        logger.debug(f"Vehicle store closed at: '{self.path}'")
+
+    def _fetch(self, sql: str, params: Tuple[Any, ...] = ()) -> List[tuple]:
+        """Execute a query and fetch all its rows."""
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def __contains__(self, token: str) -> bool:
+        return bool(self._fetch("SELECT 1 FROM vehicles WHERE token = ?", (token,)))
+
+    def __len__(self) -> int:
+        """Return the number of stored listings."""
+        return self._fetch("SELECT COUNT(*) FROM vehicles")[0][0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def _create_row(listing: StoredListing, seen_at: float) -> tuple:
+    """Create the table row of a listing."""
+    data = listing.data if isinstance(listing, VehicleData) else listing
+    record = VehicleRecord.from_data(data)
+    columns = [getattr(record, column) for column in _LISTING_COLUMNS]
+    columns[-1] = columns[-1] and columns[-1].isoformat()  # updated_at
+    return (record.token, *columns, dump_json(data).decode(), seen_at, seen_at)
+
+
+def _create_stored_vehicle(row: tuple) -> StoredVehicle:
+    data, first_seen_at, last_seen_at = row
+    return StoredVehicle(VehicleData(load_json(data)), first_seen_at, last_seen_at)
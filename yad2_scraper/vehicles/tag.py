@@ -1,18 +1,43 @@
 from functools import cached_property
 from bs4 import Tag
-from typing import Optional
+from typing import Optional, NamedTuple, Tuple, Callable
 
 from yad2_scraper.utils import join_url, find_html_tag_by_class_substring
+from yad2_scraper.class_index import ClassSubstringIndex
 from yad2_scraper.vehicles.urls import VEHICLES_URL
 
 YEAR_AND_HAND_TAG_SEPARATOR = " • "
 
 
+def parse_year(year_and_hand_string: str) -> int:
+    """Parse the year out of a 'year • hand' string."""
+    year, _ = year_and_hand_string.split(YEAR_AND_HAND_TAG_SEPARATOR)
+    return int(year)
+
+
+def parse_hand(year_and_hand_string: str) -> int:
+    """Parse the hand out of a 'year • hand' string."""
+    _, hand_string = year_and_hand_string.split(YEAR_AND_HAND_TAG_SEPARATOR)
+    _, hand = hand_string.split()
+    return int(hand)
+
+
+def parse_price(price_string: str) -> Optional[int]:
+    """Parse the price out of a 'price currency' string, returning None if the price is not mentioned."""
+    try:
+        price, _ = price_string.split()
+        return int(price.replace(",", ""))
+    except ValueError:
+        return None
+
+
 class VehicleTag:
     """Represents a vehicle listing on the webpage, providing access to various details"""
 
-    def __init__(self, tag: Tag):
+    def __init__(self, tag: Tag, class_index: Optional[ClassSubstringIndex] = None):
+        """Initialize with the tag of the listing, and optionally the class-substring index of its document."""
         self.tag = tag
+        self.class_index = class_index
 
     @cached_property
     def relative_link(self) -> str:
@@ -40,14 +65,11 @@ class VehicleTag:
 
     @property
     def year(self) -> int:
-        year, _ = self.year_and_hand_string.split(YEAR_AND_HAND_TAG_SEPARATOR)
-        return int(year)
+        return parse_year(self.year_and_hand_string)
 
     @property
     def hand(self) -> int:
-        _, hand_string = self.year_and_hand_string.split(YEAR_AND_HAND_TAG_SEPARATOR)
-        _, hand = hand_string.split()
-        return int(hand)
+        return parse_hand(self.year_and_hand_string)
 
     @cached_property
     def price_string(self) -> str:
@@ -55,11 +77,81 @@ class VehicleTag:
 
     @property
     def price(self) -> Optional[int]:
-        try:
-            price, _ = self.price_string.split()
-            return int(price.replace(",", ""))
-        except ValueError:
-            return None
+        return parse_price(self.price_string)
 
     def find_tag_by_class_substring(self, tag_name: str, substring: str) -> Tag:
+        if self.class_index is not None:
+            return self.class_index.find(tag_name, substring, within=self.tag)
         return find_html_tag_by_class_substring(self.tag, tag_name, substring)
+
+
+class VehicleTagRecord(NamedTuple):
+    """A lightweight record of a vehicle listing on the webpage, with all its fields extracted in one pass."""
+    relative_link: Optional[str]
+    image_url: Optional[str]
+    model: Optional[str]
+    marketing_text: Optional[str]
+    year_and_hand_string: Optional[str]
+    price_string: Optional[str]
+
+    @property
+    def page_link(self) -> str:
+        return join_url(VEHICLES_URL, self.relative_link)
+
+    @property
+    def year(self) -> int:
+        return parse_year(self.year_and_hand_string)
+
+    @property
+    def hand(self) -> int:
+        return parse_hand(self.year_and_hand_string)
+
+    @property
+    def price(self) -> Optional[int]:
+        return parse_price(self.price_string)
+
+    @classmethod
+    def from_tag(cls, tag: Tag) -> "VehicleTagRecord":
+        """
+        Create a record from the tag of a vehicle listing, walking its subtree once.
+
+        Like `VehicleTag`, each field is extracted from the first descendant matching its tag name and class substring
+        (None if there is no such descendant).
+        """
+        values = [None] * len(_TAG_FIELD_EXTRACTORS)
+        missing_count = len(values)
+
+        for element in tag.descendants:
+            if not isinstance(element, Tag):
+                continue
+
+            class_string = element.get("class")
+            if not class_string:
+                continue
+
+            class_string = " ".join(class_string) if isinstance(class_string, list) else class_string
+
+            for index, (tag_name, substring, extract) in enumerate(_TAG_FIELD_EXTRACTORS):
+                if values[index] is None and element.name == tag_name and substring in class_string:
+                    values[index] = extract(element)
+                    missing_count -= 1
+
+            if not missing_count:
+                break
+
+        return cls._make(values)
+
+
+def _get_text(tag: Tag) -> str:
+    return tag.text.strip()
+
+
+# the (tag name, class substring, value extractor) of each field, in the order of the record fields
+_TAG_FIELD_EXTRACTORS: Tuple[Tuple[str, str, Callable[[Tag], str]], ...] = (
+    ("a", "itemLink", lambda tag: tag["href"]),
+    ("img", "image", lambda tag: tag["src"]),
+    ("span", "heading", _get_text),
+    ("span", "marketingText", _get_text),
+    ("span", "yearAndHand", _get_text),
+    ("span", "price", _get_text)
+)